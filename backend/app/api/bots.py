@@ -1,21 +1,25 @@
-from fastapi import APIRouter
-from app.config import settings
+from fastapi import APIRouter, HTTPException, Request, Response
+from app.game_logic.bot_configs import bot_config_registry
 
 router = APIRouter()
 
 
 @router.get("/configs")
-async def get_bot_configs():
-    """Get all bot configurations"""
-    return settings.BOT_CONFIGS
+async def get_bot_configs(request: Request):
+    """Get all bot configurations (current version)"""
+    config_set = bot_config_registry.current
+    # Configs can change without a deploy, so clients revalidate instead of caching blindly
+    headers = {"ETag": config_set.etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == config_set.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=config_set.body, media_type="application/json", headers=headers)
 
 
 @router.get("/configs/{bot_name}")
 async def get_bot_config(bot_name: str):
     """Get specific bot configuration"""
-    config = settings.BOT_CONFIGS.get(bot_name)
+    config_set = bot_config_registry.current
+    config = config_set.config(bot_name)
     if not config:
-        return {"error": "Bot not found"}
-    return config
-
-
+        raise HTTPException(status_code=404, detail="Bot not found")
+    return {"version": config_set.version, "config": config.model_dump(by_alias=True, exclude_none=True)}
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Request, Response
+import hashlib
+import json
+from app.game_logic import CARD_CATALOGUE
+from app.game_logic.cards import CARD_FILES, card_image_urls
+
+router = APIRouter()
+
+# The catalogue is fixed for the lifetime of the process, so build the payload once.
+# "images" lists the built variants (webp, avif, thumb...) when there is an asset build.
+_CATALOGUE = [{**card._asdict(), "images": card_image_urls(CARD_FILES[card.id])} for card in CARD_CATALOGUE]
+_CATALOGUE_BODY = json.dumps({"cards": _CATALOGUE}, separators=(",", ":"))
+_CATALOGUE_ETAG = '"' + hashlib.sha256(_CATALOGUE_BODY.encode()).hexdigest()[:16] + '"'
+
+
+@router.get("/")
+async def get_card_catalogue(request: Request):
+    """Card catalogue - state updates reference cards by their id in this list"""
+    headers = {"ETag": _CATALOGUE_ETAG, "Cache-Control": "public, max-age=86400"}
+    if request.headers.get("if-none-match") == _CATALOGUE_ETAG:
+        return Response(status_code=304, headers=headers)
+    return Response(content=_CATALOGUE_BODY, media_type="application/json", headers=headers)
@@ -1,12 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
+from sqlalchemy import select, text
 from pydantic import BaseModel
 from typing import Optional
 import asyncio
 import time
 from app.database import get_db
+from app.models import Game
 from app.services import GameService
+from app.services.event_service import EventService
+from app.services.matchmaking_service import matchmaker
+from app.services.multiplayer_service import table_engine
+from app.services.turn_timer_service import arm_turn_timeout, clear_turn_timeout
+from app.websockets.game_ws import manager
+from app.websockets.state_codec import state_versions
 
 router = APIRouter()
 
@@ -23,6 +30,11 @@ class JoinGameRequest(BaseModel):
     walletAddress: Optional[str] = None
 
 
+class MoveRequest(BaseModel):
+    playerId: str
+    action: str  # draw, roll, stack, leave
+
+
 @router.post("/create")
 async def create_game(
     request: CreateGameRequest,
@@ -56,6 +68,8 @@ async def create_game(
                 is_daily_free=request.isDailyFree
             )
             print(f"✅ Game created successfully: {game_data.get('gameId', 'unknown')}")
+            if game_data.get("status") == "playing":
+                arm_turn_timeout(game_data["gameId"])
             return game_data
         except Exception as e:
             error_str = str(e)
@@ -73,6 +87,74 @@ async def create_game(
                 print(f"❌ Traceback: {traceback.format_exc()}")
                 raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/queue/{mode}")
+async def join_queue(
+    mode: str,
+    request: JoinGameRequest,
+    wait: float = Query(0, ge=0, le=30)
+):
+    """Queue for a pvp/multiplayer match; optionally wait up to `wait` seconds for it"""
+    try:
+        ticket = await matchmaker.enqueue(mode, request.playerName, request.walletAddress)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    await matchmaker.wait(ticket, wait)
+    return ticket.to_dict()
+
+
+@router.get("/queue/ticket/{ticket_id}")
+async def get_queue_ticket(
+    ticket_id: str,
+    wait: float = Query(0, ge=0, le=30)
+):
+    """Matchmaking ticket status (long-poll with `wait`)"""
+    ticket = matchmaker.get(ticket_id)
+    if not ticket:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    await matchmaker.wait(ticket, wait)
+    return ticket.to_dict()
+
+
+@router.delete("/queue/ticket/{ticket_id}")
+async def leave_queue(ticket_id: str):
+    """Leave the matchmaking queue"""
+    ticket = matchmaker.cancel(ticket_id)
+    if not ticket:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    return ticket.to_dict()
+
+
+@router.post("/{game_id}/join")
+async def join_game(
+    game_id: str,
+    request: JoinGameRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """Join a waiting pvp/multiplayer game by id"""
+    service = GameService(db)
+    try:
+        game_data = await service.join_game(game_id, request.playerName, request.walletAddress)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Game not found")
+    except PermissionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    await _publish_state(service, game_id)
+    return game_data
+
+
+
+@router.post("/{game_id}/move")
+async def table_move(game_id: str, request: MoveRequest):
+    """Play a move in a pvp/multiplayer game; the new state is pushed to every WebSocket client"""
+    try:
+        outcome = await table_engine.act(game_id, request.playerId, request.action)
+    except LookupError:
+        raise HTTPException(status_code=404, detail="Game not found")
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    await manager.publish_state(outcome["state"], game_id)
+    return outcome
+
 
 @router.get("/{game_id}")
 async def get_game(
@@ -89,6 +171,62 @@ async def get_game(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/{game_id}/delta")
+async def get_game_delta(
+    game_id: str,
+    since: Optional[int] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """Get only the state fields changed since version `since` (full state if unknown)"""
+    service = GameService(db)
+    try:
+        game_data = await service.get_game_data(game_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Game not found")
+    return state_versions.build_frame(game_id, game_data, since)
+
+
+@router.get("/{game_id}/events")
+async def get_game_events(
+    game_id: str,
+    after: int = 0,
+    limit: int = Query(500, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get the game's event log after seq `after`"""
+    result = await db.execute(select(Game.id).where(Game.id == game_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    service = EventService(db)
+    return await service.get_events(game_id, after_seq=after, limit=limit)
+
+
+@router.get("/{game_id}/replay")
+async def replay_game(
+    game_id: str,
+    seq: Optional[int] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """Rebuild the game state as of event `seq` (latest if omitted)"""
+    service = EventService(db)
+    replay = await service.replay(game_id, upto_seq=seq)
+    if not replay:
+        raise HTTPException(status_code=404, detail="No events recorded for this game")
+    return replay
+
+
+async def _publish_state(service: GameService, game_id: str, game_data: Optional[dict] = None):
+    """Push the new state to any WebSocket clients watching this game"""
+    if not manager.active_connections.get(game_id):
+        return
+    try:
+        if game_data is None:
+            game_data = await service.get_game_data(game_id)
+        await manager.publish_state(game_data, game_id)
+    except Exception as e:
+        print(f"⚠️ Failed to publish state for {game_id}: {e}")
+
+
 @router.post("/{game_id}/draw")
 async def draw_card(
     game_id: str,
@@ -112,34 +250,10 @@ async def draw_card(
         player = result.scalar_one()
         
         card = await service.draw_card(game_id, player.id)
-        return card.model_dump()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@router.post("/{game_id}/draw")
-async def draw_card(
-    game_id: str,
-    db: AsyncSession = Depends(get_db)
-):
-    """Draw a card for the player"""
-    service = GameService(db)
-    try:
-        # Get the player for this game
-        from sqlalchemy import select
-        result = await db.execute(
-            select(Player).where(Player.game_id == game_id, Player.is_ai == False)
-        )
-        player = result.scalar_one_or_none()
-        
-        if not player:
-            raise HTTPException(status_code=404, detail="Player not found")
-        
-        # Draw a card
-        card = await service.draw_card(game_id, player.id)
-        return card.model_dump()
+        arm_turn_timeout(game_id)
+        await _publish_state(service, game_id)
+        return card._asdict()
     except Exception as e:
-        print(f"❌ Draw card failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -204,6 +318,9 @@ async def roll_dice(
             )
             player_after = result_player_final.scalar_one()
         
+        arm_turn_timeout(game_id)
+        await _publish_state(service, game_id)
+
         return {
             "value": roll,
             "success": success,
@@ -251,6 +368,8 @@ async def stack_sats(
         
         # Get fresh game data AFTER bot completes its turn
         game_data = await service.get_game_data(game_id)
+        arm_turn_timeout(game_id)
+        await _publish_state(service, game_id, game_data)
         
         return {
             **game_data,
@@ -267,27 +386,10 @@ async def forfeit_game(
 ):
     """Forfeit the game"""
     try:
-        from sqlalchemy import select
-        from app.models import Game, Player
-        
-        result = await db.execute(
-            select(Game).where(Game.id == game_id)
-        )
-        game = result.scalar_one()
-        
-        # Find opponent
-        result = await db.execute(
-            select(Player).where(
-                Player.game_id == game_id,
-                Player.is_ai == True
-            )
-        )
-        opponent = result.scalar_one_or_none()
-        
-        game.status = "finished"
-        game.winner_id = opponent.id if opponent else None
-        
-        await db.commit()
+        service = GameService(db)
+        await service.forfeit(game_id)
+        clear_turn_timeout(game_id)
+        await _publish_state(service, game_id)
         
         return {"message": "Game forfeited"}
     except Exception as e:
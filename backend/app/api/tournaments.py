@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel
+from typing import Optional
+from app.database import get_db
+from app.game_logic.brackets import SINGLE_ELIMINATION
+from app.services.tournament_service import TournamentService
+
+router = APIRouter()
+
+
+class CreateTournamentRequest(BaseModel):
+    name: str
+    maxPlayers: int
+    bracketType: str = SINGLE_ELIMINATION
+    swissRounds: Optional[int] = None
+    entryFee: Optional[int] = None
+
+
+class JoinTournamentRequest(BaseModel):
+    playerName: str
+    walletAddress: Optional[str] = None
+
+
+class ReportMatchRequest(BaseModel):
+    winnerId: str  # Entrant id
+
+
+async def _call(action):
+    """Map service errors onto HTTP statuses"""
+    try:
+        return await action
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/")
+async def create_tournament(
+    request: CreateTournamentRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """Create a tournament (single_elimination, double_elimination or swiss)"""
+    return await _call(TournamentService(db).create_tournament(
+        request.name,
+        request.maxPlayers,
+        entry_fee=request.entryFee,
+        bracket_type=request.bracketType,
+        swiss_rounds=request.swissRounds
+    ))
+
+
+@router.post("/{tournament_id}/join")
+async def join_tournament(
+    tournament_id: str,
+    request: JoinTournamentRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """Register for a tournament"""
+    return await _call(TournamentService(db).join_tournament(
+        tournament_id, request.playerName, request.walletAddress
+    ))
+
+
+@router.post("/{tournament_id}/start")
+async def start_tournament(
+    tournament_id: str,
+    db: AsyncSession = Depends(get_db)
+):
+    """Build the bracket and start every first-round match"""
+    return await _call(TournamentService(db).start_tournament(tournament_id))
+
+
+@router.get("/{tournament_id}")
+async def get_tournament(
+    tournament_id: str,
+    db: AsyncSession = Depends(get_db)
+):
+    """Get tournament standings and bracket; match games are played via /api/game/{gameId}/move"""
+    return await _call(TournamentService(db).get_tournament_status(tournament_id))
+
+
+@router.post("/{tournament_id}/matches/{match_id}/report")
+async def report_match(
+    tournament_id: str,
+    match_id: str,
+    request: ReportMatchRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """Record a match result by hand (e.g. a no-show); played games report themselves"""
+    return await _call(TournamentService(db).advance_winner(tournament_id, match_id, request.winnerId))
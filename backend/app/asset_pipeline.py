@@ -0,0 +1,137 @@
+"""
+Asset Pipeline - content-hashed card images with WebP/AVIF variants and thumbnails
+
+Run from backend/ (Procfile and run.sh do this before starting the server):
+    python -m app.asset_pipeline
+
+Reads assets/cards/*.jpg and writes assets/build/cards/ plus
+assets/build/manifest.json. Every output file is named after a hash of its
+source image (and PIPELINE_VERSION), so a URL never changes content and can
+be cached forever; unchanged sources are skipped on rebuild. With Pillow
+installed each card also gets WebP and (where Pillow supports it) AVIF
+variants and a small thumbnail; without it only the hashed JPEG copies are
+written.
+
+At startup cards.py derives the card image URLs from the manifest and
+static_assets.py serves the build with immutable caching.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from typing import Dict, Optional
+
+try:
+    from PIL import Image, features
+except ImportError:  # Pillow is optional - the build is then hashed JPEG copies only
+    Image = None
+    features = None
+
+PIPELINE_VERSION = 1  # Bump when encoder settings change so every URL changes with them
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "assets")
+SOURCE_DIR = os.path.join(ASSETS_DIR, "cards")
+BUILD_DIR = os.path.join(ASSETS_DIR, "build")
+BUILD_CARDS_DIR = os.path.join(BUILD_DIR, "cards")
+MANIFEST_PATH = os.path.join(BUILD_DIR, "manifest.json")
+
+HASH_LENGTH = 12
+THUMBNAIL_SIZE = (256, 256)  # Bounding box; aspect ratio is kept
+WEBP_QUALITY = 80
+AVIF_QUALITY = 60
+THUMB_QUALITY = 75
+
+# Variant key -> media type, in the order a client's Accept header is matched
+VARIANT_TYPES = {"avif": "image/avif", "webp": "image/webp", "jpg": "image/jpeg"}
+
+
+def source_hash(data: bytes) -> str:
+    """Short content hash of a source image (plus the pipeline version)"""
+    return hashlib.sha256(data + b"v%d" % PIPELINE_VERSION).hexdigest()[:HASH_LENGTH]
+
+
+def _encoders() -> Dict[str, Dict]:
+    """Variants this Pillow build can write: key -> save() options"""
+    if Image is None:
+        return {}
+    encoders = {"webp": {"format": "WEBP", "quality": WEBP_QUALITY, "method": 6}}
+    if features.check("avif"):
+        encoders["avif"] = {"format": "AVIF", "quality": AVIF_QUALITY, "speed": 8}
+    return encoders
+
+
+def _write_variant(source_path: str, target_path: str, options: Dict, thumbnail: bool = False):
+    with Image.open(source_path) as image:
+        image = image.convert("RGB")
+        if thumbnail:
+            image.thumbnail(THUMBNAIL_SIZE)
+        image.save(target_path, **options)
+
+
+def build_card(filename: str, encoders: Dict[str, Dict]) -> Dict:
+    """Write one card's hashed files (skipping ones already built); returns its manifest entry"""
+    source_path = os.path.join(SOURCE_DIR, filename)
+    with open(source_path, "rb") as f:
+        digest = source_hash(f.read())
+    stem = os.path.splitext(filename)[0]
+
+    outputs = {"jpg": (f"{stem}.{digest}.jpg", None, False)}
+    for key, options in encoders.items():
+        outputs[key] = (f"{stem}.{digest}.{key}", options, False)
+    if Image is not None:
+        outputs["thumb"] = (f"{stem}.{digest}.thumb.jpg", {"format": "JPEG", "quality": THUMB_QUALITY}, True)
+        if "webp" in encoders:
+            outputs["thumb_webp"] = (f"{stem}.{digest}.thumb.webp", {**encoders["webp"], "quality": THUMB_QUALITY}, True)
+
+    for key, (name, options, thumbnail) in outputs.items():
+        target_path = os.path.join(BUILD_CARDS_DIR, name)
+        if os.path.exists(target_path):
+            continue
+        if options is None:
+            shutil.copyfile(source_path, target_path)
+        else:
+            _write_variant(source_path, target_path, options, thumbnail)
+
+    return {"hash": digest, **{key: name for key, (name, _, _) in outputs.items()}}
+
+
+def build_assets() -> Dict:
+    """Build every card image and write the manifest; stale outputs are removed"""
+    os.makedirs(BUILD_CARDS_DIR, exist_ok=True)
+    encoders = _encoders()
+    cards = {}
+    for filename in sorted(os.listdir(SOURCE_DIR)):
+        if filename.lower().endswith((".jpg", ".jpeg", ".png")):
+            cards[filename] = build_card(filename, encoders)
+
+    current = {name for entry in cards.values() for key, name in entry.items() if key != "hash"}
+    for name in os.listdir(BUILD_CARDS_DIR):
+        if name not in current:
+            os.remove(os.path.join(BUILD_CARDS_DIR, name))
+
+    manifest = {"version": PIPELINE_VERSION, "cards": cards}
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+    return manifest
+
+
+def load_manifest(path: str = MANIFEST_PATH) -> Optional[Dict]:
+    """The last build's manifest, or None if the pipeline hasn't been run"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Ignoring unreadable asset manifest {path}: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    manifest = build_assets()
+    formats = sorted({key for entry in manifest["cards"].values() for key in entry if key != "hash"})
+    print(f"Built {len(manifest['cards'])} cards ({', '.join(formats)}) into {BUILD_CARDS_DIR}")
+    print(f"Wrote {MANIFEST_PATH}")
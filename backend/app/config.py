@@ -6,6 +6,9 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite+aiosqlite:///./ape_in_game.db"  # Using SQLite for production due to asyncpg compatibility issues
     REDIS_URL: str = "redis://localhost:6379"
     SECRET_KEY: str = "dev-secret-key-change-in-production"
+    # Keys per-game RNG streams; rotating it changes the rest of running games' draws.
+    # Empty = generate one on first start and keep it in the database (secret_service.py)
+    GAME_RNG_SECRET: str = ""
     CORS_ORIGINS: str = "*"
     ENVIRONMENT: str = "development"  # Will be overridden by environment variable
     
@@ -15,7 +18,26 @@ class Settings(BaseSettings):
     # Game settings
     MAX_SCORE: int = 150
     MAX_ROUNDS: int = 10
-    TURN_TIMEOUT_SECONDS: int = 60
+    TURN_TIMEOUT_SECONDS: int = 60  # Idle turns are auto-stacked after this long (see turn_timer_service.py)
+    MAX_IDLE_TURNS: int = 3  # Timed-out turns in a row before the idle player forfeits
+    LOBBY_TIMEOUT_SECONDS: int = 120  # Matchmaking tickets expire after this long in the queue
+
+    # Stale-game reaper: open games idle longer than this many seconds are closed
+    # ("default" covers modes not listed), checked every REAPER_INTERVAL_SECONDS
+    STALE_GAME_SECONDS: Dict[str, int] = {"default": 3600, "pvp": 900, "multiplayer": 900, "tournament": 1800}
+    REAPER_INTERVAL_SECONDS: int = 60
+    REAPER_BATCH_SIZE: int = 200
+    SOCKET_IDLE_SECONDS: int = 1800  # WebSockets that send nothing (not even a ping) for this long are closed
+
+    # Bot config hot reload: JSON file of {"bots": {...}} in the BOT_CONFIGS shape below
+    # (empty = use BOT_CONFIGS). Workers publish changes as new versions in the database.
+    BOT_CONFIGS_PATH: str = ""
+    BOT_CONFIG_POLL_SECONDS: int = 15
+
+    # Public origin of this app (e.g. https://api.example.com). With an asset build
+    # (python -m app.asset_pipeline) card image URLs point here, at the hashed files
+    # under /assets/build. Empty = RENDER_EXTERNAL_URL, else the frontend's /assets/cards.
+    ASSET_BASE_URL: str = ""
     
     # Bot configurations
     BOT_CONFIGS: Dict[str, Dict] = {
@@ -27,6 +49,7 @@ class Settings(BaseSettings):
             "target_scores": [21],
             "risk": {"basePush": 0.10, "behindPush": 0.20, "behindGap": 50},
             "jitter": {"enabled": False, "pct": 0.0},
+            "policy": {"table": False, "level": "tutorial"},  # Solved decision table (policy_solver.py) instead of risk rules
             "diceModes": ["sandy"],
             "description": "Tutorial bot - Perfect for beginners!",
             "personality": "Friendly and encouraging"
@@ -39,6 +62,7 @@ class Settings(BaseSettings):
             "target_scores": [21, 26, 40],
             "risk": {"midMin": 21, "midMax": 39, "midPush": 0.50, "highStack": 40, "behindGap": 30, "behindPush": 0.60},
             "jitter": {"enabled": True, "pct": 0.10},
+            "policy": {"table": False, "level": "medium"},
             "diceModes": ["aida", "aida_aggressive"],
             "description": "Balanced strategy with smart plays",
             "personality": "Strategic and analytical"
@@ -51,6 +75,7 @@ class Settings(BaseSettings):
             "target_scores": [30],
             "risk": {"stackAt": 30, "stackBias": 0.70},
             "jitter": {"enabled": True, "pct": 0.10},
+            "policy": {"table": False, "level": "hard"},
             "diceModes": ["lana", "lana_aggressive"],
             "description": "Aggressive player who takes big risks",
             "personality": "Bold and daring"
@@ -64,6 +89,7 @@ class Settings(BaseSettings):
             "target_scores": [34, 42, 55],
             "risk": {"behindGap": 20, "stackAt": 50, "basePush": 0.75},
             "jitter": {"enabled": True, "pct": 0.10},
+            "policy": {"table": False, "level": "expert"},
             "diceModes": ["enj1n", "enj1n_aggressive"],
             "description": "Master player with unpredictable moves",
             "personality": "Calculated chaos"
@@ -77,6 +103,7 @@ class Settings(BaseSettings):
             "target_scores": [50],
             "risk": {"stackAt": 50, "behindGap": 20},
             "jitter": {"enabled": True, "pct": 0.10},
+            "policy": {"table": False, "level": "medium"},
             "diceModes": ["nifty", "nifty_aggressive"],
             "description": "Adaptable player who changes tactics",
             "personality": "Clever and unpredictable"
@@ -1,6 +1,6 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import text
+from sqlalchemy import text, inspect
 from app.config import settings
 
 # Create async engine with SQLite concurrency fixes
@@ -42,6 +42,59 @@ async def get_db():
             await session.close()
 
 
+def _add_missing_columns(sync_conn):
+    """create_all() never alters existing tables - add any new nullable model columns"""
+    inspector = inspect(sync_conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {col["name"] for col in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+            column_type = column.type.compile(dialect=sync_conn.dialect)
+            sync_conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+            print(f"✅ Added column {table.name}.{column.name}")
+
+
+def _add_missing_indexes(sync_conn):
+    """create_all() only creates indexes along with new tables - add new model indexes to existing ones"""
+    inspector = inspect(sync_conn)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(sync_conn)
+                print(f"✅ Added index {index.name}")
+
+
+def _backfill_compact_game_states(sync_conn):
+    """Copy legacy JSON game_state columns (used_bearish_flags, current_card) into
+    used_bearish_mask / current_card_id. Rows already migrated have a non-null mask."""
+    import json
+    from app.game_logic import bearish_mask_from_flags
+    from app.game_logic.cards import CARD_FILES
+
+    columns = {col["name"] for col in inspect(sync_conn).get_columns("game_states")}
+    if "used_bearish_flags" not in columns or "current_card" not in columns:
+        return
+    card_ids = {filename: card_id for card_id, filename in enumerate(CARD_FILES)}  # Legacy rows store unhashed URLs
+    rows = sync_conn.execute(text(
+        "SELECT id, used_bearish_flags, current_card FROM game_states WHERE used_bearish_mask IS NULL"
+    )).all()
+    for row in rows:
+        card = json.loads(row.current_card) if row.current_card else None
+        card_id = card_ids.get(card.get("image_url", "").rsplit("/", 1)[-1]) if card else None
+        sync_conn.execute(
+            text("UPDATE game_states SET used_bearish_mask = :mask, current_card_id = :card_id WHERE id = :id"),
+            {"mask": bearish_mask_from_flags(json.loads(row.used_bearish_flags or "[]")), "card_id": card_id, "id": row.id}
+        )
+    if rows:
+        print(f"✅ Migrated {len(rows)} game states to compact columns")
+
+
 async def init_db():
     """Initialize database tables"""
     try:
@@ -56,6 +109,9 @@ async def init_db():
             
             # Create tables
             await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(_add_missing_columns)
+            await conn.run_sync(_add_missing_indexes)
+            await conn.run_sync(_backfill_compact_game_states)
             print("✅ Database tables created successfully!")
             
     except Exception as e:
@@ -1,13 +1,34 @@
-from app.game_logic.cards import Card, draw_weighted_card, apply_ape_in_effect
+from app.game_logic.cards import (
+    Card,
+    CARD_CATALOGUE,
+    BEARISH_FLAG_BITS,
+    get_card,
+    get_card_id,
+    bearish_flags_from_mask,
+    bearish_mask_from_flags,
+    build_card_pool,
+    draw_weighted_card,
+    apply_ape_in_effect,
+)
 from app.game_logic.dice import roll_dice, check_bust, check_dodge_bearish
+from app.game_logic.rng import GameRng, stable_hash
 
 __all__ = [
     "Card",
+    "CARD_CATALOGUE",
+    "get_card",
+    "get_card_id",
+    "BEARISH_FLAG_BITS",
+    "bearish_flags_from_mask",
+    "bearish_mask_from_flags",
+    "build_card_pool",
     "draw_weighted_card",
     "apply_ape_in_effect",
     "roll_dice",
     "check_bust",
     "check_dodge_bearish",
+    "GameRng",
+    "stable_hash",
 ]
 
 
@@ -0,0 +1,146 @@
+"""
+Bot Configs - validated, versioned bot parameters
+
+Raw bot configs (settings.BOT_CONFIGS or the file at settings.BOT_CONFIGS_PATH)
+are validated into BotConfig objects and compiled into policies as one
+immutable BotConfigSet per version. The registry swaps the current set by a
+single reference assignment, so a request sees either the old or the new set,
+never a mix. Older sets stay available for games pinned to them.
+"""
+
+import hashlib
+import json
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.config import settings
+from app.game_logic.bot_policies import BotPolicy, compile_policies
+from app.game_logic.dice import DICE_PROFILES
+
+POLICY_LEVELS = ("expert", "hard", "medium", "easy", "tutorial")
+
+
+class _Params(BaseModel):
+    model_config = ConfigDict(extra="forbid", populate_by_name=True, frozen=True)
+
+
+class BotRisk(_Params):
+    """Risk thresholds; each bot reads the subset it uses, defaults live in its policy"""
+    base_push: Optional[float] = Field(None, alias="basePush", ge=0, le=1)
+    behind_push: Optional[float] = Field(None, alias="behindPush", ge=0, le=1)
+    behind_gap: Optional[int] = Field(None, alias="behindGap", ge=0)
+    mid_min: Optional[int] = Field(None, alias="midMin", ge=0)
+    mid_max: Optional[int] = Field(None, alias="midMax", ge=0)
+    mid_push: Optional[float] = Field(None, alias="midPush", ge=0, le=1)
+    high_stack: Optional[int] = Field(None, alias="highStack", ge=0)
+    stack_at: Optional[int] = Field(None, alias="stackAt", ge=0)
+    stack_bias: Optional[float] = Field(None, alias="stackBias", ge=0, le=1)
+
+
+class BotJitter(_Params):
+    enabled: bool = False
+    pct: float = Field(0.0, ge=0, le=1)
+
+
+class BotPolicySettings(_Params):
+    table: bool = False  # Solved decision table (policy_solver.py) instead of risk rules
+    level: str = "expert"
+
+    @field_validator("level")
+    @classmethod
+    def _known_level(cls, value: str) -> str:
+        if value not in POLICY_LEVELS:
+            raise ValueError(f"unknown policy level {value!r}")
+        return value
+
+
+class BotConfig(_Params):
+    name: str
+    difficulty: str = ""
+    winning_score: int = Field(settings.MAX_SCORE, gt=0)
+    max_rounds: int = Field(settings.MAX_ROUNDS, gt=0)
+    no_round_limit: bool = False
+    target_scores: List[int] = Field([21], min_length=1)
+    risk: BotRisk = BotRisk()
+    jitter: BotJitter = BotJitter()
+    policy: BotPolicySettings = BotPolicySettings()
+    dice_modes: List[str] = Field(default_factory=list, alias="diceModes")
+    description: str = ""
+    personality: str = ""
+
+    @field_validator("dice_modes")
+    @classmethod
+    def _known_dice(cls, value: List[str]) -> List[str]:
+        unknown = [mode for mode in value if mode not in DICE_PROFILES]
+        if unknown:
+            raise ValueError(f"unknown dice profiles {unknown}")
+        return value
+
+
+def validate_bot_configs(raw: Dict) -> Dict[str, BotConfig]:
+    """Validate a {bot: config} mapping; raises pydantic.ValidationError on bad input"""
+    return {ai_type: BotConfig.model_validate(config) for ai_type, config in raw.items()}
+
+
+def dump_bot_configs(configs: Dict[str, BotConfig]) -> Dict[str, Dict]:
+    """Back to the BOT_CONFIGS JSON shape"""
+    return {ai_type: config.model_dump(by_alias=True, exclude_none=True) for ai_type, config in configs.items()}
+
+
+def config_checksum(configs: Dict[str, BotConfig]) -> str:
+    """Content hash of a validated config mapping, independent of key order and formatting"""
+    canonical = json.dumps(dump_bot_configs(configs), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class BotConfigSet:
+    """One immutable config version: validated configs, compiled policies and the served payload"""
+
+    __slots__ = ("version", "checksum", "configs", "policies", "body", "etag")
+
+    def __init__(self, version: int, configs: Dict[str, BotConfig]):
+        self.version = version
+        self.checksum = config_checksum(configs)
+        self.configs = configs
+        self.policies: Dict[str, BotPolicy] = compile_policies(configs)
+        self.body = json.dumps(
+            {"version": version, "bots": dump_bot_configs(configs)}, separators=(",", ":")
+        )
+        self.etag = f'"{version}-{self.checksum[:16]}"'
+
+    def config(self, ai_type: str) -> Optional[BotConfig]:
+        return self.configs.get(ai_type)
+
+    def policy(self, ai_type: str) -> BotPolicy:
+        """Compiled policy, or a target-score bot for unknown types"""
+        policy = self.policies.get(ai_type)
+        if policy is None:
+            policy = self.policies[ai_type] = BotPolicy(ai_type, BotConfig(name=ai_type))
+        return policy
+
+
+class BotConfigRegistry:
+    """Process-wide config sets by version; `current` is what new games start on"""
+
+    def __init__(self, initial: BotConfigSet):
+        self._versions: Dict[int, BotConfigSet] = {initial.version: initial}
+        self.current = initial
+
+    def get(self, version: Optional[int] = None) -> Optional[BotConfigSet]:
+        """Set for a pinned version (None = current); None if this process has not loaded it"""
+        if version is None:
+            return self.current
+        return self._versions.get(version)
+
+    def install(self, config_set: BotConfigSet) -> bool:
+        """Register a version; it becomes current if it is the newest. Returns True on swap."""
+        self._versions[config_set.version] = config_set
+        if config_set.version > self.current.version:
+            self.current = config_set
+            return True
+        return False
+
+
+# Version 0 is the built-in settings.BOT_CONFIGS, used until the database has been synced
+bot_config_registry = BotConfigRegistry(BotConfigSet(0, validate_bot_configs(settings.BOT_CONFIGS)))
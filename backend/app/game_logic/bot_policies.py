@@ -0,0 +1,256 @@
+"""
+Bot Policies - bot configs compiled into typed decision objects
+
+Each bot's thresholds are read once from its validated BotConfig (see
+bot_configs.py) when a config version is loaded; a live decision is then plain
+attribute reads. GameService drives the draw/roll loop and asks the bot's policy
+whether to stack after every successful roll, so anything that plays a bot turn
+(live games, offline simulations) shares the same decision code.
+"""
+
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional
+
+from app.game_logic.rng import stable_hash
+from app.game_logic.policy_tables import POLICY_TABLES, PolicyTable
+
+if TYPE_CHECKING:
+    from app.game_logic.bot_configs import BotConfig
+
+# Extra push probability when the human leads by OPPONENT_NUDGE_GAP or more
+OPPONENT_NUDGE_GAP = 30
+OPPONENT_NUDGE = 0.08
+
+
+def _param(value, default):
+    return default if value is None else value
+
+
+class BotTurnState(NamedTuple):
+    """What a bot sees after a successful roll"""
+    turn_score: int
+    behind_by: int                 # human score - bot score
+    rounds_left: Optional[int]     # None = no round limit
+    used_bearish_mask: int
+    target_score: int              # target_scores pick for this turn
+    jitter: float = 1.0            # per-match factor from match_jitter()
+
+
+class BotAction(NamedTuple):
+    stack: bool
+    message: Optional[str] = None
+
+
+PUSH = BotAction(False)
+STACK = BotAction(True)
+
+
+class BotPolicy:
+    """Shared settings and helpers; the default decision stacks at the turn's target score"""
+
+    __slots__ = (
+        "ai_type", "name", "target_scores", "dice_modes", "dice_behind_gap",
+        "no_round_limit", "jitter_pct",
+    )
+
+    def __init__(self, ai_type: str, config: "BotConfig"):
+        self.ai_type = ai_type
+        self.name = config.name
+        self.target_scores: List[int] = list(config.target_scores)
+        self.dice_modes: List[str] = list(config.dice_modes) or [ai_type]
+        self.dice_behind_gap = _param(config.risk.behind_gap, 999)
+        self.no_round_limit = config.no_round_limit
+        self.jitter_pct = config.jitter.pct if config.jitter.enabled else 0.0
+
+    def rounds_left(self, max_rounds: int, current_round: int) -> Optional[int]:
+        return None if self.no_round_limit else max(0, max_rounds - current_round)
+
+    def match_jitter(self, game_id: str) -> float:
+        """Deterministic per-match multiplier from a stable hash of the game id"""
+        if not self.jitter_pct:
+            return 1.0
+        seed = stable_hash(game_id, self.ai_type) % 10000
+        rnd = (seed / 10000.0) * 2.0 - 1.0  # [-1, 1)
+        return 1.0 + self.jitter_pct * rnd
+
+    def pick_target(self, rng) -> int:
+        return rng.choice(self.target_scores)
+
+    def dice_profile(self, behind_by: int, rounds_left: Optional[int]) -> str:
+        """Switch to the aggressive profile when notably behind or low on rounds"""
+        if len(self.dice_modes) == 1:
+            return self.ai_type
+        if behind_by >= self.dice_behind_gap or (rounds_left is not None and rounds_left <= 2):
+            return self.dice_modes[-1]
+        return self.dice_modes[0]
+
+    @staticmethod
+    def scale_push(base_prob: float, behind_by: int, state: BotTurnState) -> float:
+        """Increase push probability when behind or low on rounds"""
+        if base_prob <= 0.0:
+            return 0.0
+        # every 25 sats behind adds ~5%
+        prob = base_prob + max(0, behind_by) * 0.002
+        # nearing the end adds up to +10%
+        if state.rounds_left is not None and state.rounds_left <= 3:
+            prob += max(0, (3 - state.rounds_left + 1)) * 0.03
+        return min(0.98, max(0.0, prob * state.jitter))
+
+    @staticmethod
+    def opponent_nudge(state: BotTurnState) -> float:
+        return OPPONENT_NUDGE if state.behind_by >= OPPONENT_NUDGE_GAP else 0.0
+
+    def decide(self, state: BotTurnState, rng) -> BotAction:
+        return STACK if state.turn_score >= state.target_score else PUSH
+
+
+class SandyPolicy(BotPolicy):
+    """Tutorial: stack at 21, with a small chance to push (bigger when far behind)"""
+
+    __slots__ = ("stack_at", "far_behind_gap")
+
+    def __init__(self, ai_type: str, config: "BotConfig"):
+        super().__init__(ai_type, config)
+        self.stack_at = 21
+        self.far_behind_gap = 50
+
+    def decide(self, state: BotTurnState, rng) -> BotAction:
+        if state.turn_score < self.stack_at:
+            return super().decide(state, rng)
+        behind_by = state.behind_by
+        if behind_by > self.far_behind_gap:
+            # 61.8% chance to continue when player is far ahead (golden ratio)
+            if rng.random() < 0.618:
+                return BotAction(False, f"Sandy takes a big risk to catch up! (61.8% chance, player ahead by {behind_by} sats)")
+            return BotAction(True, f"Sandy plays it safe despite being behind by {behind_by} sats")
+        # Normal tutorial logic - 10% chance to continue at 21
+        if rng.random() < 0.10:
+            return BotAction(False, "Sandy decides to push her luck! (10% chance)")
+        return BotAction(True, "Sandy plays it safe at 21 sats")
+
+
+class AidaPolicy(BotPolicy):
+    """Balanced: coin-flip pushes in the mid band, stacks high, chases when behind"""
+
+    __slots__ = ("mid_min", "mid_max", "mid_push", "high_stack", "behind_gap", "behind_push")
+
+    def __init__(self, ai_type: str, config: "BotConfig"):
+        super().__init__(ai_type, config)
+        risk = config.risk
+        self.mid_min = _param(risk.mid_min, 21)
+        self.mid_max = _param(risk.mid_max, 39)
+        self.mid_push = _param(risk.mid_push, 0.50)
+        self.high_stack = _param(risk.high_stack, 40)
+        self.behind_gap = _param(risk.behind_gap, 30)
+        self.behind_push = _param(risk.behind_push, 0.60)
+
+    def decide(self, state: BotTurnState, rng) -> BotAction:
+        behind_by = state.behind_by
+        ts = state.turn_score
+        nudge = self.opponent_nudge(state)
+        if behind_by > self.behind_gap:
+            if rng.random() < self.scale_push(self.behind_push + nudge, behind_by, state):
+                return BotAction(False, "Aida takes a calculated risk to catch up.")
+            return STACK
+        if ts >= self.high_stack:
+            return BotAction(True, f"Aida stacks at {self.high_stack}+.")
+        if self.mid_min <= ts <= self.mid_max:
+            if rng.random() < self.scale_push(self.mid_push + nudge, behind_by, state):
+                return BotAction(False, "Aida pushes with a balanced risk.")
+            return STACK
+        return PUSH
+
+
+class LanaPolicy(BotPolicy):
+    """Aggressive: leans towards stacking once past stackAt, less so when behind"""
+
+    __slots__ = ("stack_at", "stack_bias")
+
+    def __init__(self, ai_type: str, config: "BotConfig"):
+        super().__init__(ai_type, config)
+        self.stack_at = _param(config.risk.stack_at, 30)
+        self.stack_bias = _param(config.risk.stack_bias, 0.70)
+
+    def decide(self, state: BotTurnState, rng) -> BotAction:
+        if state.turn_score < self.stack_at:
+            return PUSH
+        if rng.random() < self.scale_push(self.stack_bias - 0.20, -state.behind_by, state):
+            return BotAction(True, f"Lana stacks at {self.stack_at}.")
+        return PUSH
+
+
+class EnJ1nPolicy(BotPolicy):
+    """Expert: banks early when behind, otherwise presses until stackAt"""
+
+    __slots__ = ("behind_gap", "stack_at", "base_push")
+
+    def __init__(self, ai_type: str, config: "BotConfig"):
+        super().__init__(ai_type, config)
+        self.behind_gap = _param(config.risk.behind_gap, 20)
+        self.stack_at = _param(config.risk.stack_at, 50)
+        self.base_push = _param(config.risk.base_push, 0.75)
+
+    def decide(self, state: BotTurnState, rng) -> BotAction:
+        if state.behind_by > self.behind_gap:
+            return BotAction(True, "En-J1n stacks aggressively to catch up.")
+        if state.turn_score >= self.stack_at:
+            return BotAction(True, f"En-J1n stacks at {self.stack_at}.")
+        if rng.random() < self.scale_push(self.base_push + self.opponent_nudge(state), state.behind_by, state):
+            return BotAction(False, "En-J1n keeps pressing the attack.")
+        return STACK
+
+
+class NiftyPolicy(BotPolicy):
+    """Adaptable: stacks at stackAt unless behind, then keeps going"""
+
+    __slots__ = ("stack_at", "behind_gap")
+
+    def __init__(self, ai_type: str, config: "BotConfig"):
+        super().__init__(ai_type, config)
+        self.stack_at = _param(config.risk.stack_at, 50)
+        self.behind_gap = _param(config.risk.behind_gap, 20)
+
+    def decide(self, state: BotTurnState, rng) -> BotAction:
+        if state.turn_score < self.stack_at:
+            return PUSH
+        if state.behind_by >= self.behind_gap:
+            return BotAction(False, "Nifty is behind—stays ultra aggressive over 50 sats.")
+        return BotAction(True, f"Nifty stacks at {self.stack_at}.")
+
+
+class TablePolicy(BotPolicy):
+    """Solved policy (policy_solver.py): O(1) lookup instead of the risk rules"""
+
+    __slots__ = ("table", "level")
+
+    def __init__(self, ai_type: str, config: "BotConfig", table: PolicyTable):
+        super().__init__(ai_type, config)
+        self.table = table
+        self.level = config.policy.level
+
+    def decide(self, state: BotTurnState, rng) -> BotAction:
+        p_stack = self.table.stack_probability(
+            self.level, state.turn_score, state.behind_by, state.rounds_left, state.used_bearish_mask
+        )
+        if rng.random() < p_stack:
+            return BotAction(True, f"{self.name} stacks at {state.turn_score} sats.")
+        return PUSH
+
+
+POLICY_CLASSES = {
+    "sandy": SandyPolicy,
+    "aida": AidaPolicy,
+    "lana": LanaPolicy,
+    "enj1n": EnJ1nPolicy,
+    "nifty": NiftyPolicy,
+}
+
+
+def compile_policy(ai_type: str, config: "BotConfig", tables: Dict[str, PolicyTable] = POLICY_TABLES) -> BotPolicy:
+    """Build the policy object for one validated bot config"""
+    if config.policy.table and ai_type in tables:
+        return TablePolicy(ai_type, config, tables[ai_type])
+    return POLICY_CLASSES.get(ai_type, BotPolicy)(ai_type, config)
+
+
+def compile_policies(configs: Dict[str, "BotConfig"]) -> Dict[str, BotPolicy]:
+    return {ai_type: compile_policy(ai_type, config) for ai_type, config in configs.items()}
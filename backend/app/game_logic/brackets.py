@@ -0,0 +1,284 @@
+"""
+Brackets - tournament structure for any number of entrants
+
+Single and double elimination brackets are generated up front as linked
+matches: each match names where its winner (and, in double elimination, its
+loser) goes. Reporting a result fills those slots, so the bracket advances one
+match at a time and a match becomes playable as soon as both its entrants are
+known, whatever the rest of its round is doing. Byes are ordinary slot values
+and resolve themselves.
+
+Swiss rounds are paired from the standings after each round completes.
+
+The functions here work on any objects with the BracketMatch attributes, so
+the service can run them directly on TournamentMatch rows.
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+BYE = "bye"
+
+SINGLE_ELIMINATION = "single_elimination"
+DOUBLE_ELIMINATION = "double_elimination"
+SWISS = "swiss"
+BRACKET_TYPES = (SINGLE_ELIMINATION, DOUBLE_ELIMINATION, SWISS)
+
+# TournamentMatch.bracket values
+WINNERS = "W"
+LOSERS = "L"
+GRAND_FINAL = "GF"
+SWISS_ROUND = "S"
+
+
+class BracketMatch:
+    """Match spec produced by the generators (same attributes as TournamentMatch)"""
+
+    def __init__(self, key: str, bracket: str, round_number: int, match_number: int,
+                 next_key: Optional[str] = None, next_slot: Optional[int] = None,
+                 loser_key: Optional[str] = None, loser_slot: Optional[int] = None):
+        self.key = key
+        self.bracket = bracket
+        self.round_number = round_number
+        self.match_number = match_number
+        self.player1_id: Optional[str] = None
+        self.player2_id: Optional[str] = None
+        self.winner_id: Optional[str] = None
+        self.loser_id: Optional[str] = None
+        self.status = "pending"  # pending, ready, in_progress, completed, void
+        self.next_key = next_key
+        self.next_slot = next_slot
+        self.loser_key = loser_key
+        self.loser_slot = loser_slot
+
+
+def seed_positions(size: int) -> List[int]:
+    """Standard seeding for a power-of-two bracket: 1 and 2 can only meet in the final"""
+    order = [1]
+    while len(order) < size:
+        total = 2 * len(order) + 1
+        order = [seed for s in order for seed in (s, total - s)]
+    return order
+
+
+def _bracket_size(count: int) -> int:
+    return 1 << max(1, math.ceil(math.log2(max(count, 2))))
+
+
+def _seed_first_round(matches: Dict[str, BracketMatch], entrant_ids: Sequence[str], size: int):
+    """Place seeds (entrant_ids in seed order) into winners round 1; missing seeds are byes"""
+    positions = seed_positions(size)
+    for i in range(size // 2):
+        match = matches[f"W1-{i + 1}"]
+        for slot, seed in enumerate(positions[2 * i:2 * i + 2]):
+            set_slot(match, slot, entrant_ids[seed - 1] if seed <= len(entrant_ids) else BYE)
+
+
+def single_elimination(entrant_ids: Sequence[str]) -> Dict[str, BracketMatch]:
+    size = _bracket_size(len(entrant_ids))
+    rounds = int(math.log2(size))
+    matches: Dict[str, BracketMatch] = {}
+    for r in range(1, rounds + 1):
+        for i in range(size >> r):
+            next_key = f"W{r + 1}-{i // 2 + 1}" if r < rounds else None
+            matches[f"W{r}-{i + 1}"] = BracketMatch(
+                f"W{r}-{i + 1}", WINNERS, r, i + 1, next_key, i % 2 if next_key else None
+            )
+    _seed_first_round(matches, entrant_ids, size)
+    return matches
+
+
+def double_elimination(entrant_ids: Sequence[str]) -> Dict[str, BracketMatch]:
+    """Winners bracket, losers bracket and a grand final with a reset match"""
+    size = _bracket_size(len(entrant_ids))
+    rounds = int(math.log2(size))
+    loser_rounds = 2 * (rounds - 1)
+    matches: Dict[str, BracketMatch] = {}
+
+    def loser_drop(r: int, i: int, count: int) -> Tuple[Optional[str], Optional[int]]:
+        """Where the loser of winners match (r, i) goes"""
+        if loser_rounds == 0:
+            return "GF-1", 1
+        if r == 1:
+            return f"L1-{i // 2 + 1}", i % 2
+        # Drop-in rounds take winners-bracket losers in reverse order to delay rematches
+        return f"L{2 * (r - 1)}-{count - i}", 1
+
+    for r in range(1, rounds + 1):
+        count = size >> r
+        for i in range(count):
+            next_key, next_slot = (f"W{r + 1}-{i // 2 + 1}", i % 2) if r < rounds else ("GF-1", 0)
+            loser_key, loser_slot = loser_drop(r, i, count)
+            matches[f"W{r}-{i + 1}"] = BracketMatch(
+                f"W{r}-{i + 1}", WINNERS, r, i + 1, next_key, next_slot, loser_key, loser_slot
+            )
+
+    for j in range(1, loser_rounds + 1):
+        count = size >> ((j + 1) // 2 + 1)
+        for i in range(count):
+            if j == loser_rounds:
+                next_key, next_slot = "GF-1", 1
+            elif j % 2 == 1:
+                # Odd rounds feed the drop-in round of the same size
+                next_key, next_slot = f"L{j + 1}-{i + 1}", 0
+            else:
+                next_key, next_slot = f"L{j + 1}-{i // 2 + 1}", i % 2
+            matches[f"L{j}-{i + 1}"] = BracketMatch(f"L{j}-{i + 1}", LOSERS, j, i + 1, next_key, next_slot)
+
+    # GF-2 is only played if the losers-bracket champion wins GF-1
+    matches["GF-1"] = BracketMatch("GF-1", GRAND_FINAL, 1, 1)
+    matches["GF-2"] = BracketMatch("GF-2", GRAND_FINAL, 2, 1)
+    _seed_first_round(matches, entrant_ids, size)
+    return matches
+
+
+def set_slot(match, slot: int, entrant_id: str):
+    if slot == 0:
+        match.player1_id = entrant_id
+    else:
+        match.player2_id = entrant_id
+    if match.player1_id is not None and match.player2_id is not None and match.status == "pending":
+        match.status = "ready"
+
+
+def report(matches: Dict[str, object], key: str, winner_id: str) -> List:
+    """Record a result and propagate it (and any byes it uncovers).
+    Returns every match whose state changed, in order."""
+    match = matches[key]
+    if match.status in ("completed", "void"):
+        raise ValueError("Match already decided")
+    if match.status not in ("ready", "in_progress"):
+        raise ValueError("Match is still waiting for its players")
+    if winner_id not in (match.player1_id, match.player2_id):
+        raise ValueError("Winner is not in this match")
+    changed = []
+    pending = [(match, winner_id)]
+    while pending:
+        match, winner = pending.pop(0)
+        loser = match.player2_id if winner == match.player1_id else match.player1_id
+        match.winner_id = winner
+        match.loser_id = loser
+        match.status = "completed"
+        changed.append(match)
+
+        if match.key == "GF-1":
+            reset = matches.get("GF-2")
+            if reset is not None:
+                if winner == match.player1_id:
+                    reset.status = "void"
+                else:
+                    set_slot(reset, 0, match.player1_id)
+                    set_slot(reset, 1, match.player2_id)
+                changed.append(reset)
+            continue
+
+        targets = [(match.next_key, match.next_slot, winner), (match.loser_key, match.loser_slot, loser)]
+        for target_key, slot, entrant in targets:
+            if not target_key:
+                continue
+            target = matches[target_key]
+            set_slot(target, slot, entrant)
+            changed.append(target)
+            auto = bye_winner(target)
+            if auto is not None:
+                pending.append((target, auto))
+    return changed
+
+
+def bye_winner(match) -> Optional[str]:
+    """Winner of a ready match that has a bye in it (BYE if both sides are byes)"""
+    if match.status != "ready":
+        return None
+    if match.player2_id == BYE:
+        return match.player1_id
+    if match.player1_id == BYE:
+        return match.player2_id
+    return None
+
+
+def resolve_byes(matches: Dict[str, object]) -> List:
+    """Auto-advance every ready bye match (call once after seeding)"""
+    changed = []
+    for match in list(matches.values()):
+        winner = bye_winner(match)
+        if winner is not None:
+            changed.extend(report(matches, match.key, winner))
+    return changed
+
+
+def is_playable(match) -> bool:
+    return match.status == "ready" and BYE not in (match.player1_id, match.player2_id)
+
+
+def champion(matches: Dict[str, object]) -> Optional[str]:
+    """Tournament winner once the final (or grand final) is decided"""
+    reset = matches.get("GF-2")
+    if reset is not None:
+        if reset.status == "completed":
+            return reset.winner_id
+        if reset.status == "void":
+            return matches["GF-1"].winner_id
+        return None
+    finals = [m for m in matches.values() if not m.next_key and m.bracket == WINNERS]
+    if len(finals) == 1 and finals[0].status == "completed":
+        return finals[0].winner_id
+    return None
+
+
+# Swiss
+
+def swiss_round_count(entrant_count: int) -> int:
+    return max(1, math.ceil(math.log2(max(entrant_count, 2))))
+
+
+def swiss_pairings(
+    standings: Sequence[str],
+    played: Set[frozenset],
+    had_bye: Set[str]
+) -> List[Tuple[str, str]]:
+    """Pair entrants (ranked best first) avoiding rematches where possible;
+    an odd entrant out gets a BYE - the lowest-ranked one without a bye so far"""
+    unpaired = list(standings)
+    bye = None
+    if len(unpaired) % 2 == 1:
+        bye = next((e for e in reversed(unpaired) if e not in had_bye), unpaired[-1])
+        unpaired.remove(bye)
+    pairs: List[Tuple[str, str]] = []
+    while unpaired:
+        first = unpaired.pop(0)
+        partner = next((e for e in unpaired if frozenset((first, e)) not in played), unpaired[0])
+        unpaired.remove(partner)
+        pairs.append((first, partner))
+    if bye is not None:
+        pairs.append((bye, BYE))
+    return pairs
+
+
+def swiss_standings(entrant_ids: Iterable[str], matches: Iterable) -> List[Tuple[str, int, int]]:
+    """(entrant, points, buchholz) best first; a win or bye is one point,
+    buchholz is the sum of opponents' points. Ties keep entrant_ids (seed) order."""
+    order = list(entrant_ids)
+    points: Dict[str, int] = {e: 0 for e in order}
+    opponents: Dict[str, List[str]] = {e: [] for e in order}
+    for match in matches:
+        if match.status != "completed":
+            continue
+        if match.winner_id in points:
+            points[match.winner_id] += 1
+        if BYE not in (match.player1_id, match.player2_id):
+            opponents[match.player1_id].append(match.player2_id)
+            opponents[match.player2_id].append(match.player1_id)
+    buchholz = {e: sum(points[o] for o in opponents[e]) for e in order}
+    ranked = sorted(order, key=lambda e: (-points[e], -buchholz[e], order.index(e)))
+    return [(e, points[e], buchholz[e]) for e in ranked]
+
+
+def swiss_round(round_number: int, pairs: Sequence[Tuple[str, str]]) -> Dict[str, BracketMatch]:
+    matches: Dict[str, BracketMatch] = {}
+    for i, (first, second) in enumerate(pairs):
+        key = f"S{round_number}-{i + 1}"
+        match = BracketMatch(key, SWISS_ROUND, round_number, i + 1)
+        set_slot(match, 0, first)
+        set_slot(match, 1, second)
+        matches[key] = match
+    return matches
@@ -1,10 +1,12 @@
 import random
 import os
-from typing import Dict, List
-from pydantic import BaseModel
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple
 
 
-class Card(BaseModel):
+class Card(NamedTuple):
+    """Immutable card record - one shared instance per card, looked up by id"""
+    id: int  # Stable catalogue index, used on the wire and in GameState
     name: str
     type: str  # Cipher, Oracle, Historacle, Bearish, Special
     value: int
@@ -12,80 +14,124 @@ class Card(BaseModel):
     penalty: str | None = None
 
 
-# Base URL for card images - served from frontend
+# Base URL for card images. With an asset build (python -m app.asset_pipeline)
+# and a public origin for this app, cards point at the hashed files it serves
+# under /assets/build with immutable caching; otherwise at the frontend host.
 from app.config import settings
-import os
+from app.asset_pipeline import load_manifest
+
+ASSET_MANIFEST = load_manifest()
+ASSET_BASE_URL = settings.ASSET_BASE_URL or os.getenv("RENDER_EXTERNAL_URL", "")
+USE_ASSET_BUILD = bool(ASSET_MANIFEST and ASSET_BASE_URL)
 
-# FORCE PRODUCTION URL - Render deployment fix - Tue Oct 21 15:00:00 ACDT 2025
-# Check if we're running locally first (most specific)
-if os.getenv("LOCAL") == "true":
+if USE_ASSET_BUILD:
+    CARD_BASE_URL = f"{ASSET_BASE_URL.rstrip('/')}/assets/build/cards"
+    print(f"🔧 Using hashed card assets: {CARD_BASE_URL}")
+elif os.getenv("LOCAL") == "true":
     CARD_BASE_URL = "http://localhost:3000/assets/cards"
     print(f"🔧 Using LOCAL development card URL: {CARD_BASE_URL}")
 else:
-    # FORCE PRODUCTION - Render is not detecting environment correctly
     CARD_BASE_URL = "https://ape-in-game.vercel.app/assets/cards"
-    print(f"🔧 FORCING production card URL: {CARD_BASE_URL}")
-    print(f"🔧 Environment detection: LOCAL={os.getenv('LOCAL')}, RENDER={os.getenv('RENDER')}, ENVIRONMENT={settings.ENVIRONMENT}, PORT={os.getenv('PORT')}")
-    print(f"🔧 FORCE DEPLOY TIMESTAMP: Tue Oct 21 15:00:00 ACDT 2025")
+    print(f"🔧 Using frontend card URL: {CARD_BASE_URL} (no asset build or ASSET_BASE_URL)")
+
+# Source file name (assets/cards) of each card, by id
+CARD_FILES: List[str] = []
+
+
+def card_image_urls(filename: str) -> Dict[str, str]:
+    """URLs of a card image's built variants (jpg, webp, avif, thumb, ...), or just its plain URL"""
+    entry = ASSET_MANIFEST["cards"].get(filename) if USE_ASSET_BUILD else None
+    if not entry:
+        return {"jpg": f"{CARD_BASE_URL}/{filename}"}
+    return {key: f"{CARD_BASE_URL}/{name}" for key, name in entry.items() if key != "hash"}
+
+
+# Stable card catalogue: a card's index is its id. Append only - never reorder
+# or remove entries, ids are stored in GameState and cached by clients.
+CARD_CATALOGUE: List[Card] = []
+
+
+def _card(name: str, type: str, value: int, filename: str, penalty: str | None = None) -> Card:
+    """Create a card and register it in the catalogue under the next id"""
+    card = Card(len(CARD_CATALOGUE), name, type, value, card_image_urls(filename)["jpg"], penalty)
+    CARD_CATALOGUE.append(card)
+    CARD_FILES.append(filename)
+    return card
+
 
 # Define all cards
 CIPHER_CARDS = [
-    Card(name="Abbie", type="Cipher", value=1, image_url=f"{CARD_BASE_URL}/Cipher_1pt_Abbie.jpg"),
-    Card(name="Alita", type="Cipher", value=1, image_url=f"{CARD_BASE_URL}/Cipher_1pt_Alita.jpg"),
-    Card(name="EnJ1n", type="Cipher", value=1, image_url=f"{CARD_BASE_URL}/Cipher_1pt_EnJ1n.jpg"),
-    Card(name="Jakey", type="Cipher", value=1, image_url=f"{CARD_BASE_URL}/Cipher_1pt_Jakey.jpg"),
-    Card(name="Ace", type="Cipher", value=2, image_url=f"{CARD_BASE_URL}/Cipher_2pt_Ace.jpg"),
-    Card(name="Beats", type="Cipher", value=2, image_url=f"{CARD_BASE_URL}/Cipher_2pt_Beats.jpg"),
-    Card(name="Dash", type="Cipher", value=2, image_url=f"{CARD_BASE_URL}/Cipher_2pt_Dash.jpg"),
-    Card(name="Ray", type="Cipher", value=2, image_url=f"{CARD_BASE_URL}/Cipher_2pt_Ray.jpg"),
-    Card(name="Jazzy", type="Cipher", value=3, image_url=f"{CARD_BASE_URL}/Cipher_3pt_Jazzy.jpg"),
-    Card(name="Meemo", type="Cipher", value=3, image_url=f"{CARD_BASE_URL}/Cipher_3pt_Meemo.jpg"),
-    Card(name="Sabrina", type="Cipher", value=3, image_url=f"{CARD_BASE_URL}/Cipher_3pt_Sabrina.jpg"),
-    Card(name="Thea", type="Cipher", value=3, image_url=f"{CARD_BASE_URL}/Cipher_3pt_Thea.jpg"),
-    Card(name="Nero", type="Cipher", value=5, image_url=f"{CARD_BASE_URL}/Cipher_5pt_Nero.jpg"),
-    Card(name="Saul", type="Cipher", value=5, image_url=f"{CARD_BASE_URL}/Cipher_5pt_Saul.jpg"),
-    Card(name="Somi", type="Cipher", value=5, image_url=f"{CARD_BASE_URL}/Cipher_5pt_Somi.jpg"),
-    Card(name="Wick", type="Cipher", value=5, image_url=f"{CARD_BASE_URL}/Cipher_5pt_Wick.jpg"),
-    Card(name="Sandy", type="Cipher", value=8, image_url=f"{CARD_BASE_URL}/Cipher_8pt_Sandy.jpg"),
-    Card(name="Tala", type="Cipher", value=8, image_url=f"{CARD_BASE_URL}/Cipher_8pt_Tala.jpg"),
-    Card(name="Tulip", type="Cipher", value=8, image_url=f"{CARD_BASE_URL}/Cipher_8pt_Tulip.jpg"),
-    Card(name="Zacky", type="Cipher", value=8, image_url=f"{CARD_BASE_URL}/Cipher_8pt_Zacky.jpg"),
+    _card(name="Abbie", type="Cipher", value=1, filename="Cipher_1pt_Abbie.jpg"),
+    _card(name="Alita", type="Cipher", value=1, filename="Cipher_1pt_Alita.jpg"),
+    _card(name="EnJ1n", type="Cipher", value=1, filename="Cipher_1pt_EnJ1n.jpg"),
+    _card(name="Jakey", type="Cipher", value=1, filename="Cipher_1pt_Jakey.jpg"),
+    _card(name="Ace", type="Cipher", value=2, filename="Cipher_2pt_Ace.jpg"),
+    _card(name="Beats", type="Cipher", value=2, filename="Cipher_2pt_Beats.jpg"),
+    _card(name="Dash", type="Cipher", value=2, filename="Cipher_2pt_Dash.jpg"),
+    _card(name="Ray", type="Cipher", value=2, filename="Cipher_2pt_Ray.jpg"),
+    _card(name="Jazzy", type="Cipher", value=3, filename="Cipher_3pt_Jazzy.jpg"),
+    _card(name="Meemo", type="Cipher", value=3, filename="Cipher_3pt_Meemo.jpg"),
+    _card(name="Sabrina", type="Cipher", value=3, filename="Cipher_3pt_Sabrina.jpg"),
+    _card(name="Thea", type="Cipher", value=3, filename="Cipher_3pt_Thea.jpg"),
+    _card(name="Nero", type="Cipher", value=5, filename="Cipher_5pt_Nero.jpg"),
+    _card(name="Saul", type="Cipher", value=5, filename="Cipher_5pt_Saul.jpg"),
+    _card(name="Somi", type="Cipher", value=5, filename="Cipher_5pt_Somi.jpg"),
+    _card(name="Wick", type="Cipher", value=5, filename="Cipher_5pt_Wick.jpg"),
+    _card(name="Sandy", type="Cipher", value=8, filename="Cipher_8pt_Sandy.jpg"),
+    _card(name="Tala", type="Cipher", value=8, filename="Cipher_8pt_Tala.jpg"),
+    _card(name="Tulip", type="Cipher", value=8, filename="Cipher_8pt_Tulip.jpg"),
+    _card(name="Zacky", type="Cipher", value=8, filename="Cipher_8pt_Zacky.jpg"),
 ]
 
 ORACLE_CARDS = [
-    Card(name="Aida 1", type="Oracle", value=13, image_url=f"{CARD_BASE_URL}/Oracle_Aida_1.jpg"),
-    Card(name="Aida 2", type="Oracle", value=13, image_url=f"{CARD_BASE_URL}/Oracle_Aida_2.jpg"),
-    Card(name="Aida 3", type="Oracle", value=13, image_url=f"{CARD_BASE_URL}/Oracle_Aida_3.jpg"),
-    Card(name="Lana 1", type="Oracle", value=13, image_url=f"{CARD_BASE_URL}/Oracle_Lana_1.jpg"),
-    Card(name="Lana 2", type="Oracle", value=13, image_url=f"{CARD_BASE_URL}/Oracle_Lana_2.jpg"),
-    Card(name="Lana 3", type="Oracle", value=13, image_url=f"{CARD_BASE_URL}/Oracle_Lana_3.jpg"),
-    Card(name="Nifty 1", type="Oracle", value=13, image_url=f"{CARD_BASE_URL}/Oracle_Nifty_1.jpg"),
-    Card(name="Nifty 2", type="Oracle", value=13, image_url=f"{CARD_BASE_URL}/Oracle_Nifty_2.jpg"),
-    Card(name="Nifty 3", type="Oracle", value=13, image_url=f"{CARD_BASE_URL}/Oracle_Nifty_3.jpg"),
-    Card(name="Sats 1", type="Oracle", value=13, image_url=f"{CARD_BASE_URL}/Oracle_Sats_1.jpg"),
-    Card(name="Sats 2", type="Oracle", value=13, image_url=f"{CARD_BASE_URL}/Oracle_Sats_2.jpg"),
-    Card(name="Sats 3", type="Oracle", value=13, image_url=f"{CARD_BASE_URL}/Oracle_Sats_3.jpg"),
+    _card(name="Aida 1", type="Oracle", value=13, filename="Oracle_Aida_1.jpg"),
+    _card(name="Aida 2", type="Oracle", value=13, filename="Oracle_Aida_2.jpg"),
+    _card(name="Aida 3", type="Oracle", value=13, filename="Oracle_Aida_3.jpg"),
+    _card(name="Lana 1", type="Oracle", value=13, filename="Oracle_Lana_1.jpg"),
+    _card(name="Lana 2", type="Oracle", value=13, filename="Oracle_Lana_2.jpg"),
+    _card(name="Lana 3", type="Oracle", value=13, filename="Oracle_Lana_3.jpg"),
+    _card(name="Nifty 1", type="Oracle", value=13, filename="Oracle_Nifty_1.jpg"),
+    _card(name="Nifty 2", type="Oracle", value=13, filename="Oracle_Nifty_2.jpg"),
+    _card(name="Nifty 3", type="Oracle", value=13, filename="Oracle_Nifty_3.jpg"),
+    _card(name="Sats 1", type="Oracle", value=13, filename="Oracle_Sats_1.jpg"),
+    _card(name="Sats 2", type="Oracle", value=13, filename="Oracle_Sats_2.jpg"),
+    _card(name="Sats 3", type="Oracle", value=13, filename="Oracle_Sats_3.jpg"),
 ]
 
 HISTORACLE_CARDS = [
-    Card(name="Sats", type="Historacle", value=21, image_url=f"{CARD_BASE_URL}/Historacle_1_Sats.jpg"),
-    Card(name="Fibonacci", type="Historacle", value=21, image_url=f"{CARD_BASE_URL}/Historacle_2_Fibonacci.jpg"),
-    Card(name="Gann", type="Historacle", value=21, image_url=f"{CARD_BASE_URL}/Historacle_3_Gann.jpg"),
-    Card(name="Dow", type="Historacle", value=21, image_url=f"{CARD_BASE_URL}/Historacle_4_Dow.jpg"),
-    Card(name="Elliott", type="Historacle", value=21, image_url=f"{CARD_BASE_URL}/Historacle_5_Elliott.jpg"),
+    _card(name="Sats", type="Historacle", value=21, filename="Historacle_1_Sats.jpg"),
+    _card(name="Fibonacci", type="Historacle", value=21, filename="Historacle_2_Fibonacci.jpg"),
+    _card(name="Gann", type="Historacle", value=21, filename="Historacle_3_Gann.jpg"),
+    _card(name="Dow", type="Historacle", value=21, filename="Historacle_4_Dow.jpg"),
+    _card(name="Elliott", type="Historacle", value=21, filename="Historacle_5_Elliott.jpg"),
 ]
 
 BEARISH_CARDS = [
-    Card(name="Bear Reset", type="Bearish", value=0, image_url=f"{CARD_BASE_URL}/Bear_Reset.jpg", penalty="Reset"),
-    Card(name="Bear Half", type="Bearish", value=0, image_url=f"{CARD_BASE_URL}/Bear_Half.jpg", penalty="Half"),
-    Card(name="Bear -10", type="Bearish", value=0, image_url=f"{CARD_BASE_URL}/Bear_Minus_10.jpg", penalty="Minus10"),
+    _card(name="Bear Reset", type="Bearish", value=0, filename="Bear_Reset.jpg", penalty="Reset"),
+    _card(name="Bear Half", type="Bearish", value=0, filename="Bear_Half.jpg", penalty="Half"),
+    _card(name="Bear -10", type="Bearish", value=0, filename="Bear_Minus_10.jpg", penalty="Minus10"),
 ]
 
 SPECIAL_CARDS = [
-    Card(name="Ape In!", type="Special", value=0, image_url=f"{CARD_BASE_URL}/Ape_In.jpg"),
-    Card(name="Ape In!", type="Special", value=0, image_url=f"{CARD_BASE_URL}/Ape_In_MAYC.jpg"),
+    _card(name="Ape In!", type="Special", value=0, filename="Ape_In.jpg"),
+    _card(name="Ape In!", type="Special", value=0, filename="Ape_In_MAYC.jpg"),
 ]
 
+
+def get_card(card_id: int | None) -> Card | None:
+    """Look up a card by its catalogue id"""
+    if card_id is None:
+        return None
+    return CARD_CATALOGUE[card_id]
+
+
+def get_card_id(card_data: Dict | None) -> int | None:
+    """Catalogue id of a serialized card dict (or None)"""
+    if not card_data:
+        return None
+    return card_data["id"]
+
+
 # Card weights for drawing
 CARD_WEIGHTS = {
     "Cipher_1pt": 6,
@@ -100,10 +146,27 @@ CARD_WEIGHTS = {
 }
 
 
-def draw_weighted_card(used_bearish_flags: List[str] = None, exclude_ape_in: bool = False, game_mode: str = "sandy") -> Card:
-    """Draw a weighted card from the deck"""
-    if used_bearish_flags is None:
-        used_bearish_flags = []
+# One bit per bearish penalty, stored in GameState.used_bearish_mask
+BEARISH_FLAG_BITS = {"Reset": 1, "Half": 2, "Minus10": 4}
+
+
+def bearish_flags_from_mask(mask: int | None) -> List[str]:
+    """Penalty names whose bits are set in mask"""
+    return [penalty for penalty, bit in BEARISH_FLAG_BITS.items() if (mask or 0) & bit]
+
+
+def bearish_mask_from_flags(flags: List[str] | None) -> int:
+    """Bitmask for a list of penalty names"""
+    mask = 0
+    for penalty in flags or []:
+        mask |= BEARISH_FLAG_BITS.get(penalty, 0)
+    return mask
+
+
+@lru_cache(maxsize=None)
+def build_card_pool(used_bearish_mask: int = 0, exclude_ape_in: bool = False, game_mode: str = "sandy") -> Tuple[Tuple[Card, ...], Tuple[int, ...]]:
+    """Cards and draw weights for a deck state (cached - cards are immutable)"""
+    used_bearish_flags = bearish_flags_from_mask(used_bearish_mask)
     
     # Filter available bearish cards
     available_bearish = [c for c in BEARISH_CARDS if c.penalty not in used_bearish_flags]
@@ -176,19 +239,18 @@ def draw_weighted_card(used_bearish_flags: List[str] = None, exclude_ape_in: boo
             all_cards.append(card)
             weights.append(CARD_WEIGHTS["Special"])
     
-    # Draw a card
-    return random.choices(all_cards, weights=weights, k=1)[0]
+    return tuple(all_cards), tuple(weights)
+
+
+def draw_weighted_card(used_bearish_mask: int = 0, exclude_ape_in: bool = False, game_mode: str = "sandy", rng: random.Random | None = None) -> Card:
+    """Draw a weighted card from the deck"""
+    all_cards, weights = build_card_pool(used_bearish_mask, exclude_ape_in, game_mode)
+    return (rng or random).choices(all_cards, weights=weights, k=1)[0]
 
 
 def apply_ape_in_effect(card: Card) -> Card:
     """Double the card value (Ape In! effect)"""
     if card.type in ["Cipher", "Oracle", "Historacle"]:
-        return Card(
-            name=card.name,
-            type=card.type,
-            value=card.value * 2,
-            image_url=card.image_url,
-            penalty=card.penalty
-        )
+        return card._replace(value=card.value * 2)
     return card
 
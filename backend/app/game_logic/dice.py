@@ -18,7 +18,7 @@ DICE_PROFILES: Dict[str, Dict[int, float]] = {
 }
 
 
-def roll_dice(profile: str = "balanced") -> int:
+def roll_dice(profile: str = "balanced", rng: random.Random | None = None) -> int:
     """Roll a die using the specified profile's weights"""
     weights = DICE_PROFILES.get(profile, DICE_PROFILES["balanced"])
     
@@ -26,7 +26,7 @@ def roll_dice(profile: str = "balanced") -> int:
     choices = list(weights.keys())
     weight_values = list(weights.values())
     
-    return random.choices(choices, weights=weight_values, k=1)[0]
+    return (rng or random).choices(choices, weights=weight_values, k=1)[0]
 
 
 def check_bust(roll: int) -> bool:
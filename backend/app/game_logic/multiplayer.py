@@ -0,0 +1,297 @@
+"""
+Multiplayer - N-player table rules (pvp and multiplayer modes, up to 6 seats)
+
+Pure in-memory state: TableGame applies draw/roll/stack/leave moves, rotates
+turns, and queues game_events payloads (same shapes as replay.py) for the
+service to persist. Card, dice and penalty rules match GameService.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from app.game_logic.cards import BEARISH_FLAG_BITS, get_card, draw_weighted_card
+from app.game_logic.dice import roll_dice, check_bust, check_dodge_bearish
+from app.game_logic.rng import GameRng
+
+MAX_SEATS = 6
+TABLE_DICE = "balanced"
+
+Event = Tuple[str, Optional[str], Dict]
+
+
+class Seat:
+    __slots__ = ("player_id", "name", "wallet_address", "score", "turn_score", "active")
+
+    def __init__(self, player_id: str, name: str, wallet_address: Optional[str] = None,
+                 score: int = 0, turn_score: int = 0, active: bool = True):
+        self.player_id = player_id
+        self.name = name
+        self.wallet_address = wallet_address
+        self.score = score
+        self.turn_score = turn_score
+        self.active = active
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.player_id,
+            "name": self.name,
+            "score": self.score,
+            "turnScore": self.turn_score,
+            "active": self.active,
+        }
+
+
+class TableGame:
+    """Live state of one pvp/multiplayer game"""
+
+    def __init__(self, game_id: str, mode: str, seats: List[Seat], winning_score: int, max_rounds: int,
+                 rng: GameRng, status: str = "playing", current_round: int = 1, turn_index: int = 0,
+                 used_bearish_mask: int = 0, current_card_id: Optional[int] = None,
+                 ape_in_active: bool = False, last_roll: Optional[int] = None, winner_id: Optional[str] = None):
+        self.game_id = game_id
+        self.mode = mode
+        self.seats = seats
+        self.winning_score = winning_score
+        self.max_rounds = max_rounds
+        self.rng = rng
+        self.status = status
+        self.current_round = current_round
+        self.turn_index = turn_index
+        self.used_bearish_mask = used_bearish_mask  # Shared by every seat
+        self.current_card_id = current_card_id
+        self.ape_in_active = ape_in_active
+        self.last_roll = last_roll
+        self.winner_id = winner_id
+        self.events: List[Event] = []  # Not yet persisted
+        self.idle_turns: Dict[str, int] = {}  # Timed-out turns in a row per seat
+
+    @classmethod
+    def from_rows(cls, game, players: List, state) -> "TableGame":
+        """Rebuild from ORM rows; players in seat (join) order"""
+        seats = [
+            Seat(p.id, p.name, p.wallet_address, p.score or 0, p.turn_score or 0, p.is_active is not False)
+            for p in players
+        ]
+        turn_index = next((i for i, seat in enumerate(seats) if seat.player_id == state.current_player_id), 0)
+        return cls(
+            game.id, game.mode, seats, game.winning_score, game.max_rounds,
+            GameRng(game.id, state.rng_counter or 0),
+            status=game.status,
+            current_round=game.current_round,
+            turn_index=turn_index,
+            used_bearish_mask=state.used_bearish_mask or 0,
+            current_card_id=state.current_card_id,
+            ape_in_active=bool(state.ape_in_active),
+            last_roll=state.last_roll,
+            winner_id=game.winner_id,
+        )
+
+    # Queries
+
+    @property
+    def current_seat(self) -> Seat:
+        return self.seats[self.turn_index]
+
+    def seat(self, player_id: str) -> Seat:
+        for seat in self.seats:
+            if seat.player_id == player_id:
+                return seat
+        raise ValueError("Player is not in this game")
+
+    def view(self) -> Dict:
+        """Client state; same top-level keys as GameService.get_game_data plus the seat list"""
+        card = get_card(self.current_card_id)
+        winner = next((s.name for s in self.seats if s.player_id == self.winner_id), None)
+        return {
+            "gameId": self.game_id,
+            "mode": self.mode,
+            "status": self.status,
+            "players": [seat.to_dict() for seat in self.seats],
+            "currentPlayerId": self.current_seat.player_id if self.seats else None,
+            "currentCard": card._asdict() if card else None,
+            "lastRoll": self.last_roll,
+            "roundCount": self.current_round,
+            "maxRounds": self.max_rounds,
+            "unlimitedRounds": False,
+            "winningScore": self.winning_score,
+            "gameStatus": self.status,
+            "winner": winner,
+            "apeInActive": self.ape_in_active,
+        }
+
+    # Moves
+
+    def apply(self, player_id: str, action: str) -> Dict:
+        """Apply one move for player_id; raises ValueError for illegal moves"""
+        if action == "leave":
+            return self.leave(player_id)
+        if self.status != "playing":
+            raise ValueError("Game is not in progress")
+        if self.current_seat.player_id != player_id:
+            raise ValueError("Not your turn")
+        self.idle_turns.pop(player_id, None)
+        if action == "draw":
+            return self.draw()
+        if action == "roll":
+            return self.roll()
+        if action == "stack":
+            return self.stack()
+        raise ValueError(f"Unknown action {action}")
+
+    def draw(self) -> Dict:
+        seat = self.current_seat
+        last_card = get_card(self.current_card_id)
+        last_card_was_ape_in = last_card is not None and last_card.name == "Ape In!"
+        if last_card is not None and not last_card_was_ape_in:
+            raise ValueError("Roll for the current card first")
+
+        card = draw_weighted_card(self.used_bearish_mask, exclude_ape_in=last_card_was_ape_in,
+                                  game_mode=self.mode, rng=self.rng)
+        self.current_card_id = card.id
+        if card.name == "Ape In!":
+            self.ape_in_active = True
+        self.events.append(("draw", seat.player_id, {"card": card.id, "apeIn": self.ape_in_active}))
+        return {"action": "draw", "card": card._asdict()}
+
+    def roll(self) -> Dict:
+        seat = self.current_seat
+        card = get_card(self.current_card_id)
+        if card is None or card.name == "Ape In!":
+            raise ValueError("Draw a card first")
+
+        roll = roll_dice(TABLE_DICE, rng=self.rng)
+        self.last_roll = roll
+        was_ape_in_active = self.ape_in_active
+
+        if card.type == "Bearish":
+            ok = check_dodge_bearish(roll)
+            self.current_card_id = None
+            if ok and self.ape_in_active:
+                # Ape In! absorbs the dodge; the bearish flag stays unused so the card can come up again
+                self.ape_in_active = False
+            else:
+                self.used_bearish_mask |= BEARISH_FLAG_BITS[card.penalty]
+                if not ok:
+                    if card.penalty == "Reset":
+                        seat.score = 0
+                    elif card.penalty == "Half":
+                        seat.score = seat.score // 2
+                    elif card.penalty == "Minus10":
+                        seat.score = max(0, seat.score - 10)
+                    seat.turn_score = 0
+            message = "Dodged bearish!" if ok else f"Hit by {card.penalty}!"
+            if was_ape_in_active:
+                message += " (Ape In! negated)"
+            self._log_roll(seat, card, roll, ok)
+        elif check_bust(roll):
+            ok = False
+            seat.turn_score = 0
+            self.current_card_id = None
+            self.ape_in_active = False
+            message = "Busted!"
+            self._log_roll(seat, card, roll, ok)
+        else:
+            ok = True
+            value = card.value * 2 if self.ape_in_active else card.value
+            self.ape_in_active = False
+            seat.turn_score += value
+            self.current_card_id = None
+            message = f"Added {value} sats to turn score!"
+            self._log_roll(seat, card, roll, ok)
+
+        if not ok:
+            # A bust or penalty ends the turn with nothing banked
+            self.stack()
+        return {"action": "roll", "value": roll, "success": ok, "message": message}
+
+    def stack(self) -> Dict:
+        seat = self.current_seat
+        seat.score += seat.turn_score
+        seat.turn_score = 0
+        if seat.score >= self.winning_score:
+            self._finish(seat.player_id)
+        else:
+            self._advance_turn()
+        self.events.append(("stack", seat.player_id, {
+            "score": seat.score,
+            "round": self.current_round,
+            "status": self.status,
+            "winner": self.winner_id,
+        }))
+        return {"action": "stack", "score": seat.score}
+
+    def leave(self, player_id: str) -> Dict:
+        seat = self.seat(player_id)
+        if not seat.active or self.status == "finished":
+            return {"action": "leave"}
+        seat.active = False
+        seat.turn_score = 0
+        active = [s for s in self.seats if s.active]
+        if len(active) <= 1:
+            self._finish(active[0].player_id if active else None)
+        elif self.current_seat is seat:
+            self.current_card_id = None
+            self.ape_in_active = False
+            self._advance_turn()
+        self.events.append(("forfeit", player_id, {"status": self.status, "winner": self.winner_id}))
+        return {"action": "leave"}
+
+    def time_out(self, player_id: str, max_idle_turns: int) -> Dict:
+        """Idle turn: drop any card on the table and stack; max_idle_turns in a row forfeits the seat"""
+        if self.status != "playing" or self.current_seat.player_id != player_id:
+            raise ValueError("Not this player's turn")
+        idle = self.idle_turns[player_id] = self.idle_turns.get(player_id, 0) + 1
+        if idle >= max_idle_turns:
+            return self.leave(player_id)
+        self.current_card_id = None
+        self.ape_in_active = False
+        self.events.append(("timeout", player_id, {"idle": idle}))
+        return self.stack()
+
+    def abandon(self) -> Dict:
+        """Close a stale game: the active leader on points wins"""
+        if self.status == "finished":
+            return {"action": "abandon"}
+        leader = max((s for s in self.seats if s.active), key=lambda s: s.score, default=None)
+        self._finish(leader.player_id if leader else None)
+        self.events.append(("forfeit", None, {"status": self.status, "winner": self.winner_id}))
+        return {"action": "abandon"}
+
+    # Helpers
+
+    def _log_roll(self, seat: Seat, card, roll: int, ok: bool):
+        self.events.append(("roll", seat.player_id, {
+            "card": card.id,
+            "roll": roll,
+            "ok": ok,
+            "turn": seat.turn_score,
+            "apeIn": self.ape_in_active,
+            "keep": self.current_card_id is not None,
+        }))
+        if card.type == "Bearish":
+            self.events.append(("penalty", seat.player_id, {
+                "penalty": card.penalty,
+                "dodged": ok,
+                "score": seat.score,
+                "mask": self.used_bearish_mask,
+            }))
+
+    def _advance_turn(self):
+        """Next active seat; wrapping past the first seat starts a new round"""
+        count = len(self.seats)
+        index = self.turn_index
+        for _ in range(count):
+            index = (index + 1) % count
+            if index == 0:
+                self.current_round += 1
+            if self.seats[index].active:
+                break
+        self.turn_index = index
+        if self.current_round > self.max_rounds:
+            leader = max((s for s in self.seats if s.active), key=lambda s: s.score, default=None)
+            self._finish(leader.player_id if leader else None)
+
+    def _finish(self, winner_id: Optional[str]):
+        self.status = "finished"
+        self.winner_id = winner_id
+        self.current_card_id = None
+        self.ape_in_active = False
@@ -0,0 +1,259 @@
+"""
+Policy Solver - offline dynamic program for bot push/stack decisions
+
+Run from backend/:
+    python -m app.game_logic.policy_solver
+
+Writes app/game_logic/data/policy_tables.json, which policy_tables.py loads at
+startup so a live bot decision is a single table lookup.
+
+Model, per bot:
+- The bot decides on (turn_score, gap, rounds_left, used bearish mask) where
+  gap = human score - bot score. Ape In! is resolved inside a draw (the bot never
+  decides while it is active), including its doubling and bearish negation.
+- Card and dice odds come straight from build_card_pool() and DICE_PROFILES.
+- The human is modelled as stacking at OPPONENT_STACK_AT with balanced dice.
+- The bot maximises the probability of leading after its last turn. Early
+  finishes at winning_score are not modelled; Half and Reset cost a fixed share
+  of the winning score. Bots without a round limit use the ROUNDS_MAX row.
+
+For every (level, rounds_left, gap bucket, mask) the table stores a band
+[lo, hi) of turn scores: below lo the bot pushes, from hi it stacks, and in
+between it stacks with linearly rising probability. A level's tolerance is the
+win probability the bot may give up per decision, so difficulty is measured
+rather than guessed; "expert" (tolerance 0) is the optimal policy.
+"""
+
+import base64
+import json
+import os
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from app.config import settings
+from app.game_logic.cards import BEARISH_FLAG_BITS, build_card_pool
+from app.game_logic.dice import DICE_PROFILES
+
+TABLE_VERSION = 1
+ROUNDS_MAX = 20
+GAP_MAX = 150
+GAP_STEP = 10
+GAP_BUCKETS = 2 * GAP_MAX // GAP_STEP + 1
+TURN_MAX = 100
+MASKS = 1 << len(BEARISH_FLAG_BITS)
+MAX_CARD_GAIN = 2 * 21  # Doubled Historacle
+
+OPPONENT_STACK_AT = 20
+OPPONENT_DICE = "balanced"
+
+# Win probability a bot may give up per decision at each difficulty level
+LEVELS: Dict[str, float] = {
+    "expert": 0.0,
+    "hard": 0.005,
+    "medium": 0.015,
+    "easy": 0.04,
+    "tutorial": 0.08,
+}
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "policy_tables.json")
+
+Outcomes = List[Tuple[Tuple[str, int], float]]
+
+
+def dice_odds(profile: str) -> Tuple[float, float]:
+    """(P(bust), P(even)) for a dice profile"""
+    weights = DICE_PROFILES.get(profile, DICE_PROFILES["balanced"])
+    total = sum(weights.values())
+    even = sum(w for face, w in weights.items() if face % 2 == 0)
+    return weights[1] / total, even / total
+
+
+def card_odds(mask: int, exclude_ape_in: bool, game_mode: str) -> List[Tuple[str, int, float]]:
+    """Draw odds grouped by effect: ("ape", 0), ("bear", bit) or ("value", points)"""
+    cards, weights = build_card_pool(mask, exclude_ape_in, game_mode)
+    total = sum(weights)
+    odds: Dict[Tuple[str, int], float] = defaultdict(float)
+    for card, weight in zip(cards, weights):
+        if card.type == "Special":
+            key = ("ape", 0)
+        elif card.type == "Bearish":
+            key = ("bear", BEARISH_FLAG_BITS[card.penalty])
+        else:
+            key = ("value", card.value)
+        odds[key] += weight / total
+    return [(kind, arg, p) for (kind, arg), p in odds.items()]
+
+
+def push_outcomes(mask: int, game_mode: str, dice_profile: str) -> Outcomes:
+    """Outcomes of one draw+roll, mirroring GameService.roll_dice_action:
+    ("gain", v), ("bust", 0), ("penalty", bit), ("dodge", bit) - dodged, flag used,
+    ("stay", 0) - Ape In! negated by a dodge, card and flags unchanged"""
+    bust, even = dice_odds(dice_profile)
+    outcomes: Dict[Tuple[str, int], float] = defaultdict(float)
+
+    def resolve(kind: str, arg: int, p: float, ape_in: bool):
+        if kind == "bear":
+            outcomes[("stay", 0) if ape_in else ("dodge", arg)] += p * even
+            outcomes[("penalty", arg)] += p * (1 - even)
+        else:
+            outcomes[("gain", arg * 2 if ape_in else arg)] += p * (1 - bust)
+            outcomes[("bust", 0)] += p * bust
+
+    for kind, arg, p in card_odds(mask, False, game_mode):
+        if kind == "ape":
+            # Ape In! - draw again (no consecutive Ape In!) with the effect active
+            for kind2, arg2, p2 in card_odds(mask, True, game_mode):
+                resolve(kind2, arg2, p * p2, True)
+        else:
+            resolve(kind, arg, p, False)
+    return list(outcomes.items())
+
+
+def opponent_gains(outcomes: Outcomes, penalty_cost: Dict[int, int]) -> Dict[int, float]:
+    """Distribution of the human's gap change over one turn (stack-at-threshold player)"""
+    stay = sum(p for (kind, _), p in outcomes if kind in ("stay", "dodge"))
+    mass = [0.0] * (OPPONENT_STACK_AT + MAX_CARD_GAIN + 1)
+    mass[0] = 1.0
+    gains: Dict[int, float] = defaultdict(float)
+    for t, p_t in enumerate(mass):
+        if not p_t:
+            continue
+        if t >= OPPONENT_STACK_AT:
+            gains[t] += p_t
+            continue
+        # Dodges keep the turn score, so fold them in geometrically
+        scale = p_t / (1 - stay)
+        for (kind, arg), p in outcomes:
+            if kind == "gain":
+                mass[t + arg] += scale * p
+            elif kind == "bust":
+                gains[0] += scale * p
+            elif kind == "penalty":
+                gains[-penalty_cost[arg]] += scale * p
+    return gains
+
+
+class BotSolver:
+    """Backward induction over rounds_left for one bot's deck, dice and scores"""
+
+    def __init__(self, game_mode: str, dice_profile: str, winning_score: int):
+        self.game_mode = game_mode
+        self.penalty_cost = {
+            BEARISH_FLAG_BITS["Reset"]: winning_score // 2,
+            BEARISH_FLAG_BITS["Half"]: winning_score // 4,
+            BEARISH_FLAG_BITS["Minus10"]: 10,
+        }
+        self.bot_outcomes = [push_outcomes(m, game_mode, dice_profile) for m in range(MASKS)]
+        opponent_outcomes = [push_outcomes(m, game_mode, OPPONENT_DICE) for m in range(MASKS)]
+        self.opponent = [list(opponent_gains(o, self.penalty_cost).items()) for o in opponent_outcomes]
+        # Dense gap range reachable after a bot turn
+        self.gap_lo = -(GAP_MAX + TURN_MAX + MAX_CARD_GAIN + 1)
+        self.gap_hi = GAP_MAX + max(self.penalty_cost.values()) + 1
+        # Masks with more flags set first: a dodge only ever adds flags
+        self.mask_order = sorted(range(MASKS), key=lambda m: -bin(m).count("1"))
+
+    def _interp(self, row: List[float], gap: float) -> float:
+        pos = (gap + GAP_MAX) / GAP_STEP
+        if pos <= 0:
+            return row[0]
+        if pos >= GAP_BUCKETS - 1:
+            return row[-1]
+        i = int(pos)
+        frac = pos - i
+        return row[i] * (1 - frac) + row[i + 1] * frac
+
+    def _after_turn(self, rounds_left: int, win: List[List[float]]) -> List[List[float]]:
+        """Value once the bot stacks with a given gap: terminal, or the human plays then W(r-1)"""
+        gaps = range(self.gap_lo, self.gap_hi + 1)
+        if rounds_left == 0:
+            final = [1.0 if g < 0 else 0.5 if g == 0 else 0.0 for g in gaps]
+            return [final] * MASKS
+        return [
+            [sum(p * self._interp(win[m], g + x) for x, p in self.opponent[m]) for g in gaps]
+            for m in range(MASKS)
+        ]
+
+    def _solve_turn(self, gap: int, after: List[List[float]]):
+        """Values of every turn state for one (rounds_left, gap): returns W per mask and push-stack advantages"""
+        off = -self.gap_lo
+        value = [[0.0] * (TURN_MAX + 1) for _ in range(MASKS)]
+        advantage = [[0.0] * (TURN_MAX + 1) for _ in range(MASKS)]
+        win = [0.0] * MASKS
+        for m in self.mask_order:
+            after_m = after[m]
+            bust_value = after_m[gap + off]
+            for t in range(TURN_MAX, -1, -1):
+                stack = after_m[gap - t + off]
+                total = 0.0
+                stay = 0.0
+                for (kind, arg), p in self.bot_outcomes[m]:
+                    if kind == "gain":
+                        nt = t + arg
+                        total += p * (value[m][nt] if nt <= TURN_MAX else after_m[gap - nt + off])
+                    elif kind == "bust":
+                        total += p * bust_value
+                    elif kind == "penalty":
+                        total += p * after[m | arg][gap + self.penalty_cost[arg] + off]
+                    elif kind == "dodge":
+                        total += p * value[m | arg][t]
+                    else:
+                        stay += p
+                push = total / (1 - stay)
+                value[m][t] = max(stack, push)
+                advantage[m][t] = push - stack
+            win[m] = push  # t == 0: the first draw of a turn is forced
+        return win, advantage
+
+    def solve(self) -> Dict[str, bytes]:
+        """Bands for every level, as bytes indexed [rounds_left][gap bucket][mask] -> (lo, hi)"""
+        bands = {level: bytearray() for level in LEVELS}
+        win_prev: List[List[float]] = []
+        for rounds_left in range(ROUNDS_MAX + 1):
+            after = self._after_turn(rounds_left, win_prev)
+            win_now = [[0.0] * GAP_BUCKETS for _ in range(MASKS)]
+            for gi in range(GAP_BUCKETS):
+                gap = gi * GAP_STEP - GAP_MAX
+                win, advantage = self._solve_turn(gap, after)
+                for m in range(MASKS):
+                    win_now[m][gi] = win[m]
+                    for level, tolerance in LEVELS.items():
+                        bands[level].extend(stack_band(advantage[m], tolerance))
+            win_prev = win_now
+        return {level: bytes(data) for level, data in bands.items()}
+
+
+def stack_band(advantage: List[float], tolerance: float) -> Tuple[int, int]:
+    """[lo, hi): stacking acceptable from lo, pushing no longer acceptable from hi"""
+    lo = next((t for t in range(1, TURN_MAX + 1) if advantage[t] <= tolerance), TURN_MAX + 1)
+    hi = next((t for t in range(lo, TURN_MAX + 1) if advantage[t] <= -tolerance), TURN_MAX + 1)
+    return lo, hi
+
+
+def build_tables() -> Dict:
+    tables = {
+        "version": TABLE_VERSION,
+        "roundsMax": ROUNDS_MAX,
+        "gapMax": GAP_MAX,
+        "gapStep": GAP_STEP,
+        "masks": MASKS,
+        "levels": LEVELS,
+        "bots": {},
+    }
+    for bot, config in settings.BOT_CONFIGS.items():
+        dice_profile = config.get("diceModes", [bot])[0]
+        print(f"Solving {bot} (dice={dice_profile})...")
+        bands = BotSolver(bot, dice_profile, config.get("winning_score", settings.MAX_SCORE)).solve()
+        tables["bots"][bot] = {
+            "dice": dice_profile,
+            "bands": {level: base64.b64encode(zlib.compress(data, 9)).decode() for level, data in bands.items()},
+        }
+    return tables
+
+
+if __name__ == "__main__":
+    tables = build_tables()
+    os.makedirs(os.path.dirname(DATA_PATH), exist_ok=True)
+    with open(DATA_PATH, "w", encoding="utf-8") as f:
+        json.dump(tables, f, indent=1)
+    print(f"Wrote {DATA_PATH}")
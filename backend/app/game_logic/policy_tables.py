@@ -0,0 +1,71 @@
+"""
+Policy Tables - precomputed push/stack bands for the bots
+
+Generated offline by policy_solver.py and loaded once at import. A decision is
+an index computation and two byte reads.
+"""
+
+import base64
+import json
+import os
+import zlib
+from typing import Dict, Optional
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "policy_tables.json")
+
+
+class PolicyTable:
+    """Stack bands for one bot, indexed [level][rounds_left][gap bucket][mask]"""
+
+    __slots__ = ("bands", "rounds_max", "gap_max", "gap_step", "gap_buckets", "masks")
+
+    def __init__(self, bands: Dict[str, bytes], rounds_max: int, gap_max: int, gap_step: int, masks: int):
+        self.bands = bands
+        self.rounds_max = rounds_max
+        self.gap_max = gap_max
+        self.gap_step = gap_step
+        self.gap_buckets = 2 * gap_max // gap_step + 1
+        self.masks = masks
+
+    def stack_probability(
+        self,
+        level: str,
+        turn_score: int,
+        gap: int,
+        rounds_left: Optional[int],
+        used_bearish_mask: int
+    ) -> float:
+        """Probability of stacking now; gap is the human's lead, rounds_left None = no limit"""
+        if turn_score <= 0:
+            return 0.0
+        band = self.bands.get(level) or self.bands["expert"]
+        rounds = self.rounds_max if rounds_left is None else min(max(rounds_left, 0), self.rounds_max)
+        bucket = min(max(round((gap + self.gap_max) / self.gap_step), 0), self.gap_buckets - 1)
+        idx = 2 * ((rounds * self.gap_buckets + bucket) * self.masks + (used_bearish_mask % self.masks))
+        lo, hi = band[idx], band[idx + 1]
+        if turn_score < lo:
+            return 0.0
+        if turn_score >= hi:
+            return 1.0
+        return (turn_score - lo + 1) / (hi - lo + 1)
+
+
+def load_policy_tables(path: str = DATA_PATH) -> Dict[str, PolicyTable]:
+    """Tables per bot; empty if the data file has not been generated"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {
+        bot: PolicyTable(
+            {level: zlib.decompress(base64.b64decode(blob)) for level, blob in entry["bands"].items()},
+            data["roundsMax"],
+            data["gapMax"],
+            data["gapStep"],
+            data["masks"],
+        )
+        for bot, entry in data["bots"].items()
+    }
+
+
+POLICY_TABLES: Dict[str, PolicyTable] = load_policy_tables()
@@ -0,0 +1,76 @@
+"""
+Replay - rebuild game state from the game_events log
+
+Every event records the values it changed, so replaying is a plain fold over
+the events that follow the last snapshot; no game rules are re-run here.
+
+Event payloads:
+    snapshot  full state (see snapshot_state)
+    draw      {"card", "apeIn"}
+    roll      {"card", "roll", "ok", "turn", "apeIn", "keep"}
+    penalty   {"penalty", "dodged", "score", "mask"}
+    stack     {"score", "round", "status", "winner"}
+    decision  {"msg"}  (AI reasoning, no state change)
+    forfeit   {"status", "winner"}
+"""
+
+import copy
+from typing import Dict, Iterable, List, Optional
+
+
+def snapshot_state(game, players: List, state) -> Dict:
+    """Full replayable state from the ORM rows of one game"""
+    return {
+        "status": game.status,
+        "round": game.current_round,
+        "winner": game.winner_id,
+        "currentPlayer": state.current_player_id,
+        "card": state.current_card_id,
+        "lastRoll": state.last_roll,
+        "apeIn": bool(state.ape_in_active),
+        "mask": state.used_bearish_mask or 0,
+        "rng": state.rng_counter or 0,
+        "players": {p.id: {"score": p.score or 0, "turn": p.turn_score or 0} for p in players},
+    }
+
+
+def apply_event(state: Dict, event_type: str, player_id: Optional[str], data: Optional[Dict]) -> Dict:
+    """Apply one event to a replay state in place and return it"""
+    data = data or {}
+    if event_type == "snapshot":
+        return copy.deepcopy(data)
+
+    player = state["players"].setdefault(player_id, {"score": 0, "turn": 0}) if player_id else None
+
+    if event_type == "draw":
+        state["card"] = data["card"]
+        state["apeIn"] = data["apeIn"]
+    elif event_type == "roll":
+        state["lastRoll"] = data["roll"]
+        state["apeIn"] = data["apeIn"]
+        state["card"] = data["card"] if data["keep"] else None
+        player["turn"] = data["turn"]
+    elif event_type == "penalty":
+        state["mask"] = data["mask"]
+        player["score"] = data["score"]
+    elif event_type == "stack":
+        player["score"] = data["score"]
+        player["turn"] = 0
+        state["round"] = data["round"]
+        state["status"] = data["status"]
+        state["winner"] = data["winner"]
+    elif event_type == "timeout":
+        state["card"] = None
+        state["apeIn"] = False
+    elif event_type == "forfeit":
+        state["status"] = data["status"]
+        state["winner"] = data["winner"]
+    return state
+
+
+def replay_events(snapshot: Dict, events: Iterable) -> Dict:
+    """Fold events (objects with type/player_id/data) onto a snapshot"""
+    state = copy.deepcopy(snapshot)
+    for event in events:
+        state = apply_event(state, event.type, event.player_id, event.data)
+    return state
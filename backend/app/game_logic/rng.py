@@ -0,0 +1,66 @@
+import hashlib
+import hmac
+import random
+from app.config import settings
+
+# Loaded at startup when GAME_RNG_SECRET isn't configured (see secret_service.py)
+_stored_secret: str | None = None
+
+
+def use_stored_secret(secret: str):
+    global _stored_secret
+    _stored_secret = secret
+
+
+def rng_secret() -> str:
+    """The secret keying every game's stream; never a built-in default"""
+    if settings.GAME_RNG_SECRET:
+        return settings.GAME_RNG_SECRET
+    if _stored_secret is None:
+        raise RuntimeError("GAME_RNG_SECRET is not set and no stored secret has been loaded")
+    return _stored_secret
+
+
+def stable_hash(*parts) -> int:
+    """Process-independent hash (unlike hash(), which changes with PYTHONHASHSEED)"""
+    digest = hashlib.blake2b(":".join(str(p) for p in parts).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class GameRng(random.Random):
+    """Deterministic random stream for one game.
+
+    Counter-based: the n-th value is a keyed hash of (seed, n), so a stream can be
+    resumed from a stored counter without replaying earlier draws, and no state is
+    shared between games. All random.Random helpers (choices, choice, ...) work.
+    """
+
+    def __init__(self, game_id: str, counter: int = 0, secret: str | None = None):
+        key = (secret if secret is not None else rng_secret()).encode()
+        self._key = hmac.new(key, game_id.encode(), hashlib.sha256).digest()
+        self.counter = counter
+        super().__init__()
+
+    def seed(self, *args, **kwargs):
+        # The stream is fully defined by the game key and counter
+        pass
+
+    def _next_block(self) -> int:
+        block = hashlib.blake2b(self.counter.to_bytes(8, "big"), key=self._key, digest_size=8).digest()
+        self.counter += 1
+        return int.from_bytes(block, "big")
+
+    def random(self) -> float:
+        return (self._next_block() >> 11) * (1.0 / (1 << 53))
+
+    def getrandbits(self, k: int) -> int:
+        bits = 0
+        for shift in range(0, k, 64):
+            bits |= self._next_block() << shift
+        return bits & ((1 << k) - 1)
+
+    def getstate(self):
+        return self.counter
+
+    def setstate(self, state):
+        self.counter = state
@@ -1,14 +1,26 @@
 # URGENT: Render deployment trigger - Tue Oct 21 01:20:00 AM ACDT 2025 - CRITICAL: Force Render to use latest GitHub code
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 from app.config import settings
-from app.api import game, leaderboard, rewards
+from app.asset_pipeline import ASSETS_DIR
+from app.game_logic.cards import ASSET_MANIFEST
+from app.static_assets import AssetFiles
+from app.api import game, leaderboard, rewards, cards, bots, tournaments
 from app.websockets import game_ws
-from app.database import init_db
+from app.database import init_db, AsyncSessionLocal
+from app.services.bot_config_service import BotConfigService, watch_bot_configs
+from app.services.matchmaking_service import matchmaker
+from app.services.multiplayer_service import table_engine
+from app.services.tournament_service import advance_finished_game
+from app.services.turn_timer_service import turn_timers
+from app.services.reaper_service import reaper
+from app.services.secret_service import load_rng_secret
+from app.websockets.game_ws import manager
+from app.websockets.state_codec import state_versions
 # Import all models to ensure they are registered with Base
 from app.models import *
+import asyncio
 import os
 
 
@@ -19,8 +31,23 @@ async def lifespan(app: FastAPI):
     print("📊 Initializing database...")
     await init_db()
     print("✅ Database initialized successfully!")
+    async with AsyncSessionLocal() as db:
+        await load_rng_secret(db)
+        config_set = await BotConfigService(db).sync()
+    print(f"🤖 Bot configs at version {config_set.version}")
+    config_watcher = asyncio.create_task(watch_bot_configs())
+    matchmaker.start()
+    turn_timers.start()
+    table_engine.on_finish(advance_finished_game)
+    table_engine.start()
+    reaper.start()
     yield
     print("👋 Shutting down...")
+    reaper.stop()
+    config_watcher.cancel()
+    matchmaker.stop()
+    turn_timers.stop()
+    await table_engine.stop()
 
 
 app = FastAPI(
@@ -39,16 +66,19 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
-# Serve static assets (card images) if assets directory exists
-assets_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "assets")
-if os.path.exists(assets_path):
-    app.mount("/assets", StaticFiles(directory=assets_path), name="assets")
-    print(f"✅ Serving assets from: {assets_path}")
+# Serve static assets (card images) if assets directory exists; the hashed
+# build under assets/build is cached immutably (see static_assets.py)
+if os.path.exists(ASSETS_DIR):
+    app.mount("/assets", AssetFiles(directory=ASSETS_DIR, manifest=ASSET_MANIFEST), name="assets")
+    print(f"✅ Serving assets from: {ASSETS_DIR}" + (" (with hashed build)" if ASSET_MANIFEST else ""))
 
 # Include routers
 app.include_router(game.router, prefix="/api/game", tags=["game"])
 app.include_router(leaderboard.router, prefix="/api/leaderboard", tags=["leaderboard"])
 app.include_router(rewards.router, prefix="/api/rewards", tags=["rewards"])
+app.include_router(cards.router, prefix="/api/cards", tags=["cards"])
+app.include_router(bots.router, prefix="/api/bots", tags=["bots"])
+app.include_router(tournaments.router, prefix="/api/tournaments", tags=["tournaments"])
 app.include_router(game_ws.router, prefix="/ws", tags=["websocket"])
 
 
@@ -62,6 +92,19 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/stats")
+async def stats():
+    """Working-set sizes for this worker and the reaper's running totals"""
+    return {
+        "liveTables": len(table_engine.tables),
+        "turnTimers": len(turn_timers),
+        "sockets": manager.connection_count(),
+        "stateHistories": len(state_versions.history),
+        "queued": matchmaker.stats(),
+        "reaper": reaper.metrics,
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
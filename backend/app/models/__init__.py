@@ -1,10 +1,12 @@
-from app.models.game import Game, Player, GameState, LeaderboardEntry
+from app.models.game import (
+    Game, Player, GameState, GameEvent, LeaderboardEntry, Tournament, TournamentEntrant, TournamentMatch
+)
 from app.models.rewards import RewardsPool, GamePayment
-
-__all__ = ["Game", "Player", "GameState", "LeaderboardEntry", "RewardsPool", "GamePayment"]
-
-
-
-
-
-
+from app.models.bot_config import BotConfigVersion
+from app.models.server_secret import ServerSecret
+
+__all__ = [
+    "Game", "Player", "GameState", "GameEvent", "LeaderboardEntry",
+    "Tournament", "TournamentEntrant", "TournamentMatch",
+    "RewardsPool", "GamePayment", "BotConfigVersion", "ServerSecret",
+]
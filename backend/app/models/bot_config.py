@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, Integer, DateTime, JSON
+from datetime import datetime
+from app.database.database import Base
+
+
+class BotConfigVersion(Base):
+    """Published bot config versions; rows are never updated so pinned games can reload theirs"""
+    __tablename__ = "bot_config_versions"
+
+    version = Column(Integer, primary_key=True, autoincrement=False)
+    checksum = Column(String, nullable=False, index=True)  # sha256 of the canonical configs (see bot_configs.config_checksum)
+    configs = Column(JSON, nullable=False)  # {bot: config} in the BOT_CONFIGS shape
+    source = Column(String, nullable=True)  # File path, or "builtin" for settings.BOT_CONFIGS
+    created_at = Column(DateTime, default=datetime.utcnow)
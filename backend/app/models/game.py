@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, Boolean, JSON, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, DateTime, Boolean, JSON, ForeignKey, Text, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -11,6 +11,8 @@ def generate_uuid():
 
 class Game(Base):
     __tablename__ = "games"
+    # Stale-game reaper: open games ordered by last update (see reaper_service.py)
+    __table_args__ = (Index("ix_games_status_updated_at", "status", "updated_at"),)
 
     id = Column(String, primary_key=True, default=generate_uuid)
     mode = Column(String, nullable=False)  # sandy, aida, lana, enj1n, nifty, pvp, multiplayer, tournament
@@ -19,12 +21,15 @@ class Game(Base):
     max_rounds = Column(Integer, default=10)
     current_round = Column(Integer, default=1)  # Start at Round 1
     winner_id = Column(String, nullable=True)
+    bot_config_version = Column(Integer, nullable=True)  # Bot config version the game started on (see bot_configs.py); NULL = current
+    last_event_seq = Column(Integer, nullable=True)  # Last game_events seq handed out (see event_service.py); NULL = not counted yet
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
     players = relationship("Player", back_populates="game", cascade="all, delete-orphan")
     game_state = relationship("GameState", back_populates="game", uselist=False, cascade="all, delete-orphan")
+    events = relationship("GameEvent", back_populates="game", cascade="all, delete-orphan", order_by="GameEvent.seq")
 
 
 class Player(Base):
@@ -51,17 +56,34 @@ class GameState(Base):
     id = Column(String, primary_key=True, default=generate_uuid)
     game_id = Column(String, ForeignKey("games.id"), nullable=False, unique=True)
     current_player_id = Column(String, nullable=True)
-    current_card = Column(JSON, nullable=True)  # Stores card data as JSON
+    current_card_id = Column(Integer, nullable=True)  # Catalogue id of the card on the table (see cards.CARD_CATALOGUE)
     last_roll = Column(Integer, nullable=True)
     ape_in_active = Column(Boolean, default=False)
-    used_bearish_flags = Column(JSON, default=list)  # List of used bearish card types
-    game_log = Column(JSON, default=list)  # Log of game actions
+    rng_counter = Column(Integer, default=0)  # Position in the game's deterministic RNG stream (see rng.GameRng)
+    used_bearish_mask = Column(Integer, default=0)  # Bitmask of used bearish penalties (see cards.BEARISH_FLAG_BITS)
     last_completed_player_id = Column(String, nullable=True)  # Track who last stacked/busted to detect round changes
     
     # Relationships
     game = relationship("Game", back_populates="game_state")
 
 
+class GameEvent(Base):
+    """Append-only log of game actions - rows are inserted, never updated"""
+    __tablename__ = "game_events"
+    __table_args__ = (UniqueConstraint("game_id", "seq"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    game_id = Column(String, ForeignKey("games.id"), nullable=False, index=True)
+    seq = Column(Integer, nullable=False)  # Position in this game's log, starting at 1
+    type = Column(String, nullable=False)  # draw, roll, stack, penalty, ...
+    player_id = Column(String, nullable=True)
+    data = Column(JSON, nullable=True)  # Small event-specific payload
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    game = relationship("Game", back_populates="events")
+
+
 class LeaderboardEntry(Base):
     __tablename__ = "leaderboard"
 
@@ -76,3 +98,72 @@ class LeaderboardEntry(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+
+
+class Tournament(Base):
+    __tablename__ = "tournaments"
+
+    id = Column(String, primary_key=True, default=generate_uuid)
+    name = Column(String, nullable=False)
+    max_players = Column(Integer, nullable=False)
+    current_players = Column(Integer, default=0)
+    status = Column(String, default="registration")  # registration, in_progress, completed
+    bracket_type = Column(String, default="single_elimination")  # single_elimination, double_elimination, swiss
+    swiss_rounds = Column(Integer, nullable=True)  # Swiss only; defaults to ceil(log2(players))
+    current_round = Column(Integer, default=0)  # Swiss round being played
+    winner_id = Column(String, nullable=True)  # TournamentEntrant id
+    entry_fee = Column(Integer, nullable=True)
+    prize_pool = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+
+    # Relationships
+    entrants = relationship("TournamentEntrant", back_populates="tournament", cascade="all, delete-orphan", order_by="TournamentEntrant.seed")
+    matches = relationship("TournamentMatch", back_populates="tournament", cascade="all, delete-orphan")
+
+
+class TournamentEntrant(Base):
+    __tablename__ = "tournament_entrants"
+    __table_args__ = (UniqueConstraint("tournament_id", "seed", name="uq_tournament_entrants_seed"),)
+
+    id = Column(String, primary_key=True, default=generate_uuid)
+    tournament_id = Column(String, ForeignKey("tournaments.id"), nullable=False, index=True)
+    name = Column(String, nullable=False)
+    wallet_address = Column(String, nullable=True)
+    seed = Column(Integer, nullable=False)  # 1 = top seed (registration order)
+    wins = Column(Integer, default=0)
+    losses = Column(Integer, default=0)
+    eliminated = Column(Boolean, default=False)
+    joined_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    tournament = relationship("Tournament", back_populates="entrants")
+
+
+class TournamentMatch(Base):
+    __tablename__ = "tournament_matches"
+    __table_args__ = (UniqueConstraint("tournament_id", "key", name="uq_tournament_matches_key"),)
+
+    id = Column(String, primary_key=True, default=generate_uuid)
+    tournament_id = Column(String, ForeignKey("tournaments.id"), nullable=False, index=True)
+    key = Column(String, nullable=False)  # Bracket position, e.g. W1-3, L2-1, GF-1, S3-2 (see brackets.py)
+    bracket = Column(String, nullable=False)  # W, L, GF or S
+    round_number = Column(Integer, nullable=False)
+    match_number = Column(Integer, nullable=False)
+    player1_id = Column(String, nullable=True)  # TournamentEntrant id, or "bye"
+    player2_id = Column(String, nullable=True)
+    winner_id = Column(String, nullable=True)
+    loser_id = Column(String, nullable=True)
+    game_id = Column(String, ForeignKey("games.id"), nullable=True, index=True)
+    player1_seat_id = Column(String, nullable=True)  # Player ids in the match's game
+    player2_seat_id = Column(String, nullable=True)
+    status = Column(String, default="pending")  # pending, ready, in_progress, completed, void
+    next_key = Column(String, nullable=True)  # Where the winner goes
+    next_slot = Column(Integer, nullable=True)
+    loser_key = Column(String, nullable=True)  # Where the loser goes (double elimination)
+    loser_slot = Column(Integer, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+
+    # Relationships
+    tournament = relationship("Tournament", back_populates="matches")
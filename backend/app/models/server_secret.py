@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, DateTime
+from datetime import datetime
+from app.database.database import Base
+
+
+class ServerSecret(Base):
+    """Secrets generated on first start when not configured; shared by every worker through the database"""
+    __tablename__ = "server_secrets"
+
+    name = Column(String, primary_key=True)
+    value = Column(String, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,132 @@
+"""
+Bot Config Service - publish and load versioned bot configs
+
+The config source is the JSON file at settings.BOT_CONFIGS_PATH, or the
+built-in settings.BOT_CONFIGS when no file is configured. Whenever the source
+differs from the newest stored version, it is validated and stored as the next
+version; every worker polls for new versions and swaps them in.
+"""
+
+import asyncio
+import json
+import os
+from typing import Dict, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, func
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import BotConfigVersion
+from app.game_logic.bot_configs import (
+    BotConfig,
+    BotConfigSet,
+    bot_config_registry,
+    validate_bot_configs,
+    config_checksum,
+    dump_bot_configs,
+)
+
+# (path, mtime) -> validated configs, so an unchanged file is not re-parsed on every poll
+_source_cache: Dict[Tuple[str, float], Dict[str, BotConfig]] = {}
+
+
+def _read_source() -> Tuple[Dict[str, BotConfig], str]:
+    """Validated configs from the configured source; raises on unreadable or invalid input"""
+    path = settings.BOT_CONFIGS_PATH
+    if not path:
+        return bot_config_registry.get(0).configs, "builtin"
+
+    key = (path, os.path.getmtime(path))
+    configs = _source_cache.get(key)
+    if configs is None:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        configs = validate_bot_configs(data.get("bots", data))
+        _source_cache.clear()
+        _source_cache[key] = configs
+    return configs, path
+
+
+class BotConfigService:
+    """Service for publishing bot config versions and loading them into the registry"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _latest(self) -> Optional[BotConfigVersion]:
+        result = await self.db.execute(
+            select(BotConfigVersion).order_by(BotConfigVersion.version.desc()).limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def publish_source(self) -> Optional[int]:
+        """Store the config source as a new version if it changed; returns the new version"""
+        try:
+            configs, source = _read_source()
+        except (OSError, AttributeError, ValueError, ValidationError) as e:
+            # json and pydantic errors are ValueErrors; keep serving the current version
+            print(f"❌ Bot config source rejected, keeping version {bot_config_registry.current.version}: {e}")
+            return None
+
+        checksum = config_checksum(configs)
+        latest = await self._latest()
+        if latest and latest.checksum == checksum:
+            return None
+
+        version = (latest.version if latest else 0) + 1
+        self.db.add(BotConfigVersion(
+            version=version,
+            checksum=checksum,
+            configs=dump_bot_configs(configs),
+            source=source
+        ))
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            # Another worker published the same change first
+            await self.db.rollback()
+            return None
+        print(f"✅ Published bot config version {version} from {source}")
+        return version
+
+    async def load_version(self, version: int) -> Optional[BotConfigSet]:
+        """Config set for a version, from the registry or the database"""
+        config_set = bot_config_registry.get(version)
+        if config_set is not None:
+            return config_set
+        result = await self.db.execute(
+            select(BotConfigVersion).where(BotConfigVersion.version == version)
+        )
+        row = result.scalar_one_or_none()
+        if not row:
+            return None
+        config_set = BotConfigSet(row.version, validate_bot_configs(row.configs))
+        bot_config_registry.install(config_set)
+        return config_set
+
+    async def refresh(self) -> BotConfigSet:
+        """Swap in the newest stored version if this worker is behind"""
+        result = await self.db.execute(select(func.max(BotConfigVersion.version)))
+        latest = result.scalar()
+        if latest and latest > bot_config_registry.current.version:
+            await self.load_version(latest)
+            print(f"🔄 Bot configs now at version {bot_config_registry.current.version}")
+        return bot_config_registry.current
+
+    async def sync(self) -> BotConfigSet:
+        await self.publish_source()
+        return await self.refresh()
+
+
+async def watch_bot_configs():
+    """Background task: sync bot configs every BOT_CONFIG_POLL_SECONDS"""
+    while True:
+        await asyncio.sleep(settings.BOT_CONFIG_POLL_SECONDS)
+        try:
+            async with AsyncSessionLocal() as db:
+                await BotConfigService(db).sync()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"❌ Bot config sync failed: {e}")
@@ -0,0 +1,109 @@
+"""
+Event Service - Append-only game event log with snapshot-based replay
+
+Several sessions write events for the same game (requests, the table engine's
+flush, turn timers, the reaper), so seqs are handed out by the database: each
+append bumps games.last_event_seq in one UPDATE ... RETURNING. The row stays
+locked until the writer commits, so concurrent writers queue instead of
+colliding on (game_id, seq).
+"""
+
+from typing import Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, text
+from app.models import Game, Player, GameState, GameEvent
+from app.game_logic.replay import snapshot_state, replay_events
+
+
+# Games from before the counter start from their highest logged seq
+NEXT_SEQ_SQL = text(
+    "UPDATE games SET last_event_seq = COALESCE(last_event_seq, "
+    "(SELECT MAX(seq) FROM game_events WHERE game_events.game_id = games.id), 0) + 1 "
+    "WHERE id = :game_id RETURNING last_event_seq"
+)
+
+
+class EventService:
+    """Service for appending game events and rebuilding state from them"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _allocate_seq(self, game_id: str) -> int:
+        result = await self.db.execute(NEXT_SEQ_SQL, {"game_id": game_id})
+        seq = result.scalar()
+        if seq is None:
+            await self.db.flush()  # The game may still be pending in this session
+            result = await self.db.execute(NEXT_SEQ_SQL, {"game_id": game_id})
+            seq = result.scalar()
+            if seq is None:
+                raise LookupError(f"Game {game_id} not found")
+        return seq
+
+    async def append(
+        self,
+        game_id: str,
+        event_type: str,
+        player_id: Optional[str] = None,
+        data: Optional[Dict] = None
+    ) -> GameEvent:
+        """Add an event to the session; it is written with the caller's next commit"""
+        event = GameEvent(
+            game_id=game_id,
+            seq=await self._allocate_seq(game_id),
+            type=event_type,
+            player_id=player_id,
+            data=data
+        )
+        self.db.add(event)
+        return event
+
+    async def append_snapshot(self, game: Game, players: List[Player], state: GameState) -> GameEvent:
+        """Record the full state so replays can start here instead of at seq 1"""
+        return await self.append(game.id, "snapshot", data=snapshot_state(game, players, state))
+
+    async def get_events(self, game_id: str, after_seq: int = 0, limit: int = 500) -> List[Dict]:
+        """Raw event log for a game"""
+        result = await self.db.execute(
+            select(GameEvent)
+            .where(GameEvent.game_id == game_id, GameEvent.seq > after_seq)
+            .order_by(GameEvent.seq)
+            .limit(limit)
+        )
+        return [
+            {
+                "seq": event.seq,
+                "type": event.type,
+                "playerId": event.player_id,
+                "data": event.data,
+                "createdAt": event.created_at.isoformat() if event.created_at else None
+            }
+            for event in result.scalars().all()
+        ]
+
+    async def replay(self, game_id: str, upto_seq: Optional[int] = None) -> Optional[Dict]:
+        """Rebuild game state as of upto_seq (latest if None) from the last snapshot before it"""
+        snapshot_query = select(GameEvent).where(
+            GameEvent.game_id == game_id, GameEvent.type == "snapshot"
+        )
+        if upto_seq is not None:
+            snapshot_query = snapshot_query.where(GameEvent.seq <= upto_seq)
+        result = await self.db.execute(snapshot_query.order_by(GameEvent.seq.desc()).limit(1))
+        snapshot = result.scalar_one_or_none()
+        if not snapshot:
+            return None
+
+        events_query = select(GameEvent).where(
+            GameEvent.game_id == game_id, GameEvent.seq > snapshot.seq
+        )
+        if upto_seq is not None:
+            events_query = events_query.where(GameEvent.seq <= upto_seq)
+        result = await self.db.execute(events_query.order_by(GameEvent.seq))
+        events = result.scalars().all()
+
+        return {
+            "gameId": game_id,
+            "seq": events[-1].seq if events else snapshot.seq,
+            "snapshotSeq": snapshot.seq,
+            "state": replay_events(snapshot.data, events)
+        }
@@ -1,18 +1,27 @@
 from typing import Dict, List, Optional, Tuple
-import random
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models import Game, Player, GameState, LeaderboardEntry
 from app.game_logic import (
     Card,
+    get_card,
+    BEARISH_FLAG_BITS,
     draw_weighted_card,
     apply_ape_in_effect,
     roll_dice,
     check_bust,
+    GameRng,
 )
+from app.game_logic.bot_policies import BotTurnState
+from app.game_logic.bot_configs import BotConfigSet, bot_config_registry
 from app.config import settings
 from app.services.rewards_service import RewardsService
 from app.services.leaderboard_service import LeaderboardService
+from app.services.event_service import EventService
+from app.services.bot_config_service import BotConfigService
+from app.services.matchmaking_service import MATCH_SIZES
+from app.services.multiplayer_service import TABLE_MODES, table_engine
+from app.game_logic.multiplayer import TableGame
 
 
 class GameService:
@@ -22,6 +31,30 @@ class GameService:
         self.db = db
         self.rewards_service = RewardsService(db)
         self.leaderboard_service = LeaderboardService(db)
+        self.events = EventService(db)
+        self.bot_configs = BotConfigService(db)
+        # One deterministic RNG stream per game, resumed from GameState.rng_counter
+        self._rngs: Dict[str, GameRng] = {}
+
+    def _game_rng(self, state: GameState) -> GameRng:
+        rng = self._rngs.get(state.game_id)
+        if rng is None:
+            rng = GameRng(state.game_id, state.rng_counter or 0)
+            self._rngs[state.game_id] = rng
+        return rng
+
+    async def _bot_config_set(self, game: Game) -> BotConfigSet:
+        """Bot config version the game is pinned to (current for games that predate versioning)"""
+        if game.bot_config_version is None:
+            return bot_config_registry.current
+        config_set = await self.bot_configs.load_version(game.bot_config_version)
+        return config_set or bot_config_registry.current
+
+    def _save_rng(self, state: GameState):
+        """Persist how far the game's RNG stream has advanced"""
+        rng = self._rngs.get(state.game_id)
+        if rng is not None:
+            state.rng_counter = rng.counter
 
     async def create_game(
         self,
@@ -31,17 +64,19 @@ class GameService:
         is_daily_free: bool = False
     ) -> Dict:
         """Create a new game"""
-        # Get bot-specific configuration
-        bot_config = settings.BOT_CONFIGS.get(mode, {})
-        winning_score = bot_config.get("winning_score", settings.MAX_SCORE)
-        max_rounds = bot_config.get("max_rounds", settings.MAX_ROUNDS)
+        # Get bot-specific configuration; the game stays on this config version
+        config_set = bot_config_registry.current
+        bot_config = config_set.config(mode)
+        winning_score = bot_config.winning_score if bot_config else settings.MAX_SCORE
+        max_rounds = bot_config.max_rounds if bot_config else settings.MAX_ROUNDS
         
         # Create game
         game = Game(
             mode=mode,
             status="waiting" if mode in ["pvp", "multiplayer"] else "playing",
             winning_score=winning_score,
-            max_rounds=max_rounds
+            max_rounds=max_rounds,
+            bot_config_version=config_set.version
         )
         self.db.add(game)
         await self.db.flush()
@@ -56,9 +91,11 @@ class GameService:
         self.db.add(player)
         await self.db.flush()  # Flush to get player.id
 
+        players = [player]
+
         # Create AI opponent if single-player mode
         if mode in ["sandy", "aida", "lana", "enj1n", "nifty"]:
-            bot_name = bot_config.get("name", mode.capitalize())
+            bot_name = bot_config.name if bot_config else mode.capitalize()
             ai_player = Player(
                 game_id=game.id,
                 name=bot_name,
@@ -66,20 +103,21 @@ class GameService:
                 ai_type=mode
             )
             self.db.add(ai_player)
+            await self.db.flush()  # Flush to get ai_player.id for the opening snapshot
+            players.append(ai_player)
             game.status = "playing"
 
         # Create game state
         game_state = GameState(
             game_id=game.id,
             current_player_id=player.id,  # Now player.id is guaranteed to be set
-            used_bearish_flags=[],
-            game_log=[]
+            used_bearish_mask=0
         )
         self.db.add(game_state)
+        await self.events.append_snapshot(game, players, game_state)
 
         # Record payment for non-Sandy games (but not for daily free games)
         if mode != "sandy" and wallet_address and not is_daily_free:
-            bot_config = settings.BOT_CONFIGS.get(mode, {})
             game_price = 0.10  # Default price for paid games
             
             await self.rewards_service.record_game_payment(
@@ -95,6 +133,99 @@ class GameService:
 
         return await self.get_game_data(game.id)
 
+    async def create_match_game(self, mode: str, players: List[Tuple[str, Optional[str]]]) -> Dict:
+        """Create a started game for a matchmade group of (name, wallet) in one transaction"""
+        game, seats = await self.add_match_game(mode, players)
+        await self.db.commit()
+
+        return {
+            **await self.get_game_data(game.id),
+            "playerIds": [seat.id for seat in seats]
+        }
+
+    async def add_match_game(
+        self,
+        mode: str,
+        players: List[Tuple[str, Optional[str]]]
+    ) -> Tuple[Game, List[Player]]:
+        """Add a started game with one seat per (name, wallet), in order, without committing"""
+        game = Game(
+            mode=mode,
+            status="playing",
+            winning_score=settings.MAX_SCORE,
+            max_rounds=settings.MAX_ROUNDS
+        )
+        self.db.add(game)
+        await self.db.flush()
+
+        seats = [
+            Player(game_id=game.id, name=name, wallet_address=wallet_address, is_ai=False)
+            for name, wallet_address in players
+        ]
+        self.db.add_all(seats)
+        await self.db.flush()  # Player ids for the game state and snapshot
+
+        game_state = GameState(
+            game_id=game.id,
+            current_player_id=seats[0].id,
+            used_bearish_mask=0
+        )
+        self.db.add(game_state)
+        await self.events.append_snapshot(game, seats, game_state)
+        table_engine.arm(game.id)
+        return game, seats
+
+    async def join_game(
+        self,
+        game_id: str,
+        player_name: str,
+        wallet_address: Optional[str] = None
+    ) -> Dict:
+        """Take a seat in a waiting pvp/multiplayer game; it starts once every seat is taken"""
+        result = await self.db.execute(
+            select(Game).where(Game.id == game_id)
+        )
+        game = result.scalar_one_or_none()
+        if not game:
+            raise ValueError("Game not found")
+        if game.mode not in MATCH_SIZES or game.status != "waiting":
+            raise PermissionError("Game is not open for joining")
+
+        result = await self.db.execute(
+            select(Player).where(Player.game_id == game_id).order_by(Player.joined_at)
+        )
+        players = list(result.scalars().all())
+        if wallet_address and any(p.wallet_address == wallet_address for p in players):
+            raise PermissionError("Already in this game")
+        if len(players) >= MATCH_SIZES[game.mode][1]:
+            raise PermissionError("Game is full")
+
+        player = Player(
+            game_id=game.id,
+            name=player_name,
+            wallet_address=wallet_address,
+            is_ai=False
+        )
+        self.db.add(player)
+        await self.db.flush()
+        players.append(player)
+
+        if len(players) == MATCH_SIZES[game.mode][1]:
+            table_engine.evict(game_id)  # Drop any table loaded while the game was still waiting
+            game.status = "playing"
+            result = await self.db.execute(
+                select(GameState).where(GameState.game_id == game_id)
+            )
+            await self.events.append_snapshot(game, players, result.scalar_one())
+
+        await self.db.commit()
+        if game.status == "playing":
+            table_engine.arm(game_id)
+        return {
+            **await self.get_game_data(game_id),
+            "playerId": player.id
+        }
+
     async def get_game_data(self, game_id: str) -> Dict:
         """Get complete game data"""
         result = await self.db.execute(
@@ -105,9 +236,9 @@ class GameService:
         if not game:
             raise ValueError("Game not found")
 
-        # Get players
+        # Get players (in join order, which is the seat order for pvp/multiplayer)
         result = await self.db.execute(
-            select(Player).where(Player.game_id == game_id)
+            select(Player).where(Player.game_id == game_id).order_by(Player.joined_at)
         )
         players = result.scalars().all()
 
@@ -117,6 +248,11 @@ class GameService:
         )
         state = result.scalar_one_or_none()
 
+        # N-player games: the live table is ahead of the database between flushes
+        if game.mode in TABLE_MODES and state:
+            table = table_engine.loaded(game_id) or TableGame.from_rows(game, players, state)
+            return table.view()
+
         # Find human player and opponent
         human_player = next((p for p in players if not p.is_ai), None)
         opponent = next((p for p in players if p.is_ai or p.id != human_player.id), None)
@@ -127,9 +263,11 @@ class GameService:
             winner_player = next((p for p in players if p.id == game.winner_id), None)
             winner_name = winner_player.name if winner_player else None
 
+        current_card = get_card(state.current_card_id) if state else None
+
         # Check if this game mode has unlimited rounds
-        bot_config = settings.BOT_CONFIGS.get(game.mode, {})
-        no_round_limit = bot_config.get("no_round_limit", False)
+        bot_config = (await self._bot_config_set(game)).config(game.mode)
+        no_round_limit = bot_config.no_round_limit if bot_config else False
         
         return {
             "gameId": game.id,
@@ -139,7 +277,7 @@ class GameService:
             "opponentScore": opponent.score if opponent else 0,
             "playerTurnScore": human_player.turn_score if human_player else 0,
             "opponentTurnScore": opponent.turn_score if opponent else 0,
-            "currentCard": state.current_card if state else None,
+            "currentCard": current_card._asdict() if current_card else None,
             "lastRoll": state.last_roll if state else None,
             "roundCount": game.current_round,
             "maxRounds": game.max_rounds,
@@ -165,20 +303,26 @@ class GameService:
         game = result.scalar_one()
 
         # Check if last card was Ape In! to prevent consecutive Ape In! cards
-        last_card_was_ape_in = False
-        if state.current_card:
-            last_card = Card(**state.current_card)
-            last_card_was_ape_in = last_card.name == "Ape In!"
+        last_card = get_card(state.current_card_id)
+        last_card_was_ape_in = last_card is not None and last_card.name == "Ape In!"
 
         # Draw a card (exclude Ape In! if last card was Ape In!)
-        card = draw_weighted_card(state.used_bearish_flags, exclude_ape_in=last_card_was_ape_in, game_mode=game.mode)
+        card = draw_weighted_card(
+            state.used_bearish_mask or 0,
+            exclude_ape_in=last_card_was_ape_in,
+            game_mode=game.mode,
+            rng=self._game_rng(state)
+        )
+        self._save_rng(state)
         
         # Store card in state (this replaces any existing card)
-        state.current_card = card.model_dump()
+        state.current_card_id = card.id
         
         # Activate Ape In effect if Ape In card is drawn
         if card.name == "Ape In!":
             state.ape_in_active = True
+
+        await self.events.append(game_id, "draw", player_id, {"card": card.id, "apeIn": bool(state.ape_in_active)})
         
         await self.db.commit()
         return card
@@ -201,13 +345,13 @@ class GameService:
         player = result.scalar_one()
 
         # Must have a current card
-        if not state.current_card:
+        current_card = get_card(state.current_card_id)
+        if current_card is None:
             raise ValueError("No card to roll for")
-
-        current_card = Card(**state.current_card)
         
         # Roll dice
-        roll = roll_dice(dice_profile)
+        roll = roll_dice(dice_profile, rng=self._game_rng(state))
+        self._save_rng(state)
         state.last_roll = roll
 
         # Check if Ape In is active
@@ -220,13 +364,15 @@ class GameService:
                 # Dodged!
                 if state.ape_in_active:
                     state.ape_in_active = False
+                    await self._log_roll(game_id, player, state, current_card, roll, True)
                     message = "Dodged bearish!"
                     if was_ape_in_active:
                         message += " (Ape In! negated)"
                     return roll, True, message
                 else:
-                    state.used_bearish_flags.append(current_card.penalty)
-                    state.current_card = None
+                    state.used_bearish_mask = (state.used_bearish_mask or 0) | BEARISH_FLAG_BITS[current_card.penalty]
+                    state.current_card_id = None
+                    await self._log_roll(game_id, player, state, current_card, roll, True)
                     await self.db.commit()
                     message = "Dodged bearish!"
                     if was_ape_in_active:
@@ -236,16 +382,15 @@ class GameService:
                 # Apply penalty
                 if current_card.penalty == "Reset":
                     player.score = 0
-                    state.used_bearish_flags.append("Reset")
                 elif current_card.penalty == "Half":
                     player.score = player.score // 2
-                    state.used_bearish_flags.append("Half")
                 elif current_card.penalty == "Minus10":
                     player.score = max(0, player.score - 10)
-                    state.used_bearish_flags.append("Minus10")
+                state.used_bearish_mask = (state.used_bearish_mask or 0) | BEARISH_FLAG_BITS[current_card.penalty]
                 
                 player.turn_score = 0
-                state.current_card = None
+                state.current_card_id = None
+                await self._log_roll(game_id, player, state, current_card, roll, False)
                 
                 await self.db.commit()
                 message = f"Hit by {current_card.penalty}!"
@@ -256,8 +401,9 @@ class GameService:
         # Check bust
         if check_bust(roll):
             player.turn_score = 0
-            state.current_card = None
+            state.current_card_id = None
             state.ape_in_active = False
+            await self._log_roll(game_id, player, state, current_card, roll, False)
             
             await self.db.commit()
             return roll, False, "Busted!"
@@ -271,11 +417,30 @@ class GameService:
             state.ape_in_active = False
 
         player.turn_score += card_value
-        state.current_card = None
+        state.current_card_id = None
+        await self._log_roll(game_id, player, state, current_card, roll, True)
         
         await self.db.commit()
         return roll, True, f"Added {card_value} sats to turn score!"
 
+    async def _log_roll(self, game_id: str, player: Player, state: GameState, card: Card, roll: int, ok: bool):
+        """Append the roll (and penalty, for bearish cards) to the event log"""
+        await self.events.append(game_id, "roll", player.id, {
+            "card": card.id,
+            "roll": roll,
+            "ok": ok,
+            "turn": player.turn_score,
+            "apeIn": bool(state.ape_in_active),
+            "keep": state.current_card_id is not None
+        })
+        if card.type == "Bearish":
+            await self.events.append(game_id, "penalty", player.id, {
+                "penalty": card.penalty,
+                "dodged": ok,
+                "score": player.score,
+                "mask": state.used_bearish_mask or 0
+            })
+
     async def stack_sats(self, game_id: str, player_id: str, skip_ai_turn: bool = False) -> Dict:
         """Stack sats (end turn)"""
         result = await self.db.execute(
@@ -308,8 +473,8 @@ class GameService:
             game.current_round += 1
 
         # Check max rounds (only for games with round limits)
-        bot_config = settings.BOT_CONFIGS.get(game.mode, {})
-        no_round_limit = bot_config.get("no_round_limit", False)
+        bot_config = (await self._bot_config_set(game)).config(game.mode)
+        no_round_limit = bot_config.no_round_limit if bot_config else False
         
         if not no_round_limit and game.current_round > game.max_rounds and game.status != "finished":
             game.status = "finished"
@@ -320,6 +485,20 @@ class GameService:
             winner = result.scalars().first()
             game.winner_id = winner.id if winner else None
 
+        await self.events.append(game_id, "stack", player.id, {
+            "score": player.score,
+            "round": game.current_round,
+            "status": game.status,
+            "winner": game.winner_id
+        })
+        # Snapshot at each round boundary and at game end to keep replays short
+        if player.is_ai or game.status == "finished":
+            result = await self.db.execute(
+                select(Player).where(Player.game_id == game_id)
+            )
+            await self.events.append_snapshot(game, result.scalars().all(), state)
+
+        self._save_rng(state)
         await self.db.commit()
 
         # Update leaderboard after main transaction is committed (non-critical)
@@ -342,6 +521,28 @@ class GameService:
 
         return await self.get_game_data(game_id)
 
+    async def forfeit(self, game_id: str) -> Game:
+        """End a single-player game in the bot's favour"""
+        result = await self.db.execute(
+            select(Game).where(Game.id == game_id)
+        )
+        game = result.scalar_one()
+
+        result = await self.db.execute(
+            select(Player).where(
+                Player.game_id == game_id,
+                Player.is_ai == True
+            )
+        )
+        opponent = result.scalar_one_or_none()
+
+        game.status = "finished"
+        game.winner_id = opponent.id if opponent else None
+        await self.events.append(game_id, "forfeit", data={"status": game.status, "winner": game.winner_id})
+
+        await self.db.commit()
+        return game
+
     async def _ai_play_turn(self, game_id: str):
         """AI opponent plays their turn and return action log"""
         result = await self.db.execute(
@@ -357,47 +558,28 @@ class GameService:
         )
         game = result.scalar_one()
 
-        # AI decision logic based on type
+        result = await self.db.execute(
+            select(GameState).where(GameState.game_id == game_id)
+        )
+        state = result.scalar_one()
+        rng = self._game_rng(state)
+
+        # AI decision logic based on type (policies are compiled once per config version)
         ai_type = ai_player.ai_type or "sandy"
-        bot_config = settings.BOT_CONFIGS.get(ai_type, {})
-        risk_cfg = bot_config.get("risk", {})
-        jitter_cfg = bot_config.get("jitter", {"enabled": False, "pct": 0.0})
-        dice_modes = bot_config.get("diceModes", [ai_type])
-        no_round_limit = bot_config.get("no_round_limit", False)
-
-        # Compute roundsLeft (respect no_round_limit)
-        rounds_left = None if no_round_limit else max(0, game.max_rounds - game.current_round)
-
-        # Per-match deterministic jitter factor based on game.id
-        def get_jittered(value: float) -> float:
-            if not value:
-                return value
-            if not jitter_cfg.get("enabled", False):
-                return value
-            pct = float(jitter_cfg.get("pct", 0.0))
-            # Deterministic jitter from game.id hash
-            seed = hash((game.id, ai_type)) % 10000
-            rnd = (seed / 10000.0) * 2.0 - 1.0  # [-1, 1)
-            return max(0.0, value * (1.0 + pct * rnd))
-
-        # Adaptive scaling helper: increase probability when behind or low rounds left
-        def scale_push(base_prob: float, behind_by: int) -> float:
-            if base_prob <= 0.0:
-                return 0.0
-            prob = base_prob
-            # scale by behindBy (every 25 sats behind adds ~5%)
-            prob += max(0, behind_by) * 0.002
-            # scale by rounds left (if nearing end, add up to +10%)
-            if rounds_left is not None and rounds_left <= 3:
-                prob += max(0, (3 - rounds_left + 1)) * 0.03
-            return min(0.98, max(0.0, get_jittered(prob)))
-
-        target_turn_score = self._get_ai_target_score(ai_type, ai_player, game)
+        policy = (await self._bot_config_set(game)).policy(ai_type)
+        rounds_left = policy.rounds_left(game.max_rounds, game.current_round)
+        jitter = policy.match_jitter(game.id)
+        target_turn_score = policy.pick_target(rng)
+
+        result = await self.db.execute(
+            select(Player).where(Player.game_id == game_id, Player.is_ai == False)
+        )
+        human_player = result.scalar_one()
 
         # Track actions for replay
         actions = []
 
-        # AI draws and rolls with adaptive logic
+        # AI draws and rolls until its policy stacks
         while True:
             # Draw card
             card = await self.draw_card(game_id, ai_player.id)
@@ -406,7 +588,7 @@ class GameService:
             if card.name == "Ape In!":
                 actions.append({
                     "type": "ape_in",
-                    "card": card.model_dump(),
+                    "card": card._asdict(),
                     "message": "Ape In! activated"
                 })
                 # Don't clear the card immediately - let it stay visible
@@ -416,23 +598,12 @@ class GameService:
             # Log the draw action
             actions.append({
                 "type": "draw",
-                "card": card.model_dump()
+                "card": card._asdict()
             })
 
             # Decide dice profile (conditional aggressive switch if behind or low rounds)
-            # Fetch human score for context
-            result = await self.db.execute(
-                select(Player).where(Player.game_id == game_id, Player.is_ai == False)
-            )
-            human_player = result.scalar_one()
             behind_by_now = human_player.score - ai_player.score
-            dice_profile = ai_type
-            if len(dice_modes) > 1:
-                # switch to aggressive when notably behind or low rounds
-                if behind_by_now >= int(risk_cfg.get("behindGap", 999)) or (rounds_left is not None and rounds_left <= 2):
-                    dice_profile = dice_modes[-1]
-                else:
-                    dice_profile = dice_modes[0]
+            dice_profile = policy.dice_profile(behind_by_now, rounds_left)
 
             # Roll dice with selected profile
             roll, success, message = await self.roll_dice_action(
@@ -457,120 +628,23 @@ class GameService:
             if not success:
                 # AI busted or hit bearish
                 break
-            
-            # Helper for opponent-aware nudge: if player currently far ahead, push more
-            opponent_push_nudge = 0.0
-            if behind_by_now >= 30:
-                opponent_push_nudge = 0.08
-
-            # Sandy-specific tutorial logic (simple and predictable)
-            if ai_type == "sandy" and ai_player.turn_score >= 21:
-                # Check if player is significantly ahead (>50 sats)
-                if behind_by_now > 50:
-                    # 61.8% chance to continue when player is far ahead (golden ratio)
-                    should_continue = (random.random() < 0.618)
-                    if should_continue:
-                        actions.append({
-                            "type": "decision",
-                            "message": f"Sandy takes a big risk to catch up! (61.8% chance, player ahead by {behind_by_now} sats)"
-                        })
-                    else:
-                        actions.append({
-                            "type": "decision",
-                            "message": f"Sandy plays it safe despite being behind by {behind_by_now} sats"
-                        })
-                        break
-                else:
-                    # Normal tutorial logic - 10% chance to continue at 21
-                    should_continue = (random.random() < 0.10)
-                    if should_continue:
-                        actions.append({
-                            "type": "decision",
-                            "message": "Sandy decides to push her luck! (10% chance)"
-                        })
-                    else:
-                        actions.append({
-                            "type": "decision",
-                            "message": "Sandy plays it safe at 21 sats"
-                        })
-                        break
-            # Aida-specific decision logic
-            elif ai_type == "aida":
-                behind_by = behind_by_now
-                ts = ai_player.turn_score
-                mid_min = int(risk_cfg.get("midMin", 21))
-                mid_max = int(risk_cfg.get("midMax", 39))
-                mid_push = float(risk_cfg.get("midPush", 0.50))
-                high_stack = int(risk_cfg.get("highStack", 40))
-                aida_behind_gap = int(risk_cfg.get("behindGap", 30))
-                aida_behind_push = float(risk_cfg.get("behindPush", 0.60))
-                if behind_by > aida_behind_gap:
-                    if random.random() < scale_push(aida_behind_push + opponent_push_nudge, behind_by):
-                        actions.append({"type": "decision", "message": "Aida takes a calculated risk to catch up."})
-                        continue
-                    else:
-                        break
-                elif ts >= high_stack:
-                    actions.append({"type": "decision", "message": f"Aida stacks at {high_stack}+."})
-                    break
-                elif mid_min <= ts <= mid_max:
-                    if random.random() < scale_push(mid_push + opponent_push_nudge, behind_by):
-                        actions.append({"type": "decision", "message": "Aida pushes with a balanced risk."})
-                        continue
-                    else:
-                        break
-                else:
-                    continue
-            # Lana-specific decision logic
-            elif ai_type == "lana":
-                ts = ai_player.turn_score
-                stack_at = int(risk_cfg.get("stackAt", 30))
-                stack_bias = float(risk_cfg.get("stackBias", 0.70))
-                if ts >= stack_at:
-                    if random.random() < scale_push(stack_bias - 0.20, -behind_by_now):  # slight tendency to stack, less when behind
-                        actions.append({"type": "decision", "message": f"Lana stacks at {stack_at}."})
-                        break
-                    else:
-                        continue
-                else:
-                    continue
-            # En-J1n-specific decision logic
-            elif ai_type == "enj1n":
-                behind_by = behind_by_now
-                ts = ai_player.turn_score
-                enj1n_behind_gap = int(risk_cfg.get("behindGap", 20))
-                stack_at = int(risk_cfg.get("stackAt", 50))
-                base_push = float(risk_cfg.get("basePush", 0.75))
-                if behind_by > enj1n_behind_gap:
-                    actions.append({"type": "decision", "message": "En-J1n stacks aggressively to catch up."})
-                    break
-                elif ts >= stack_at:
-                    actions.append({"type": "decision", "message": f"En-J1n stacks at {stack_at}."})
-                    break
-                else:
-                    if random.random() < scale_push(base_push + opponent_push_nudge, behind_by):
-                        actions.append({"type": "decision", "message": "En-J1n keeps pressing the attack."})
-                        continue
-                    else:
-                        break
-            # Nifty-specific decision logic
-            elif ai_type == "nifty":
-                behind_by = behind_by_now
-                ts = ai_player.turn_score
-                stack_at = int(risk_cfg.get("stackAt", 50))
-                behind_gap = int(risk_cfg.get("behindGap", 20))
-                if ts >= stack_at:
-                    if behind_by >= behind_gap:
-                        actions.append({"type": "decision", "message": "Nifty is behind—stays ultra aggressive over 50 sats."})
-                        continue
-                    else:
-                        actions.append({"type": "decision", "message": f"Nifty stacks at {stack_at}."})
-                        break
-                else:
-                    continue
-            elif ai_player.turn_score >= target_turn_score:
-                break
 
+            action = policy.decide(
+                BotTurnState(
+                    turn_score=ai_player.turn_score,
+                    behind_by=behind_by_now,
+                    rounds_left=rounds_left,
+                    used_bearish_mask=state.used_bearish_mask or 0,
+                    target_score=target_turn_score,
+                    jitter=jitter,
+                ),
+                rng,
+            )
+            if action.message:
+                actions.append({"type": "decision", "message": action.message})
+                await self.events.append(game_id, "decision", ai_player.id, {"msg": action.message})
+            if action.stack:
+                break
         # Stack sats (skip AI turn to prevent recursion)
         await self.stack_sats(game_id, ai_player.id, skip_ai_turn=True)
         actions.append({
@@ -579,10 +653,3 @@ class GameService:
         })
         
         return actions
-
-    def _get_ai_target_score(self, ai_type: str, ai_player: Player, game: Game) -> int:
-        """Get AI target turn score based on type"""
-        bot_config = settings.BOT_CONFIGS.get(ai_type, {})
-        target_scores = bot_config.get("target_scores", [21])
-        return random.choice(target_scores)
-
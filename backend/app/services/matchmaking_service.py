@@ -0,0 +1,273 @@
+"""
+Matchmaking Service - In-memory queues for pvp and multiplayer games
+
+Each mode has one queue per rating bucket (an OrderedDict, so enqueue, cancel
+and pop-oldest are O(1)). A ticket is matched against the nearest buckets
+first; the bucket window widens the longer a ticket waits, and both tickets'
+windows must cover the distance. One sweeper task expires stale tickets and
+retries tickets whose window has widened.
+
+Queues live in this process only, like the WebSocket connections.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import select
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import LeaderboardEntry
+from app.game_logic.multiplayer import MAX_SEATS
+
+# (min players, max players) per queueable mode
+MATCH_SIZES: Dict[str, Tuple[int, int]] = {
+    "pvp": (2, 2),
+    "multiplayer": (2, MAX_SEATS),
+}
+
+RATING_BUCKET = 100        # Rating points per bucket
+DEFAULT_RATING = 500       # Players without a wallet or any games
+WIDEN_EVERY_SECONDS = 10   # Window grows by one bucket each interval
+MAX_WINDOW = 5             # Buckets either side, once fully widened
+FILL_SECONDS = 20          # Start a multiplayer game below max size after this wait
+SWEEP_SECONDS = 2
+RESULT_TTL_SECONDS = 60    # How long finished tickets can still be polled
+
+
+def rating_from_stats(entry: Optional[LeaderboardEntry]) -> int:
+    """Smoothed win rate on a 0-1000 scale; new players sit in the middle"""
+    if not entry or not entry.total_games:
+        return DEFAULT_RATING
+    return round(1000 * ((entry.total_wins or 0) + 1) / (entry.total_games + 2))
+
+
+class QueueTicket:
+    __slots__ = (
+        "id", "mode", "player_name", "wallet_address", "rating", "bucket",
+        "enqueued_at", "resolved_at", "window", "status", "game_id", "player_id",
+        "error", "event",
+    )
+
+    def __init__(self, mode: str, player_name: str, wallet_address: Optional[str], rating: int):
+        self.id = str(uuid.uuid4())
+        self.mode = mode
+        self.player_name = player_name
+        self.wallet_address = wallet_address
+        self.rating = rating
+        self.bucket = rating // RATING_BUCKET
+        self.enqueued_at = time.monotonic()
+        self.resolved_at: Optional[float] = None
+        self.window = 0
+        self.status = "queued"  # queued, matching, matched, timeout, cancelled, failed
+        self.game_id: Optional[str] = None
+        self.player_id: Optional[str] = None
+        self.error: Optional[str] = None
+        self.event = asyncio.Event()
+
+    def window_at(self, now: float) -> int:
+        return min(MAX_WINDOW, int((now - self.enqueued_at) // WIDEN_EVERY_SECONDS))
+
+    def to_dict(self) -> Dict:
+        return {
+            "ticketId": self.id,
+            "mode": self.mode,
+            "status": self.status,
+            "rating": self.rating,
+            "waitedSeconds": round((self.resolved_at or time.monotonic()) - self.enqueued_at, 1),
+            "gameId": self.game_id,
+            "playerId": self.player_id,
+            "error": self.error,
+        }
+
+
+class Matchmaker:
+    """Process-wide matchmaking queues and their sweeper task"""
+
+    def __init__(self):
+        # mode -> bucket -> ticket id -> ticket, oldest first
+        self.queues: Dict[str, Dict[int, "OrderedDict[str, QueueTicket]"]] = {mode: {} for mode in MATCH_SIZES}
+        self.tickets: Dict[str, QueueTicket] = {}
+        # One live ticket per wallet
+        self.by_wallet: Dict[str, str] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    # Queue operations
+
+    async def enqueue(self, mode: str, player_name: str, wallet_address: Optional[str] = None) -> QueueTicket:
+        if mode not in MATCH_SIZES:
+            raise ValueError(f"Mode {mode} does not use matchmaking")
+        rating = await self._rating(wallet_address)
+        if wallet_address and wallet_address in self.by_wallet:
+            # Already queued (e.g. a retried request) - hand back the live ticket
+            return self.tickets[self.by_wallet[wallet_address]]
+
+        ticket = QueueTicket(mode, player_name, wallet_address, rating)
+        self.tickets[ticket.id] = ticket
+        if wallet_address:
+            self.by_wallet[wallet_address] = ticket.id
+        self.queues[mode].setdefault(ticket.bucket, OrderedDict())[ticket.id] = ticket
+        self._try_match(ticket, time.monotonic())
+        return ticket
+
+    def cancel(self, ticket_id: str) -> Optional[QueueTicket]:
+        ticket = self.tickets.get(ticket_id)
+        if ticket and ticket.status == "queued":
+            self._remove(ticket)
+            self._resolve(ticket, "cancelled")
+        return ticket
+
+    def get(self, ticket_id: str) -> Optional[QueueTicket]:
+        return self.tickets.get(ticket_id)
+
+    async def wait(self, ticket: QueueTicket, timeout: float) -> QueueTicket:
+        """Long-poll: return once the ticket resolves or after timeout seconds"""
+        if timeout > 0 and not ticket.event.is_set():
+            try:
+                await asyncio.wait_for(ticket.event.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return ticket
+
+    def stats(self) -> Dict:
+        return {
+            mode: sum(len(queue) for queue in buckets.values())
+            for mode, buckets in self.queues.items()
+        }
+
+    # Matching
+
+    async def _rating(self, wallet_address: Optional[str]) -> int:
+        if not wallet_address:
+            return DEFAULT_RATING
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(LeaderboardEntry).where(LeaderboardEntry.wallet_address == wallet_address)
+            )
+            return rating_from_stats(result.scalar_one_or_none())
+
+    def _remove(self, ticket: QueueTicket):
+        buckets = self.queues[ticket.mode]
+        queue = buckets.get(ticket.bucket)
+        if queue is not None:
+            queue.pop(ticket.id, None)
+            if not queue:
+                del buckets[ticket.bucket]
+
+    def _resolve(self, ticket: QueueTicket, status: str, error: Optional[str] = None):
+        ticket.status = status
+        ticket.error = error
+        ticket.resolved_at = time.monotonic()
+        if ticket.wallet_address and self.by_wallet.get(ticket.wallet_address) == ticket.id:
+            del self.by_wallet[ticket.wallet_address]
+        ticket.event.set()
+
+    def _try_match(self, ticket: QueueTicket, now: float) -> bool:
+        """Match ticket with the closest compatible tickets of its mode"""
+        min_players, max_players = MATCH_SIZES[ticket.mode]
+        buckets = self.queues[ticket.mode]
+        window = ticket.window = ticket.window_at(now)
+        group = [ticket]
+
+        for distance in range(window + 1):
+            for bucket in {ticket.bucket - distance, ticket.bucket + distance}:
+                queue = buckets.get(bucket)
+                if not queue:
+                    continue
+                for other in queue.values():
+                    if other is ticket:
+                        continue
+                    # Oldest first: once one candidate's window is too narrow, the rest are too
+                    if other.window_at(now) < distance:
+                        break
+                    group.append(other)
+                    if len(group) == max_players:
+                        break
+                if len(group) == max_players:
+                    break
+            if len(group) == max_players:
+                break
+
+        if len(group) < min_players:
+            return False
+        if len(group) < max_players:
+            oldest = min(t.enqueued_at for t in group)
+            if now - oldest < FILL_SECONDS:
+                return False
+
+        for member in group:
+            self._remove(member)
+            member.status = "matching"
+        task = asyncio.create_task(self._start_match(ticket.mode, group))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _start_match(self, mode: str, group: List[QueueTicket]):
+        """Create the game for a matched group; on failure the tickets fail rather than requeue"""
+        from app.services.game_service import GameService
+        try:
+            async with AsyncSessionLocal() as db:
+                game_data = await GameService(db).create_match_game(
+                    mode, [(t.player_name, t.wallet_address) for t in group]
+                )
+        except Exception as e:
+            print(f"❌ Matchmaking game creation failed: {e}")
+            for member in group:
+                self._resolve(member, "failed", str(e))
+            return
+
+        print(f"✅ Matched {len(group)} players into {mode} game {game_data['gameId']}")
+        for member, player_id in zip(group, game_data["playerIds"]):
+            member.game_id = game_data["gameId"]
+            member.player_id = player_id
+            self._resolve(member, "matched")
+
+    # Sweeper
+
+    def sweep(self, now: Optional[float] = None):
+        """Expire timed-out tickets, retry tickets whose window widened, drop old results"""
+        now = time.monotonic() if now is None else now
+        timeout = settings.LOBBY_TIMEOUT_SECONDS
+        for mode, buckets in self.queues.items():
+            can_fill = MATCH_SIZES[mode][0] < MATCH_SIZES[mode][1]
+            for queue in list(buckets.values()):
+                for ticket in list(queue.values()):
+                    if ticket.status != "queued":
+                        continue
+                    if now - ticket.enqueued_at >= timeout:
+                        self._remove(ticket)
+                        self._resolve(ticket, "timeout")
+                    elif ticket.window_at(now) != ticket.window or (
+                        can_fill and now - ticket.enqueued_at >= FILL_SECONDS
+                    ):
+                        self._try_match(ticket, now)
+
+        expired = [
+            ticket_id for ticket_id, ticket in self.tickets.items()
+            if ticket.resolved_at is not None and now - ticket.resolved_at >= RESULT_TTL_SECONDS
+        ]
+        for ticket_id in expired:
+            del self.tickets[ticket_id]
+
+    async def _sweep_loop(self):
+        while True:
+            await asyncio.sleep(SWEEP_SECONDS)
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"❌ Matchmaking sweep failed: {e}")
+
+    def start(self):
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep_loop())
+
+    def stop(self):
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+
+
+matchmaker = Matchmaker()
@@ -0,0 +1,247 @@
+"""
+Multiplayer Service - live pvp/multiplayer tables with coalesced persistence
+
+Tables are loaded once into memory (see game_logic/multiplayer.py) and moves
+are applied there under a per-game lock. Changed tables are written back in
+one transaction per flush interval rather than one per move; a finished game
+is flushed immediately and dropped from memory.
+
+Like the WebSocket connections, live tables belong to this worker process.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+from sqlalchemy import select
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import Game, Player, GameState
+from app.game_logic.multiplayer import TableGame
+from app.services.event_service import EventService
+from app.services.leaderboard_service import LeaderboardService
+from app.services.turn_timer_service import turn_timers
+
+TABLE_MODES = ("pvp", "multiplayer", "tournament")
+FLUSH_SECONDS = 1.0
+
+
+class TableEngine:
+    """Process-wide cache of live tables and their write-behind flusher"""
+
+    def __init__(self):
+        self.tables: Dict[str, TableGame] = {}
+        self.locks: Dict[str, asyncio.Lock] = {}
+        self._dirty: Set[str] = set()
+        # One flush at a time, so two flushes never write the same queued events
+        self._flush_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+        # Called with each finished table once its result is stored
+        self._finish_listeners: List[Callable[[TableGame], Awaitable[None]]] = []
+
+    def on_finish(self, listener: Callable[[TableGame], Awaitable[None]]):
+        if listener not in self._finish_listeners:
+            self._finish_listeners.append(listener)
+
+    def loaded(self, game_id: str) -> Optional[TableGame]:
+        return self.tables.get(game_id)
+
+    async def get(self, game_id: str) -> TableGame:
+        """Live table, loading it from the database on first use; only playing tables stay cached"""
+        table = self.tables.get(game_id)
+        if table is not None:
+            return table
+        async with self._lock(game_id):
+            table = self.tables.get(game_id)
+            if table is None:
+                async with AsyncSessionLocal() as db:
+                    table = await self._load(db, game_id)
+                if table.status == "playing":
+                    self.tables[game_id] = table
+        return table
+
+    async def act(self, game_id: str, player_id: str, action: str) -> Dict:
+        """Apply a move and return {"result", "state"}; raises ValueError for illegal moves"""
+        table = await self.get(game_id)
+        async with self._lock(game_id):
+            result = table.apply(player_id, action)
+            state = await self._moved(table)
+        return {"result": result, "state": state}
+
+    async def _moved(self, table: TableGame) -> Dict:
+        """Bookkeeping after a move (call under the game's lock); returns the new view"""
+        self._dirty.add(table.game_id)
+        state = table.view()
+        if table.status == "finished":
+            turn_timers.cancel(("table", table.game_id))
+            await self.flush([table.game_id])
+        else:
+            self.arm(table.game_id, table.current_seat.player_id, table.current_round)
+        return state
+
+    async def abandon(self, game_id: str) -> Optional[Dict]:
+        """Finish a stale table now (see reaper_service.py); returns the final view"""
+        try:
+            table = await self.get(game_id)
+        except LookupError:
+            return None
+        async with self._lock(game_id):
+            if table.status != "playing":
+                return None
+            table.abandon()
+            return await self._moved(table)
+
+    def is_dirty(self, game_id: str) -> bool:
+        """True if the table has moves not yet flushed"""
+        return game_id in self._dirty
+
+    # Turn timeouts
+
+    def arm(self, game_id: str, player_id: Optional[str] = None, round_number: Optional[int] = None):
+        """(Re)start the turn clock; player_id/round_number pin the turn it applies to"""
+        turn_timers.schedule(
+            ("table", game_id),
+            settings.TURN_TIMEOUT_SECONDS,
+            lambda: self._expire_turn(game_id, player_id, round_number)
+        )
+
+    async def _expire_turn(self, game_id: str, player_id: Optional[str], round_number: Optional[int]):
+        """Auto-stack (or, after MAX_IDLE_TURNS, forfeit) the idle seat and push the new state"""
+        from app.websockets.game_ws import manager
+        try:
+            table = await self.get(game_id)
+        except LookupError:
+            return
+        async with self._lock(game_id):
+            if table.status != "playing":
+                return
+            seat = table.current_seat
+            if player_id is not None and (seat.player_id != player_id or table.current_round != round_number):
+                return  # The turn moved on while this timer was firing
+            print(f"⏰ Turn timed out for {seat.name} in game {game_id}")
+            table.time_out(seat.player_id, settings.MAX_IDLE_TURNS)
+            state = await self._moved(table)
+        await manager.publish_state(state, game_id)
+
+    def _lock(self, game_id: str) -> asyncio.Lock:
+        lock = self.locks.get(game_id)
+        if lock is None:
+            lock = self.locks[game_id] = asyncio.Lock()
+        return lock
+
+    async def _load(self, db, game_id: str) -> TableGame:
+        result = await db.execute(select(Game).where(Game.id == game_id))
+        game = result.scalar_one_or_none()
+        if not game or game.mode not in TABLE_MODES:
+            raise LookupError("Game not found")
+        result = await db.execute(
+            select(Player).where(Player.game_id == game_id).order_by(Player.joined_at)
+        )
+        players = result.scalars().all()
+        result = await db.execute(select(GameState).where(GameState.game_id == game_id))
+        return TableGame.from_rows(game, players, result.scalar_one())
+
+    # Persistence
+
+    async def flush(self, game_ids=None):
+        """Write dirty tables (or the given ones) back in a single transaction"""
+        async with self._flush_lock:
+            game_ids = [g for g in (game_ids if game_ids is not None else list(self._dirty)) if g in self._dirty]
+            if not game_ids:
+                return
+            self._dirty.difference_update(game_ids)
+            written = []
+            try:
+                async with AsyncSessionLocal() as db:
+                    events = EventService(db)
+                    for game_id in game_ids:
+                        table = self.tables.get(game_id)
+                        if table is not None:
+                            written.append((table, await self._write(db, events, table)))
+                    await db.commit()
+            except Exception as e:
+                print(f"❌ Table flush failed, will retry: {e}")
+                self._dirty.update(game_ids)
+                return
+
+            for table, event_count in written:
+                # Moves made during the flush queued more events behind these
+                del table.events[:event_count]
+                if table.status == "finished" and table.game_id not in self._dirty:
+                    await self._record_result(table)
+                    self.evict(table.game_id)
+                    for listener in self._finish_listeners:
+                        try:
+                            await listener(table)
+                        except Exception as e:
+                            print(f"❌ Finish listener failed for game {table.game_id}: {e}")
+
+    async def _write(self, db, events: EventService, table: TableGame) -> int:
+        """Copy a table onto its rows and queue its pending events; returns how many were queued"""
+        result = await db.execute(select(Game).where(Game.id == table.game_id))
+        game = result.scalar_one()
+        game.status = table.status
+        game.current_round = table.current_round
+        game.winner_id = table.winner_id
+
+        result = await db.execute(select(Player).where(Player.game_id == table.game_id))
+        players = {p.id: p for p in result.scalars().all()}
+        for seat in table.seats:
+            player = players.get(seat.player_id)
+            if player is not None:
+                player.score = seat.score
+                player.turn_score = seat.turn_score
+                player.is_active = seat.active
+
+        result = await db.execute(select(GameState).where(GameState.game_id == table.game_id))
+        state = result.scalar_one()
+        state.current_player_id = table.current_seat.player_id
+        state.current_card_id = table.current_card_id
+        state.last_roll = table.last_roll
+        state.ape_in_active = table.ape_in_active
+        state.used_bearish_mask = table.used_bearish_mask
+        state.rng_counter = table.rng.counter
+
+        pending = list(table.events)
+        for event_type, player_id, data in pending:
+            await events.append(table.game_id, event_type, player_id, data)
+        if table.status == "finished":
+            await events.append_snapshot(game, list(players.values()), state)
+        return len(pending)
+
+    async def _record_result(self, table: TableGame):
+        """Leaderboard win for the winner (non-critical, like single-player games)"""
+        if not table.winner_id:
+            return
+        async with AsyncSessionLocal() as db:
+            try:
+                result = await db.execute(select(Player).where(Player.id == table.winner_id))
+                winner = result.scalar_one()
+                outcome = await LeaderboardService(db).update_player_stats(winner, won=True, game_score=winner.score)
+                if outcome.get("success"):
+                    await db.commit()
+            except Exception as e:
+                print(f"❌ Warning: Failed to update leaderboard: {e}")
+                await db.rollback()
+
+    def evict(self, game_id: str):
+        turn_timers.cancel(("table", game_id))
+        self.tables.pop(game_id, None)
+        self.locks.pop(game_id, None)
+        self._dirty.discard(game_id)
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(FLUSH_SECONDS)
+            await self.flush()
+
+    def start(self):
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        await self.flush()
+
+
+table_engine = TableEngine()
@@ -0,0 +1,186 @@
+"""
+Reaper Service - close abandoned games and evict their in-memory state
+
+Open games (waiting/playing) are found through the (status, updated_at) index.
+Game rows are not touched by every move, so each candidate's newest game event
+is checked too; games with recent events just get their updated_at caught up.
+Truly stale games are closed in one transaction per batch:
+- single-player games are forfeited to the bot,
+- lobbies that never filled are closed without a winner,
+- live tables finish through the table engine (leader on points wins), so
+  results, leaderboards and tournament brackets update as for any finish.
+Their state versions, turn timers and sockets are then dropped, along with
+sockets that have gone quiet and the state versions of finished games nobody
+is watching.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+from sqlalchemy import select, func
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import Game, Player, GameEvent
+from app.services.event_service import EventService
+from app.services.multiplayer_service import TABLE_MODES, table_engine
+from app.services.turn_timer_service import clear_turn_timeout
+from app.websockets.game_ws import manager
+from app.websockets.state_codec import state_versions
+
+OPEN_STATUSES = ("waiting", "playing")
+
+
+def stale_after(mode: str) -> int:
+    thresholds = settings.STALE_GAME_SECONDS
+    return thresholds.get(mode, thresholds.get("default", 3600))
+
+
+class GameReaper:
+    """Background sweep over idle games, with running totals as metrics"""
+
+    def __init__(self):
+        self.metrics: Dict[str, float] = {
+            "runs": 0,
+            "games_forfeited": 0,      # Single-player games given to the bot
+            "lobbies_closed": 0,       # Waiting games that never started
+            "tables_finished": 0,      # Live tables ended on points
+            "games_refreshed": 0,      # Candidates that turned out to be active
+            "states_evicted": 0,       # State version histories dropped
+            "sockets_closed": 0,
+            "last_run_ms": 0,
+        }
+        self._task: Optional[asyncio.Task] = None
+
+    def _count(self, name: str, amount: int = 1):
+        self.metrics[name] = self.metrics.get(name, 0) + amount
+
+    async def reap(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """One sweep; returns this sweep's counts"""
+        started = time.perf_counter()
+        now = now or datetime.utcnow()
+        before = dict(self.metrics)
+
+        closed: List[str] = []
+        skipped: Set[str] = set()
+        for modes, exclude, seconds in self._thresholds():
+            cutoff = now - timedelta(seconds=seconds)
+            while True:
+                batch, more = await self._reap_batch(cutoff, modes, exclude, skipped)
+                closed.extend(batch)
+                if not more:
+                    break
+
+        for game_id in closed:
+            clear_turn_timeout(game_id)
+            table_engine.evict(game_id)
+            self._count("sockets_closed", await manager.close_game(game_id))
+        # Histories of live games back the /delta pollers too; only ended games lose theirs
+        for game_id in list(state_versions.history):
+            if game_id in closed or (state_versions.is_finished(game_id) and not manager.active_connections.get(game_id)):
+                state_versions.forget(game_id)
+                self._count("states_evicted")
+        self._count("sockets_closed", await manager.close_idle(settings.SOCKET_IDLE_SECONDS))
+
+        self._count("runs")
+        self.metrics["last_run_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        counts = {
+            name: int(self.metrics[name] - before.get(name, 0))
+            for name in self.metrics if name not in ("runs", "last_run_ms")
+        }
+        if any(counts.values()):
+            print(f"🧹 Reaper: {', '.join(f'{name}={count}' for name, count in counts.items() if count)}")
+        return counts
+
+    def _thresholds(self):
+        """(modes, excluded modes, seconds) per threshold; the default covers every unlisted mode"""
+        listed = [mode for mode in settings.STALE_GAME_SECONDS if mode != "default"]
+        groups = [([mode], None, settings.STALE_GAME_SECONDS[mode]) for mode in listed]
+        groups.append((None, listed, stale_after("default")))
+        return groups
+
+    async def _reap_batch(
+        self,
+        cutoff: datetime,
+        modes: Optional[List[str]],
+        exclude: Optional[List[str]],
+        skipped: Set[str]
+    ):
+        """Close up to REAPER_BATCH_SIZE games idle since before cutoff; returns (closed ids, more left)"""
+        batch_size = settings.REAPER_BATCH_SIZE
+        tables: List[str] = []
+        closed: List[str] = []
+
+        async with AsyncSessionLocal() as db:
+            query = select(Game).where(Game.status.in_(OPEN_STATUSES), Game.updated_at < cutoff)
+            if modes:
+                query = query.where(Game.mode.in_(modes))
+            if exclude:
+                query = query.where(Game.mode.notin_(exclude))
+            if skipped:
+                query = query.where(Game.id.notin_(skipped))
+            result = await db.execute(query.order_by(Game.updated_at).limit(batch_size))
+            candidates = result.scalars().all()
+            if not candidates:
+                return [], False
+
+            ids = [g.id for g in candidates]
+            result = await db.execute(
+                select(GameEvent.game_id, func.max(GameEvent.created_at))
+                .where(GameEvent.game_id.in_(ids))
+                .group_by(GameEvent.game_id)
+            )
+            activity = dict(result.all())
+            result = await db.execute(select(Player).where(Player.game_id.in_(ids), Player.is_ai == True))
+            bots = {p.game_id: p.id for p in result.scalars().all()}
+
+            events = EventService(db)
+            for game in candidates:
+                last_at = activity.get(game.id)
+                if last_at and last_at >= cutoff:
+                    # Moves don't touch the game row; catch updated_at up instead
+                    game.updated_at = last_at
+                    self._count("games_refreshed")
+                    continue
+                if game.mode in TABLE_MODES and game.status == "playing":
+                    if table_engine.is_dirty(game.id):
+                        skipped.add(game.id)  # Moves not flushed yet, so it isn't idle
+                    else:
+                        tables.append(game.id)
+                    continue
+                game.winner_id = bots.get(game.id) if game.status == "playing" else None
+                self._count("games_forfeited" if game.status == "playing" else "lobbies_closed")
+                game.status = "finished"
+                await events.append(game.id, "forfeit", data={"status": game.status, "winner": game.winner_id})
+                closed.append(game.id)
+            await db.commit()
+
+        for game_id in tables:
+            state = await table_engine.abandon(game_id)
+            if state is None:
+                skipped.add(game_id)
+                continue
+            await manager.publish_state(state, game_id)
+            self._count("tables_finished")
+            closed.append(game_id)
+        return closed, len(candidates) == batch_size
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(settings.REAPER_INTERVAL_SECONDS)
+            try:
+                await self.reap()
+            except Exception as e:
+                print(f"❌ Reaper sweep failed: {e}")
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+reaper = GameReaper()
@@ -0,0 +1,36 @@
+"""
+Secret Service - game RNG secret for deploys that don't configure one
+
+GAME_RNG_SECRET keys every game's random stream, and game ids are public, so a
+guessable secret would make draws predictable. When it isn't set, a random
+secret is generated on first start and stored in the database; later starts
+and other workers load the same one, so streams survive restarts.
+"""
+
+import secrets
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.game_logic.rng import use_stored_secret
+from app.models import ServerSecret
+
+RNG_SECRET_NAME = "game_rng"
+
+
+async def load_rng_secret(db: AsyncSession):
+    """Make the RNG secret available to GameRng (call once at startup)"""
+    if settings.GAME_RNG_SECRET:
+        print("🔐 Using configured GAME_RNG_SECRET")
+        return
+    row = await db.get(ServerSecret, RNG_SECRET_NAME)
+    if row is None:
+        db.add(ServerSecret(name=RNG_SECRET_NAME, value=secrets.token_hex(32)))
+        try:
+            await db.commit()
+            print("🔐 Generated a game RNG secret and stored it in the database")
+        except IntegrityError:
+            await db.rollback()  # Another worker stored one first
+        result = await db.execute(select(ServerSecret).where(ServerSecret.name == RNG_SECRET_NAME))
+        row = result.scalar_one()
+    use_stored_secret(row.value)
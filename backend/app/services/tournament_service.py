@@ -1,18 +1,50 @@
 """
 Tournament Service - Handles tournament bracket management
 
-This is a placeholder for future tournament functionality.
-Tournament features to implement:
-- Bracket generation
-- Match scheduling
-- Advancement logic
-- Tournament leaderboards
-- Prize distribution
+Brackets come from game_logic/brackets.py and are stored as TournamentMatch
+rows. Every match whose two entrants are known gets its own tournament-mode
+game straight away, so independent matches are played concurrently. When a
+game finishes, the table engine calls advance_finished_game and the bracket
+moves on from that one result; nothing waits for the rest of the round except
+Swiss pairing, which needs the full round's standings.
+
+Advancement for a tournament is serialized with an in-process lock, like the
+live tables themselves.
 """
 
+import asyncio
+from datetime import datetime
 from typing import List, Dict, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models import Game, Player
+from sqlalchemy import select
+from app.database import AsyncSessionLocal
+from app.models import Tournament, TournamentEntrant, TournamentMatch
+from app.game_logic import brackets
+from app.game_logic.brackets import BYE, SWISS, BRACKET_TYPES
+from app.game_logic.multiplayer import TableGame
+
+TOURNAMENT_MODE = "tournament"
+MIN_PLAYERS = 2
+MAX_PLAYERS = 256
+
+# Bracket display order
+BRACKET_ORDER = {brackets.WINNERS: 0, brackets.LOSERS: 1, brackets.GRAND_FINAL: 2, brackets.SWISS_ROUND: 3}
+
+# tournament id -> lock guarding its bracket
+_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _lock(tournament_id: str) -> asyncio.Lock:
+    lock = _locks.get(tournament_id)
+    if lock is None:
+        lock = _locks[tournament_id] = asyncio.Lock()
+    return lock
+
+
+def _release(tournament: Tournament):
+    """Drop a completed tournament's lock (call after leaving it); nothing changes its bracket again"""
+    if tournament.status == "completed":
+        _locks.pop(tournament.id, None)
 
 
 class TournamentService:
@@ -25,18 +57,31 @@ class TournamentService:
         self,
         name: str,
         max_players: int,
-        entry_fee: Optional[int] = None
+        entry_fee: Optional[int] = None,
+        bracket_type: str = brackets.SINGLE_ELIMINATION,
+        swiss_rounds: Optional[int] = None
     ) -> Dict:
-        """
-        Create a new tournament
-        
-        TODO: Implement tournament creation with:
-        - Bracket generation (single/double elimination)
-        - Player registration
-        - Entry fee handling
-        - Prize pool calculation
-        """
-        raise NotImplementedError("Tournament mode coming soon!")
+        """Create a new tournament open for registration"""
+        if bracket_type not in BRACKET_TYPES:
+            raise ValueError(f"Unknown bracket type {bracket_type}")
+        if not MIN_PLAYERS <= max_players <= MAX_PLAYERS:
+            raise ValueError(f"max_players must be between {MIN_PLAYERS} and {MAX_PLAYERS}")
+        if swiss_rounds is not None and (bracket_type != SWISS or swiss_rounds < 1):
+            raise ValueError("swiss_rounds needs a swiss bracket and at least one round")
+
+        tournament = Tournament(
+            name=name,
+            max_players=max_players,
+            current_players=0,
+            bracket_type=bracket_type,
+            swiss_rounds=swiss_rounds,
+            current_round=0,
+            entry_fee=entry_fee,
+            prize_pool=0
+        )
+        self.db.add(tournament)
+        await self.db.commit()
+        return await self.get_tournament_status(tournament.id)
 
     async def join_tournament(
         self,
@@ -44,20 +89,63 @@ class TournamentService:
         player_name: str,
         wallet_address: Optional[str] = None
     ) -> Dict:
-        """
-        Join an existing tournament
-        
-        TODO: Implement player registration
-        """
-        raise NotImplementedError("Tournament mode coming soon!")
+        """Register for a tournament; seeds follow registration order"""
+        async with _lock(tournament_id):
+            tournament = await self._tournament(tournament_id)
+            if tournament.status != "registration":
+                raise PermissionError("Tournament registration is closed")
+            if tournament.current_players >= tournament.max_players:
+                raise PermissionError("Tournament is full")
+            entrants = await self._entrants(tournament_id)
+            if wallet_address and any(e.wallet_address == wallet_address for e in entrants):
+                raise PermissionError("Already registered")
+
+            entrant = TournamentEntrant(
+                tournament_id=tournament_id,
+                name=player_name,
+                wallet_address=wallet_address,
+                seed=len(entrants) + 1
+            )
+            self.db.add(entrant)
+            tournament.current_players = len(entrants) + 1
+            tournament.prize_pool = (tournament.prize_pool or 0) + (tournament.entry_fee or 0)
+            await self.db.commit()
+
+        return {**await self.get_tournament_status(tournament_id), "entrantId": entrant.id}
 
     async def start_tournament(self, tournament_id: str) -> Dict:
-        """
-        Start tournament and generate first round matches
-        
-        TODO: Implement bracket initialization
-        """
-        raise NotImplementedError("Tournament mode coming soon!")
+        """Close registration, build the bracket and start every playable match"""
+        async with _lock(tournament_id):
+            tournament = await self._tournament(tournament_id)
+            if tournament.status != "registration":
+                raise PermissionError("Tournament already started")
+            entrants = await self._entrants(tournament_id)
+            if len(entrants) < MIN_PLAYERS:
+                raise PermissionError(f"Need at least {MIN_PLAYERS} players to start")
+
+            entrant_ids = [e.id for e in entrants]
+            if tournament.bracket_type == SWISS:
+                tournament.swiss_rounds = tournament.swiss_rounds or brackets.swiss_round_count(len(entrants))
+                tournament.current_round = 1
+                specs = brackets.swiss_round(1, brackets.swiss_pairings(entrant_ids, set(), set()))
+            elif tournament.bracket_type == brackets.DOUBLE_ELIMINATION:
+                specs = brackets.double_elimination(entrant_ids)
+            else:
+                specs = brackets.single_elimination(entrant_ids)
+
+            matches = {key: self._match_row(tournament_id, spec) for key, spec in specs.items()}
+            self.db.add_all(matches.values())
+            tournament.status = "in_progress"
+            tournament.started_at = datetime.utcnow()
+
+            for match in brackets.resolve_byes(matches):
+                self._touch(match)
+            await self._progress(tournament, entrants, matches)
+            await self.db.commit()
+        _release(tournament)
+
+        print(f"🏆 Tournament {tournament.name} started with {len(entrants)} players ({tournament.bracket_type})")
+        return await self.get_tournament_status(tournament_id)
 
     async def advance_winner(
         self,
@@ -65,75 +153,260 @@ class TournamentService:
         match_id: str,
         winner_id: str
     ) -> Dict:
-        """
-        Advance winner to next round
-        
-        TODO: Implement advancement logic
-        """
-        raise NotImplementedError("Tournament mode coming soon!")
+        """Record a match result (winner is an entrant id) and advance the bracket"""
+        async with _lock(tournament_id):
+            tournament = await self._tournament(tournament_id)
+            if tournament.status != "in_progress":
+                raise PermissionError("Tournament is not in progress")
+            entrants = await self._entrants(tournament_id)
+            matches = await self._matches(tournament_id)
+            match = next((m for m in matches.values() if m.id == match_id), None)
+            if match is None:
+                raise LookupError("Match not found")
+
+            await self._report(tournament, entrants, matches, match.key, winner_id)
+            await self.db.commit()
+        _release(tournament)
+
+        return await self.get_tournament_status(tournament_id)
+
+    async def on_game_finished(self, game_id: str, winner_seat_id: Optional[str]) -> bool:
+        """Advance the bracket for a finished match game; False if it is not a live match"""
+        result = await self.db.execute(
+            select(TournamentMatch.tournament_id).where(TournamentMatch.game_id == game_id)
+        )
+        tournament_id = result.scalar_one_or_none()
+        if tournament_id is None:
+            return False
+
+        async with _lock(tournament_id):
+            tournament = await self._tournament(tournament_id)
+            entrants = await self._entrants(tournament_id)
+            matches = await self._matches(tournament_id)
+            match = next((m for m in matches.values() if m.game_id == game_id), None)
+            if match is None or match.status != "in_progress":
+                # Already decided by hand
+                return False
+
+            # Nobody left standing (or a draw on points) goes to the higher seed
+            winner_id = match.player2_id if winner_seat_id == match.player2_seat_id else match.player1_id
+            await self._report(tournament, entrants, matches, match.key, winner_id)
+            await self.db.commit()
+        _release(tournament)
+        return True
 
     async def get_tournament_status(self, tournament_id: str) -> Dict:
-        """
-        Get current tournament status and bracket
-        
-        TODO: Implement status retrieval
-        """
-        raise NotImplementedError("Tournament mode coming soon!")
-
-
-# Future tournament models to add to models/game.py:
-"""
-class Tournament(Base):
-    __tablename__ = "tournaments"
-    
-    id = Column(String, primary_key=True)
-    name = Column(String, nullable=False)
-    max_players = Column(Integer, nullable=False)
-    current_players = Column(Integer, default=0)
-    status = Column(String, default="registration")  # registration, in_progress, completed
-    bracket_type = Column(String, default="single_elimination")
-    entry_fee = Column(Integer, nullable=True)
-    prize_pool = Column(Integer, default=0)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    started_at = Column(DateTime, nullable=True)
-    completed_at = Column(DateTime, nullable=True)
-
-
-class TournamentMatch(Base):
-    __tablename__ = "tournament_matches"
-    
-    id = Column(String, primary_key=True)
-    tournament_id = Column(String, ForeignKey("tournaments.id"))
-    round_number = Column(Integer, nullable=False)
-    match_number = Column(Integer, nullable=False)
-    player1_id = Column(String, ForeignKey("players.id"))
-    player2_id = Column(String, ForeignKey("players.id"))
-    winner_id = Column(String, nullable=True)
-    game_id = Column(String, ForeignKey("games.id"), nullable=True)
-    status = Column(String, default="pending")  # pending, in_progress, completed
-"""
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+        """Get current tournament status, standings and bracket"""
+        tournament = await self._tournament(tournament_id)
+        entrants = await self._entrants(tournament_id)
+        matches = sorted(
+            (await self._matches(tournament_id)).values(),
+            key=lambda m: (BRACKET_ORDER.get(m.bracket, 9), m.round_number, m.match_number)
+        )
+        names = {e.id: e.name for e in entrants}
+        names[BYE] = "BYE"
+
+        standings = []
+        if tournament.bracket_type == SWISS:
+            points = {e: (p, b) for e, p, b in brackets.swiss_standings([e.id for e in entrants], matches)}
+            entrants = sorted(entrants, key=lambda e: (-points[e.id][0], -points[e.id][1], e.seed))
+        for entrant in entrants:
+            row = {
+                "id": entrant.id,
+                "name": entrant.name,
+                "seed": entrant.seed,
+                "wins": entrant.wins or 0,
+                "losses": entrant.losses or 0,
+                "eliminated": bool(entrant.eliminated),
+            }
+            if tournament.bracket_type == SWISS:
+                row["points"], row["buchholz"] = points[entrant.id]
+            standings.append(row)
+
+        return {
+            "tournamentId": tournament.id,
+            "name": tournament.name,
+            "status": tournament.status,
+            "bracketType": tournament.bracket_type,
+            "maxPlayers": tournament.max_players,
+            "currentPlayers": tournament.current_players or 0,
+            "currentRound": tournament.current_round or 0,
+            "swissRounds": tournament.swiss_rounds,
+            "entryFee": tournament.entry_fee,
+            "prizePool": tournament.prize_pool or 0,
+            "winner": names.get(tournament.winner_id),
+            "winnerId": tournament.winner_id,
+            "entrants": standings,
+            "matches": [
+                {
+                    "matchId": m.id,
+                    "key": m.key,
+                    "bracket": m.bracket,
+                    "round": m.round_number,
+                    "match": m.match_number,
+                    "player1": {"id": m.player1_id, "name": names.get(m.player1_id), "playerId": m.player1_seat_id},
+                    "player2": {"id": m.player2_id, "name": names.get(m.player2_id), "playerId": m.player2_seat_id},
+                    "winnerId": m.winner_id,
+                    "status": m.status,
+                    "gameId": m.game_id,
+                }
+                for m in matches
+            ],
+        }
+
+    # Bracket progress
+
+    async def _report(
+        self,
+        tournament: Tournament,
+        entrants: List[TournamentEntrant],
+        matches: Dict[str, TournamentMatch],
+        key: str,
+        winner_id: str
+    ):
+        for match in brackets.report(matches, key, winner_id):
+            self._touch(match)
+        await self._progress(tournament, entrants, matches)
 
+    def _touch(self, match: TournamentMatch):
+        if match.status == "completed" and match.completed_at is None:
+            match.completed_at = datetime.utcnow()
 
+    async def _progress(
+        self,
+        tournament: Tournament,
+        entrants: List[TournamentEntrant],
+        matches: Dict[str, TournamentMatch]
+    ):
+        """Recount records, finish the tournament or start newly playable matches"""
+        self._tally(tournament, entrants, matches.values())
+
+        if tournament.bracket_type == SWISS:
+            if all(m.status == "completed" for m in matches.values()):
+                if tournament.current_round >= tournament.swiss_rounds:
+                    standings = brackets.swiss_standings([e.id for e in entrants], matches.values())
+                    self._finish(tournament, standings[0][0])
+                    return
+                self._pair_swiss_round(tournament, entrants, matches)
+        else:
+            champion = brackets.champion(matches)
+            if champion is not None:
+                self._finish(tournament, champion)
+                return
+
+        await self._start_matches(entrants, matches)
+
+    def _tally(self, tournament: Tournament, entrants: List[TournamentEntrant], matches):
+        """Wins, losses and elimination from completed matches (byes count as wins)"""
+        records = {e.id: [0, 0] for e in entrants}
+        for match in matches:
+            if match.status != "completed":
+                continue
+            if match.winner_id in records and match.loser_id is not None:
+                records[match.winner_id][0] += 1
+            if match.loser_id in records:
+                records[match.loser_id][1] += 1
+        lives = {brackets.SINGLE_ELIMINATION: 1, brackets.DOUBLE_ELIMINATION: 2}.get(tournament.bracket_type)
+        for entrant in entrants:
+            entrant.wins, entrant.losses = records[entrant.id]
+            entrant.eliminated = lives is not None and entrant.losses >= lives
+
+    def _pair_swiss_round(
+        self,
+        tournament: Tournament,
+        entrants: List[TournamentEntrant],
+        matches: Dict[str, TournamentMatch]
+    ):
+        standings = [e for e, _, _ in brackets.swiss_standings([e.id for e in entrants], matches.values())]
+        played = {
+            frozenset((m.player1_id, m.player2_id)) for m in matches.values()
+            if BYE not in (m.player1_id, m.player2_id)
+        }
+        had_bye = {m.player1_id for m in matches.values() if m.player2_id == BYE}
+        tournament.current_round += 1
+        specs = brackets.swiss_round(tournament.current_round, brackets.swiss_pairings(standings, played, had_bye))
+        new_matches = {key: self._match_row(tournament.id, spec) for key, spec in specs.items()}
+        self.db.add_all(new_matches.values())
+        matches.update(new_matches)
+        for match in brackets.resolve_byes(new_matches):
+            self._touch(match)
+
+    async def _start_matches(self, entrants: List[TournamentEntrant], matches: Dict[str, TournamentMatch]):
+        """Create a game for every match whose players are known and that has none yet"""
+        from app.services.game_service import GameService
+        by_id = {e.id: e for e in entrants}
+        games = GameService(self.db)
+        for match in matches.values():
+            if not brackets.is_playable(match) or match.game_id:
+                continue
+            first, second = by_id[match.player1_id], by_id[match.player2_id]
+            game, seats = await games.add_match_game(
+                TOURNAMENT_MODE,
+                [(first.name, first.wallet_address), (second.name, second.wallet_address)]
+            )
+            match.game_id = game.id
+            match.player1_seat_id = seats[0].id
+            match.player2_seat_id = seats[1].id
+            match.status = "in_progress"
+
+    def _finish(self, tournament: Tournament, winner_id: str):
+        tournament.status = "completed"
+        tournament.winner_id = winner_id
+        tournament.completed_at = datetime.utcnow()
+        print(f"🏆 Tournament {tournament.name} completed")
+
+    # Loading
+
+    def _match_row(self, tournament_id: str, spec: brackets.BracketMatch) -> TournamentMatch:
+        return TournamentMatch(
+            tournament_id=tournament_id,
+            key=spec.key,
+            bracket=spec.bracket,
+            round_number=spec.round_number,
+            match_number=spec.match_number,
+            player1_id=spec.player1_id,
+            player2_id=spec.player2_id,
+            status=spec.status,
+            next_key=spec.next_key,
+            next_slot=spec.next_slot,
+            loser_key=spec.loser_key,
+            loser_slot=spec.loser_slot
+        )
+
+    async def _tournament(self, tournament_id: str) -> Tournament:
+        result = await self.db.execute(
+            select(Tournament).where(Tournament.id == tournament_id).execution_options(populate_existing=True)
+        )
+        tournament = result.scalar_one_or_none()
+        if not tournament:
+            raise LookupError("Tournament not found")
+        return tournament
+
+    async def _entrants(self, tournament_id: str) -> List[TournamentEntrant]:
+        result = await self.db.execute(
+            select(TournamentEntrant)
+            .where(TournamentEntrant.tournament_id == tournament_id)
+            .order_by(TournamentEntrant.seed)
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+
+    async def _matches(self, tournament_id: str) -> Dict[str, TournamentMatch]:
+        result = await self.db.execute(
+            select(TournamentMatch)
+            .where(TournamentMatch.tournament_id == tournament_id)
+            .execution_options(populate_existing=True)
+        )
+        return {m.key: m for m in result.scalars().all()}
+
+
+async def advance_finished_game(table: TableGame):
+    """Table engine finish listener: feed finished tournament games back into their bracket"""
+    if table.mode != TOURNAMENT_MODE:
+        return
+    async with AsyncSessionLocal() as db:
+        try:
+            await TournamentService(db).on_game_finished(table.game_id, table.winner_id)
+        except Exception as e:
+            print(f"❌ Tournament advance failed for game {table.game_id}: {e}")
+            await db.rollback()
@@ -0,0 +1,164 @@
+"""
+Turn Timer Service - one scheduler for every turn timeout in the process
+
+Timers live in a single heap ordered by deadline and are fired by one
+background task, so a live game costs a heap entry rather than a sleeping
+task. Scheduling is O(log n). Cancelling or re-arming a key only drops it from
+the live index (O(1)); its stale heap entry is skipped when it surfaces, and
+the heap is rebuilt if stale entries start to dominate.
+
+Callbacks run as their own tasks so a slow one never delays the next deadline.
+Like the live tables, timers belong to this worker process.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import Game, Player
+
+TimerCallback = Callable[[], Awaitable[None]]
+
+COMPACT_MIN = 1024  # Don't bother rebuilding small heaps
+
+
+class TurnTimers:
+    """Deadline heap plus the task that fires it"""
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        # key -> (deadline, sequence, callback); only entries listed here are live
+        self._live: Dict[Hashable, Tuple[float, int, TimerCallback]] = {}
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._fired: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def schedule(self, key: Hashable, delay: float, callback: TimerCallback):
+        """Fire callback after delay seconds, replacing any timer already set for key"""
+        deadline = time.monotonic() + delay
+        sequence = next(self._sequence)
+        self._live[key] = (deadline, sequence, callback)
+        earliest = self._heap[0][0] if self._heap else None
+        heapq.heappush(self._heap, (deadline, sequence, key))
+        if (earliest is None or deadline < earliest) and self._wakeup is not None:
+            self._wakeup.set()
+        if len(self._heap) > COMPACT_MIN and len(self._heap) > 2 * len(self._live):
+            self._compact()
+
+    def cancel(self, key: Hashable) -> bool:
+        return self._live.pop(key, None) is not None
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        """Seconds until key fires, or None if it isn't scheduled"""
+        entry = self._live.get(key)
+        return max(0.0, entry[0] - time.monotonic()) if entry else None
+
+    def _compact(self):
+        self._heap = [(deadline, sequence, key) for key, (deadline, sequence, _) in self._live.items()]
+        heapq.heapify(self._heap)
+
+    def fire_due(self, now: Optional[float] = None) -> int:
+        """Start the callbacks of every timer due by now; returns how many fired"""
+        now = time.monotonic() if now is None else now
+        fired = 0
+        while self._heap and self._heap[0][0] <= now:
+            deadline, sequence, key = heapq.heappop(self._heap)
+            entry = self._live.get(key)
+            if entry is None or entry[1] != sequence:
+                continue  # Cancelled or re-armed since
+            del self._live[key]
+            task = asyncio.create_task(self._run(key, entry[2]))
+            self._fired.add(task)
+            task.add_done_callback(self._fired.discard)
+            fired += 1
+        return fired
+
+    async def _run(self, key: Hashable, callback: TimerCallback):
+        try:
+            await callback()
+        except Exception as e:
+            print(f"❌ Turn timeout handler failed for {key}: {e}")
+
+    async def _run_loop(self):
+        while True:
+            self.fire_due()
+            self._wakeup.clear()
+            timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        if self._runner is None:
+            self._wakeup = asyncio.Event()
+            self._runner = asyncio.create_task(self._run_loop())
+
+    def stop(self):
+        if self._runner is not None:
+            self._runner.cancel()
+            self._runner = None
+            self._wakeup = None
+
+
+turn_timers = TurnTimers()
+
+# Single-player (vs bot) games: consecutive timed-out turns per game
+_idle_turns: Dict[str, int] = {}
+
+
+def arm_turn_timeout(game_id: str, acted: bool = True):
+    """(Re)start the human player's turn clock in a single-player game; acted resets the idle count"""
+    if acted:
+        _idle_turns.pop(game_id, None)
+    turn_timers.schedule(("game", game_id), settings.TURN_TIMEOUT_SECONDS, lambda: _expire_turn(game_id))
+
+
+def clear_turn_timeout(game_id: str):
+    turn_timers.cancel(("game", game_id))
+    _idle_turns.pop(game_id, None)
+
+
+async def _expire_turn(game_id: str):
+    """Auto-stack for an idle human; forfeit after MAX_IDLE_TURNS timeouts in a row"""
+    from app.services.game_service import GameService
+    from app.websockets.game_ws import manager
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(Game).where(Game.id == game_id))
+        game = result.scalar_one_or_none()
+        if not game or game.status != "playing":
+            _idle_turns.pop(game_id, None)
+            return
+        result = await db.execute(
+            select(Player).where(Player.game_id == game_id, Player.is_ai == False)
+        )
+        player = result.scalar_one_or_none()
+        if not player:
+            return
+
+        service = GameService(db)
+        idle = _idle_turns[game_id] = _idle_turns.get(game_id, 0) + 1
+        if idle >= settings.MAX_IDLE_TURNS:
+            print(f"⏰ Player {player.name} idle for {idle} turns, forfeiting game {game_id}")
+            await service.forfeit(game_id)
+            _idle_turns.pop(game_id, None)
+        else:
+            print(f"⏰ Turn timed out for {player.name} in game {game_id}, auto-stacking")
+            game_data = await service.stack_sats(game_id, player.id)
+            if game_data["status"] == "playing":
+                arm_turn_timeout(game_id, acted=False)
+            else:
+                _idle_turns.pop(game_id, None)
+
+        if manager.active_connections.get(game_id):
+            await manager.publish_state(await service.get_game_data(game_id), game_id)
@@ -0,0 +1,70 @@
+"""
+Static Assets - /assets with long-lived caching for the hashed build
+
+Files under build/ (see asset_pipeline.py) never change content at a given
+URL, so they are served with an immutable one-year Cache-Control and a
+content-hash ETag; a returning browser doesn't even revalidate. A request for
+a card's hashed JPEG is answered with its AVIF or WebP variant when the
+Accept header allows it (Vary: Accept), so clients get the smaller format
+without knowing the variant URLs. Everything else under /assets keeps the
+same URL across deploys and is revalidated with If-None-Match.
+"""
+
+import os
+from typing import Dict, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from app.asset_pipeline import VARIANT_TYPES
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "public, no-cache"
+
+
+class AssetFiles(StaticFiles):
+    """StaticFiles with immutable caching and Accept negotiation for the hashed build"""
+
+    def __init__(self, *, directory: str, manifest: Optional[Dict] = None, **kwargs):
+        super().__init__(directory=directory, **kwargs)
+        self.build_dir = os.path.realpath(os.path.join(directory, "build"))
+        # Hashed JPEG name -> {variant key: file name} for negotiation
+        self.variants: Dict[str, Dict[str, str]] = {}
+        for entry in ((manifest or {}).get("cards") or {}).values():
+            self.variants[entry["jpg"]] = {key: entry[key] for key in VARIANT_TYPES if key in entry}
+
+    def _negotiate(self, full_path: str, scope: Scope) -> Tuple[str, bool]:
+        """Best variant of full_path for the request's Accept header, and whether it was negotiated"""
+        variants = self.variants.get(os.path.basename(full_path))
+        if not variants:
+            return full_path, False
+        accept = Headers(scope=scope).get("accept", "")
+        for key, media_type in VARIANT_TYPES.items():
+            if key in variants and (media_type in accept or key == "jpg"):
+                return os.path.join(os.path.dirname(full_path), variants[key]), True
+        return full_path, True
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope, status_code: int = 200) -> Response:
+        full_path = str(full_path)
+        hashed = os.path.realpath(full_path).startswith(self.build_dir + os.sep)
+        negotiated = False
+        if hashed:
+            variant_path, negotiated = self._negotiate(full_path, scope)
+            if variant_path != full_path:
+                full_path, stat_result = variant_path, os.stat(variant_path)
+
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        if hashed:
+            # The file name carries the content hash, so it is the strongest possible validator
+            response.headers["etag"] = f'"{os.path.basename(full_path)}"'
+            response.headers["cache-control"] = IMMUTABLE
+            if negotiated:
+                response.headers["vary"] = "Accept"
+        else:
+            response.headers["cache-control"] = REVALIDATE
+
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
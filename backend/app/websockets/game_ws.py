@@ -1,6 +1,17 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Dict, List
+from typing import Dict, List, Tuple
 import json
+import time
+from app.database import AsyncSessionLocal
+from app.services import GameService
+from app.services.multiplayer_service import table_engine
+from app.websockets.state_codec import (
+    ENCODING_MSGPACK,
+    state_versions,
+    negotiate_encoding,
+    encode_frame,
+    decode_frame,
+)
 
 router = APIRouter()
 
@@ -11,15 +22,30 @@ active_connections: Dict[str, List[WebSocket]] = {}
 class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, List[WebSocket]] = {}
+        # Per-socket wire encoding and last state version the client acknowledged
+        self.encodings: Dict[WebSocket, str] = {}
+        self.acked_versions: Dict[WebSocket, int] = {}
+        # Monotonic time of each socket's last inbound message, for idle eviction
+        self.last_seen: Dict[WebSocket, float] = {}
 
     async def connect(self, websocket: WebSocket, game_id: str):
-        await websocket.accept()
+        # Clients opt into MessagePack via the "msgpack" subprotocol or ?encoding=msgpack
+        subprotocols = websocket.scope.get("subprotocols", [])
+        requested = ENCODING_MSGPACK if ENCODING_MSGPACK in subprotocols else websocket.query_params.get("encoding")
+        encoding = negotiate_encoding(requested)
+        # Only echo a subprotocol back if the client offered it
+        await websocket.accept(subprotocol=encoding if encoding in subprotocols else None)
+        self.encodings[websocket] = encoding
+        self.last_seen[websocket] = time.monotonic()
         if game_id not in self.active_connections:
             self.active_connections[game_id] = []
         self.active_connections[game_id].append(websocket)
 
     def disconnect(self, websocket: WebSocket, game_id: str):
-        if game_id in self.active_connections:
+        self.encodings.pop(websocket, None)
+        self.acked_versions.pop(websocket, None)
+        self.last_seen.pop(websocket, None)
+        if websocket in self.active_connections.get(game_id, []):
             self.active_connections[game_id].remove(websocket)
             if not self.active_connections[game_id]:
                 del self.active_connections[game_id]
@@ -27,6 +53,66 @@ class ConnectionManager:
     async def send_personal_message(self, message: str, websocket: WebSocket):
         await websocket.send_text(message)
 
+    async def send_frame(self, frame: Dict, websocket: WebSocket):
+        encoded = encode_frame(frame, self.encodings.get(websocket, "json"))
+        if isinstance(encoded, bytes):
+            await websocket.send_bytes(encoded)
+        else:
+            await websocket.send_text(encoded)
+
+    async def send_state(self, game_data: Dict, game_id: str, websocket: WebSocket):
+        """Send only what changed since this client's last acknowledged version"""
+        frame = state_versions.build_frame(game_id, game_data, self.acked_versions.get(websocket))
+        await self.send_frame(frame, websocket)
+
+    async def publish_state(self, game_data: Dict, game_id: str):
+        """Push a state update to every client watching the game.
+        Clients on the same acked version and encoding share one encoded frame."""
+        encoded: Dict[Tuple, str | bytes] = {}
+        for connection in list(self.active_connections.get(game_id, [])):
+            key = (self.acked_versions.get(connection), self.encodings.get(connection, "json"))
+            if key not in encoded:
+                frame = state_versions.build_frame(game_id, game_data, key[0])
+                encoded[key] = encode_frame(frame, key[1])
+            data = encoded[key]
+            try:
+                if isinstance(data, bytes):
+                    await connection.send_bytes(data)
+                else:
+                    await connection.send_text(data)
+            except Exception as e:
+                print(f"WebSocket send failed: {e}")
+                self.disconnect(connection, game_id)
+
+    async def close_game(self, game_id: str, code: int = 1000) -> int:
+        """Close every socket watching a game; returns how many were closed"""
+        connections = list(self.active_connections.get(game_id, []))
+        for connection in connections:
+            self.disconnect(connection, game_id)
+            try:
+                await connection.close(code=code)
+            except Exception:
+                pass  # Already gone
+        return len(connections)
+
+    async def close_idle(self, max_idle_seconds: float) -> int:
+        """Close sockets that have sent nothing (not even an ack or ping) for max_idle_seconds"""
+        cutoff = time.monotonic() - max_idle_seconds
+        closed = 0
+        for game_id, connections in list(self.active_connections.items()):
+            for connection in list(connections):
+                if self.last_seen.get(connection, 0) < cutoff:
+                    self.disconnect(connection, game_id)
+                    try:
+                        await connection.close(code=1001)
+                    except Exception:
+                        pass
+                    closed += 1
+        return closed
+
+    def connection_count(self) -> int:
+        return sum(len(connections) for connections in self.active_connections.values())
+
     async def broadcast(self, message: str, game_id: str):
         if game_id in self.active_connections:
             for connection in self.active_connections[game_id]:
@@ -36,14 +122,52 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
+async def _load_game_data(game_id: str) -> Dict:
+    async with AsyncSessionLocal() as db:
+        return await GameService(db).get_game_data(game_id)
+
+
 @router.websocket("/{game_id}")
 async def websocket_endpoint(websocket: WebSocket, game_id: str):
     await manager.connect(websocket, game_id)
     try:
         while True:
-            data = await websocket.receive_text()
-            message = json.loads(data)
-            
+            received = await websocket.receive()
+            if received["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(received.get("code", 1000))
+            data = received.get("bytes") if received.get("bytes") is not None else received.get("text")
+            message = decode_frame(data)
+            manager.last_seen[websocket] = time.monotonic()
+
+            # {"type": "ping"} - keepalive for clients with nothing else to send
+            if message.get("type") == "ping":
+                await manager.send_frame({"type": "pong"}, websocket)
+                continue
+
+            # {"type": "ack", "v": n} - client applied version n
+            if message.get("type") == "ack":
+                manager.acked_versions[websocket] = message.get("v")
+                continue
+
+            # {"type": "sync", "v": n} - client wants the delta from version n
+            if message.get("type") == "sync":
+                if message.get("v") is not None:
+                    manager.acked_versions[websocket] = message.get("v")
+                game_data = await _load_game_data(game_id)
+                await manager.send_state(game_data, game_id, websocket)
+                continue
+
+            # {"type": "move", "playerId": ..., "action": "draw|roll|stack|leave"} - pvp/multiplayer tables
+            if message.get("type") == "move":
+                try:
+                    outcome = await table_engine.act(game_id, message.get("playerId"), message.get("action"))
+                except (LookupError, ValueError) as e:
+                    await manager.send_frame({"type": "error", "message": str(e)}, websocket)
+                    continue
+                await manager.send_frame({"type": "move_result", **outcome["result"]}, websocket)
+                await manager.publish_state(outcome["state"], game_id)
+                continue
+
             # Echo message to all clients in the game
             await manager.broadcast(json.dumps({
                 "type": "game_update",
@@ -54,28 +178,3 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
     except Exception as e:
         print(f"WebSocket error: {e}")
         manager.disconnect(websocket, game_id)
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
@@ -0,0 +1,123 @@
+"""
+State Codec - Compact delta encoding for game state updates
+
+Clients acknowledge the last state version they applied; the server then only
+sends the fields that changed since that version. Cards travel as catalogue
+ids (see /api/cards) instead of full dicts with image URLs.
+
+Versions only ever increase, per game and across forget() or a restart: a
+game's numbering starts from the clock in milliseconds, so a client's old
+"since" can never name a different state that reused its number.
+
+Frames are plain dicts:
+    {"type": "state", "v": 7, "base": 5, "set": {"lastRoll": 4}}
+"base" is None when the frame is a full snapshot.
+"""
+
+import json
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from app.game_logic import get_card_id
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional - clients fall back to JSON
+    msgpack = None
+
+# How many past versions to keep per game for computing deltas
+HISTORY_SIZE = 16
+
+ENCODING_JSON = "json"
+ENCODING_MSGPACK = "msgpack"
+
+
+def compact_state(game_data: Dict) -> Dict:
+    """Replace the full current card dict with its catalogue id"""
+    compact = dict(game_data)
+    compact["currentCardId"] = get_card_id(compact.pop("currentCard", None))
+    return compact
+
+
+def diff_state(old: Dict, new: Dict) -> Dict:
+    """Fields in new whose values differ from old"""
+    return {key: value for key, value in new.items() if key not in old or old[key] != value}
+
+
+class StateVersionStore:
+    """Keeps the last few compact states per game, tagged with versions"""
+
+    def __init__(self, history_size: int = HISTORY_SIZE):
+        self.history_size = history_size
+        self.history: Dict[str, Deque[Tuple[int, Dict]]] = {}
+        self._last_version = 0  # Highest version handed out, for any game
+
+    def _first_version(self) -> int:
+        """Starting version for a game with no history (new, forgotten or from before a restart)"""
+        return max(int(time.time() * 1000), self._last_version + 1)
+
+    def record(self, game_id: str, game_data: Dict) -> Tuple[int, Dict]:
+        """Record a state, bumping the version only if it changed"""
+        state = compact_state(game_data)
+        versions = self.history.get(game_id)
+        if versions is None:
+            versions = deque(maxlen=self.history_size)
+            self.history[game_id] = versions
+        if versions and versions[-1][1] == state:
+            return versions[-1]
+        version = versions[-1][0] + 1 if versions else self._first_version()
+        self._last_version = max(self._last_version, version)
+        versions.append((version, state))
+        return version, state
+
+    def get(self, game_id: str, version: Optional[int]) -> Optional[Dict]:
+        """Look up a past state, or None if it has aged out"""
+        if version is None:
+            return None
+        for stored_version, state in self.history.get(game_id, ()):
+            if stored_version == version:
+                return state
+        return None
+
+    def build_frame(self, game_id: str, game_data: Dict, ack_version: Optional[int] = None) -> Dict:
+        """Frame with only the fields changed since ack_version (full if unknown)"""
+        version, state = self.record(game_id, game_data)
+        base_state = self.get(game_id, ack_version)
+        if base_state is None:
+            return {"type": "state", "v": version, "base": None, "set": state}
+        return {"type": "state", "v": version, "base": ack_version, "set": diff_state(base_state, state)}
+
+    def is_finished(self, game_id: str) -> bool:
+        """True if the game's latest recorded state is final"""
+        versions = self.history.get(game_id)
+        return bool(versions) and versions[-1][1].get("status") == "finished"
+
+    def forget(self, game_id: str):
+        """Drop a game's history; its next version still continues upward"""
+        self.history.pop(game_id, None)
+
+
+def negotiate_encoding(requested: Optional[str]) -> str:
+    """MessagePack if asked for and available, JSON otherwise"""
+    if requested == ENCODING_MSGPACK and msgpack is not None:
+        return ENCODING_MSGPACK
+    return ENCODING_JSON
+
+
+def encode_frame(frame: Dict, encoding: str = ENCODING_JSON) -> str | bytes:
+    if encoding == ENCODING_MSGPACK:
+        return msgpack.packb(frame, use_bin_type=True)
+    return json.dumps(frame, separators=(",", ":"))
+
+
+def decode_frame(data: str | bytes) -> Dict:
+    if isinstance(data, bytes):
+        if msgpack is None:
+            raise ValueError("msgpack frames are not supported on this server")
+        return msgpack.unpackb(data, raw=False)
+    return json.loads(data)
+
+
+# Shared across REST and WebSocket handlers in this worker
+state_versions = StateVersionStore()
@@ -16,6 +16,10 @@ from app.database import init_db
 asyncio.run(init_db())
 "
 
+# Build hashed card images (skips unchanged ones)
+echo "🖼️ Building card assets..."
+python -m app.asset_pipeline
+
 # Run the server
 echo "✅ Starting FastAPI server..."
 python -m uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
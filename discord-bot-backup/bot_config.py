@@ -16,3 +16,13 @@ INTENTS.messages = True
 INTENTS.guilds = True
 INTENTS.message_content = True
 INTENTS.members = True
+
+# Sharding: set by launcher.py for each process (SHARD_IDS like "0,1"); unset lets discord.py pick the count
+SHARD_OPTIONS = {}
+if os.getenv("SHARD_COUNT"):
+    SHARD_OPTIONS["shard_count"] = int(os.environ["SHARD_COUNT"])
+    if os.getenv("SHARD_IDS"):
+        SHARD_OPTIONS["shard_ids"] = [int(i) for i in os.environ["SHARD_IDS"].split(",")]
+
+# Private channel that stores uploaded card images (see utils/card_assets.py); unset keeps the hosted images
+CARD_ASSETS_CHANNEL_ID = int(os.getenv("CARD_ASSETS_CHANNEL_ID", "0")) or None
@@ -1,17 +1,18 @@
 from datetime import datetime
 import discord
-import asyncio
 from discord.ext import commands
 
 from game_logic.aida_game import AidaGame
 from views.delete_thread_view import DeleteThreadView
-from views.draw_card_view import DrawCardView
-from views.dice_roll_view import DiceRollView
-from views.stack_options_view import StackOptionsView
+from views.turn_actions import DrawCardButtons, DiceRollButtons, StackOptionsButtons, register_turn_handler, solo_turn_handler
 from utils.post_results import post_results_to_channel
 from utils.score_utils import format_score_message
 from utils.thread_manager import close_game_thread
 from utils.timeout_handler import TimeoutHandler
+from utils.outbound import outbox
+from utils.game_board import GameBoard
+from utils.game_registry import games
+from utils.checkpoints import checkpoints, restore_game
 from utils.leaderboard_store import record_game_result
 
 
@@ -21,8 +22,11 @@ class AidaBot(commands.Cog):
         Initializes the AidaBot cog.
         """
         self.bot = bot
-        self.active_games = {}
         self.timeout_handler = TimeoutHandler()
+        # Backed by the shared registry; ending a game clears its turn timer
+        self.active_games = games.mode("aida", on_user_end=self.timeout_handler.remove_tracker)
+        register_turn_handler("aida", solo_turn_handler(self))  # Persistent turn buttons land here
+        checkpoints.register_restorer("aida", self.resume_game)
         self.IDLE_TIMEOUT = 120
         self.ROUND_LIMIT = 20
         self.WINNING_SCORE = 300
@@ -35,7 +39,7 @@ class AidaBot(commands.Cog):
         player_id = user.id
         player_name = player_name or user.display_name
 
-        if player_id in self.active_games:
+        if games.for_user(player_id):  # One active game per user, across all modes
             await interaction.followup.send("🟡 You already have a game in progress!", ephemeral=True)
             return
 
@@ -51,7 +55,8 @@ class AidaBot(commands.Cog):
         self.active_games[player_id] = {
             "game": game,
             "thread": thread,
-            "player_name": player_name
+            "player_name": player_name,
+            "board": self.new_board(game, thread, player_name),
         }
 
         intro = [
@@ -62,10 +67,35 @@ class AidaBot(commands.Cog):
             "Let us begin..."
         ]
         for line in intro:
-            await thread.send(line)
+            await outbox(thread).send(line)
 
         await self.begin_player_turn(player_id)
 
+    def new_board(self, game: AidaGame, thread, player_name) -> GameBoard:
+        return GameBoard(thread, f"🎮 {player_name} vs Aida", lambda: [
+            ("🔄 Round", f"{game.round_count}/{self.ROUND_LIMIT}"),
+            (f"👤 {game.player_name}", f"`{game.player_score} sats` (turn: {game.player_turn_score})"),
+            ("🤖 Aida", f"`{game.aida_score} sats`"),
+        ])
+
+    async def resume_game(self, thread, user_ids, state):
+        """
+        Rebuilds a checkpointed game after a restart and replays the player's turn start.
+        """
+        player_id = user_ids[0]
+        player_name = state["data"]["player_name"]
+        game = restore_game(AidaGame, state["game"], bot=self.bot, interaction=None, thread=thread, player_user=None)
+        board = self.new_board(game, thread, player_name)
+        board.restore(state["board"])
+        board.log.append("♻️ Resumed after a restart")
+        self.active_games[player_id] = {
+            "game": game,
+            "thread": thread,
+            "player_name": player_name,
+            "board": board,
+        }
+        await self.begin_player_turn(player_id)
+
     async def begin_player_turn(self, player_id):
         """
         Starts the player's turn.
@@ -73,18 +103,20 @@ class AidaBot(commands.Cog):
         thread = self.active_games[player_id]["thread"]
         game = self.active_games[player_id]["game"]
 
+        # Turn boundary: checkpoint before the round advances, so a restore replays this turn start
+        checkpoints.save(self.active_games.entry(player_id))
+
         # Increment round counter
         game.round_count += 1
 
-        # Show round info
-        await thread.send(f"🔄 **Round {game.round_count}/{self.ROUND_LIMIT}**")
-        await thread.send(f"🎴 **{game.player_name}'s Turn**: Click to draw your card.")
-
-        view = DrawCardView(
-            player_id=player_id,
-            on_draw_callback=self.on_player_draw
+        # Round info and the draw button live on the board
+        view = DrawCardButtons.prompt(self.active_games[player_id])
+        await self.active_games[player_id]["board"].update(
+            prompt=f"🎴 **{game.player_name}'s Turn**: Click to draw your card.",
+            view=view,
+            card=None,
+            roll=None
         )
-        await thread.send(view=view)
 
         user = self.bot.get_user(player_id)
         await self.timeout_handler.start_turn_timeout(
@@ -102,50 +134,41 @@ class AidaBot(commands.Cog):
 
         game = self.active_games[user_id]["game"]
         thread = self.active_games[user_id]["thread"]
+        board = self.active_games[user_id]["board"]
 
         # Step 1: Draw the card
         card, draw_type = game.player_draw()
 
-        # Step 2: Display the card
-        if card.filename:
-            await thread.send(content="You drew a card:",
-                            embed=discord.Embed().set_image(
-                                url=f"https://thecryptorabbithole.io/risk_reward/cards/{card.filename}"))
-        else:
-            await thread.send("You drew a card with no image.")
+        # Step 2: Show the card on the board
+        await board.update(card=card, log=f"🎴 You drew {card!r}")
 
         # Step 3: Handle "Ape In!" logic
         if draw_type == "ape_in":
-            await thread.send("🦍 **Ape In!**: Your next value card will have double points!")
-            await asyncio.sleep(2)  # Pause before drawing the next card
+            await board.update(log="🦍 **Ape In!**: Your next value card will have double points!")
+            outbox(thread).pause(2)  # Paced by the outbox; the draw itself doesn't wait
             next_card, next_draw_type = game.player_draw()
 
-            # Display the next card
-            if next_card.filename:
-                await thread.send(content="You drew a card:",
-                                embed=discord.Embed().set_image(
-                                    url=f"https://thecryptorabbithole.io/risk_reward/cards/{next_card.filename}"))
-            else:
-                await thread.send("You drew a card with no image.")
+            # Show the next card
+            await board.update(card=next_card, log=f"🎴 You drew {next_card!r}")
 
             if next_card.type in ["Cipher", "Oracle", "Historacle"]:
                 next_card = game.ape_in_effect.apply_effect(next_card)  # Apply the "Ape In!" effect
-                await thread.send(f"🦍 **Ape In! Effect**: The value of this card is doubled to {next_card.value} points!")
+                await board.update(log=f"🦍 **Ape In! Effect**: The value of this card is doubled to {next_card.value} points!")
                 await self.initiate_dice_roll(user_id, next_card, thread)
             elif next_card.type == "Bearish":
                 # Negate "Ape In!" and handle bearish card
                 game.ape_in_active = False  # Reset the "Ape In!" effect
-                await thread.send("⚠️ The next card is a Bearish card. Negating 'Ape In!' and applying penalty.")
+                await board.update(log="⚠️ The next card is a Bearish card. Negating 'Ape In!' and applying penalty.")
                 success, roll, phrase = game.handle_bearish(next_card, is_player=True)
                 if success:
-                    await thread.send(f"🛡️ You dodged the bearish penalty! You rolled a {roll}.")
+                    await board.update(log=f"🛡️ You dodged the bearish penalty! You rolled a {roll}.", roll=roll)
                     await self.offer_stack_options(user_id)
                 else:
-                    await thread.send(f"💥 Bearish penalty applied! You rolled a {roll}. {phrase}")
+                    await board.milestone(f"💥 Bearish penalty applied! You rolled a {roll}. {phrase}")
                     await self.aida_turn(user_id)
             else:
                 # Handle non-value, non-bearish cards
-                await thread.send("⚠️ The next card is not a value card. Resuming normal gameplay.")
+                await board.update(log="⚠️ The next card is not a value card. Resuming normal gameplay.")
                 await self.begin_player_turn(user_id)
            
         else:
@@ -156,13 +179,9 @@ class AidaBot(commands.Cog):
         """
         Initiates a dice roll for the given card.
         """
-        game = self.active_games[user_id]["game"]
-        view = DiceRollView(
-            player_id=user_id,
-             on_roll_callback=lambda player_id, roll_result: self.on_roll_dice(user_id, card, roll_result),
-            player_name=game.player_name
-        )
-        await thread.send("🎲 Click to roll the dice!", view=view)
+        data = self.active_games[user_id]
+        data["pending_card"] = card  # The roll button resolves against this card
+        await data["board"].update(prompt="🎲 Click to roll the dice!", view=DiceRollButtons.prompt(data))
 
     async def on_roll_dice(self, user_id, card, roll_result):
         """
@@ -170,82 +189,76 @@ class AidaBot(commands.Cog):
         """
         game = self.active_games[user_id]["game"]
         thread = self.active_games[user_id]["thread"]
+        board = self.active_games[user_id]["board"]
 
         try:
             outcome, roll = roll_result  # Unpack only two values
         except Exception as e:
             print(f"ERROR: Failed to unpack roll_result: {e}")
-            await thread.send("❌ An error occurred while processing your dice roll. Please try again.")
+            await outbox(thread).send("❌ An error occurred while processing your dice roll. Please try again.")
             return
 
         if outcome == "success":
             if game.ape_in_active:
                 game.player_turn_score += card.value
-                await thread.send(f"✅ **Ape In!** You've successfully doubled your card's value and earned {card.value} sats! Your turn score is now **{game.player_turn_score}**.")
+                await board.update(log=f"✅ **Ape In!** You've successfully doubled your card's value and earned {card.value} sats! Your turn score is now **{game.player_turn_score}**.", roll=roll)
                 game.ape_in_active = False  # Reset the "Ape In!" effect
             else:
                 game.player_turn_score += card.value
-                await thread.send(f"✅ You've successfully earned {card.value} sats! Your turn score is now **{game.player_turn_score}**.")
+                await board.update(log=f"✅ You've successfully earned {card.value} sats! Your turn score is now **{game.player_turn_score}**.", roll=roll)
             await self.offer_stack_options(user_id)
         else:
             game.player_turn_score = 0  # Reset turn score on failure
-            await thread.send(f"💥 You rolled a 1 and got rekt! No sats gained.")
+            await board.update(log=f"💥 You rolled a 1 and got rekt! No sats gained.", roll=roll)
             game.ape_in_active = False  # Reset the "Ape In!" effect
             await self.aida_turn(user_id)
 
     async def on_player_roll(self, user_id, interaction):
         game = self.active_games[user_id]["game"]
-        thread = self.active_games[user_id]["thread"]
+        board = self.active_games[user_id]["board"]
 
         result = game.player_roll()
 
         if result[0] == "rekt!":
             game.player_turn_score = 0  # Reset turn score on rekt
-            await thread.send("💥 You rolled a 1! Turn rekt!. No sats gained.")
+            await board.update(log="💥 You rolled a 1! Turn rekt!. No sats gained.")
             await self.aida_turn(user_id)
 
         elif result[0] == "Rekt!":
             roll, phrase = result[1], result[2]  # Extract the roll and phrase
             game.player_turn_score = 0  # Reset turn score for bearish penalty
-            await thread.send(f"⚠️ You rolled a {roll}. {phrase if phrase else ''}")
+            await board.milestone(f"⚠️ You rolled a {roll}. {phrase if phrase else ''}")
             await self.aida_turn(user_id)
 
         elif result[0] == "dodged":
             roll, phrase = result[1], result[2]  # Extract the roll and phrase
-            await thread.send(f"🛡️ {phrase if phrase else ''} You rolled a {roll}. Continue drawing or stack your sats.")
+            await board.update(log=f"🛡️ {phrase if phrase else ''} You rolled a {roll}. Continue drawing or stack your sats.")
             await self.offer_stack_options(user_id)
 
         elif result[0] == "success":
             # Check if "Ape In!" was active
             if game.ape_in_active:
-                await thread.send(f"✅ You rolled a {result[1]}! **Ape In!** effect applied. Turn sats: **{game.player_turn_score}**.")
+                await board.update(log=f"✅ You rolled a {result[1]}! **Ape In!** effect applied. Turn sats: **{game.player_turn_score}**.")
                 game.ape_in_active = False  # Reset the "Ape In!" effect
             else:
-                await thread.send(f"✅ You rolled a {result[1]}! Turn sats: **{game.player_turn_score}**.")
+                await board.update(log=f"✅ You rolled a {result[1]}! Turn sats: **{game.player_turn_score}**.")
             await self.offer_stack_options(user_id)
 
     async def offer_stack_options(self, user_id):
         """
         Offers the player options to continue their turn.
         """
-        thread = self.active_games[user_id]["thread"]
-        view = StackOptionsView(
-            player_id=user_id,
-            on_draw_callback=self.on_player_draw,
-            on_stack_callback=self.on_player_stack,
-            on_forfeit_callback=self.on_player_forfeit
-        )
-        await thread.send("➕ Choose your next move:", view=view)
+        view = StackOptionsButtons.prompt(self.active_games[user_id])
+        await self.active_games[user_id]["board"].update(prompt="➕ Choose your next move:", view=view)
 
     async def on_player_stack(self, user_id, interaction):
         """
         Handles the player's decision to stack their sats.
         """
-        thread = self.active_games[user_id]["thread"]
         game = self.active_games[user_id]["game"]
 
         won = game.player_stack()
-        await thread.send(f"📥 You stacked your sats. Total: **{game.player_score}**")
+        await self.active_games[user_id]["board"].update(log=f"📥 You stacked your sats. Total: **{game.player_score}**", view=None)
 
         if won or game.is_game_over():
             await self.end_game(user_id)
@@ -256,20 +269,14 @@ class AidaBot(commands.Cog):
         """
         Handles Aida's turn.
         """
-        thread = self.active_games[user_id]["thread"]
         game = self.active_games[user_id]["game"]
 
-        await thread.send("🤖 Aida is drawing cards...")
+        board = self.active_games[user_id]["board"]
+        await board.update(prompt="🤖 Aida is drawing cards...", view=None, card=None, roll=None)
 
         actions, aida_won = game.aida_play_turn()
-        for msg in actions:
-            await thread.send(msg)
-
-        await thread.send(
-            f"🧮 **Scores Update**\n"
-            f"👤 {game.player_name}: `{game.player_score} sats`\n"
-            f"🤖 Aida: `{game.aida_score} sats`"
-        )
+        board.log.extend(actions)
+        await board.update()  # One edit for the whole turn; the board carries the new scores
 
         if aida_won or game.is_game_over():
             await self.end_game(user_id)
@@ -295,13 +302,15 @@ class AidaBot(commands.Cog):
         else:
             winner = "Draw"
 
-        # Post results to the thread
-        await thread.send(
+        # Post results to the thread and close the board
+        board = self.active_games[user_id]["board"]
+        await board.milestone(
             f"🎮 Final Scores:\n"
             f"👤 {player_name}: `{player_score} sats`\n"
             f"🤖 Aida: `{aida_score} sats`\n"
             f"🏆 Winner: {winner}"
         )
+        await board.finish(prompt=f"🏆 Winner: {winner}")
 
         # Record the game result
         try:
@@ -331,12 +340,11 @@ class AidaBot(commands.Cog):
 
         # Add the "Delete Thread" button
         delete_thread_view = DeleteThreadView(thread)
-        await thread.send("🗑️ Use the button below to delete this thread:", view=delete_thread_view)
+        await outbox(thread).send("🗑️ Use the button below to delete this thread:", view=delete_thread_view)
 
         # Clean up the game
         await close_game_thread(thread)
         self.active_games.pop(user_id, None)
-        self.timeout_handler.remove_tracker(user_id)
 
     async def on_player_forfeit(self, user_id, interaction):
         """
@@ -346,7 +354,9 @@ class AidaBot(commands.Cog):
         game = self.active_games[user_id]["game"]
         player_name = self.active_games[user_id]["player_name"]
 
-        await thread.send("🏳️ You forfeited the match. Aida wins by default.")
+        board = self.active_games[user_id]["board"]
+        await board.milestone("🏳️ You forfeited the match. Aida wins by default.")
+        await board.finish()
 
         try:
             await post_results_to_channel(
@@ -362,7 +372,6 @@ class AidaBot(commands.Cog):
 
         await close_game_thread(thread)
         self.active_games.pop(user_id, None)
-        self.timeout_handler.remove_tracker(user_id)
 
     async def handle_idle_forfeit(self, user_id):
         """
@@ -372,12 +381,12 @@ class AidaBot(commands.Cog):
             return
 
         # Retrieve the game and thread information
-        thread = self.active_games[user_id]["thread"]
         player_name = self.active_games[user_id]["player_name"]
         game = self.active_games[user_id]["game"]
 
+        self.active_games[user_id]["awaiting"] = ()  # The turn buttons no longer apply
         # Notify the player and reset their turn score
-        await thread.send(f"🕒 {player_name}, you were idle too long. Your turn has ended, and Aida will now play.")
+        await self.active_games[user_id]["board"].update(log=f"🕒 {player_name}, you were idle too long. Your turn has ended, and Aida will now play.", view=None)
         game.player_turn_score = 0  # Reset the player's turn score
 
         # Move to Aida's turn
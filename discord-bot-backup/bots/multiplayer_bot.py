@@ -7,27 +7,45 @@ from game_logic.multiplayer_game import MultiplayerGame
 from utils.post_results import post_results_to_channel
 from utils.thread_manager import close_game_thread
 from views.multiplayer_join_view import MultiplayerJoinView
-from views.multiplayer_draw_card_view import MultiplayerDrawCardView
-from views.dice_roll_view import DiceRollView
-from views.stack_options_view import StackOptionsView
+from views.turn_actions import DrawCardButtons, DiceRollButtons, StackOptionsButtons, TurnHandler, register_turn_handler
 from views.start_game_view import StartGameView
 from utils.timeout_handler import TimeoutHandler
+from utils.outbound import outbox
+from utils.channel_registry import channels
+from utils.game_board import GameBoard
+from utils.game_registry import games
+from utils.checkpoints import checkpoints, restore_game
 from utils.leaderboard_store import record_game_result, save_db  # Leaderboard utilities
 
-active_multiplayer_games = {}
+# Keyed by any player's id (the initiator's id doubles as the game id); backed by the shared registry
+active_multiplayer_games = games.mode("multiplayer")
 
 
 class MultiplayerBot(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.timeout_handler = TimeoutHandler()
+        active_multiplayer_games.on_user_end = self.timeout_handler.remove_tracker
+        # The initiator registered the game first, so user_ids[0] is the game id
+        register_turn_handler("multiplayer", TurnHandler(
+            current_player=lambda entry: entry.game.current_player().user_id,
+            on_draw=lambda entry, interaction: self.handle_draw_card(entry.user_ids[0], interaction.user.id, interaction),
+            on_roll=lambda entry, interaction: self.handle_roll_dice(entry.user_ids[0], interaction.user.id, interaction),
+            on_stack=lambda entry, interaction: self.handle_stack_points(entry.user_ids[0], interaction.user.id, interaction),
+            on_forfeit=lambda entry, interaction: self.handle_forfeit_turn(entry.user_ids[0], interaction.user.id),
+        ))
+        checkpoints.register_restorer("multiplayer", self.resume_game)
 
     async def start_multiplayer_lobby(self, interaction: discord.Interaction):
         print(f"🔍 start_multiplayer_lobby called for user ID: {interaction.user.id}")
         """Starts a multiplayer lobby."""
+        if games.for_user(interaction.user.id):  # One active game per user, across all modes
+            await interaction.response.send_message("🟡 You already have a game in progress!", ephemeral=True)
+            return
+
         try:
             # Get the #multiplayer-requests channel
-            multiplayer_requests_channel = self.bot.get_channel(1397794189680574474)
+            multiplayer_requests_channel = channels.get("multiplayer_requests")
             if not multiplayer_requests_channel:
                 await interaction.response.send_message(
                     "❌ Could not find the #multiplayer-requests channel.", ephemeral=True
@@ -59,7 +77,7 @@ class MultiplayerBot(commands.Cog):
                 initiator_id=interaction.user.id,
                 on_start_callback=lambda: self.start_multiplayer_game(interaction.user.id),
             )
-            await thread.send(
+            await outbox(thread).send(
                 "🚀 **The game is ready!**\n"
                 "The initiator can start the game once at least 4 players have joined.",
                 view=start_game_view,
@@ -83,7 +101,7 @@ class MultiplayerBot(commands.Cog):
             )
 
             # Send the lobby message in the thread
-            await thread.send(
+            await outbox(thread).send(
                 f"🌐 **Multiplayer Match Lobby**\n"
                 f"👥 Initiator: {interaction.user.mention}\n"
                 f"🎴 Players can join the match using the button in the #multiplayer-requests channel.\n"
@@ -108,19 +126,24 @@ class MultiplayerBot(commands.Cog):
         game: MultiplayerGame = data["game"]
         thread: discord.Thread = data["thread"]
 
-        # Check if the user is already in the game
-        if any(player.user_id == user.id for player in game.players):
-            await thread.send(f"⚠️ {user.mention} is already in the game.")
+        # Check if the user is already in this game, or playing another one
+        existing = games.for_user(user.id)
+        if existing is not None:
+            if existing.data is data:
+                await outbox(thread).send(f"⚠️ {user.mention} is already in the game.")
+            else:
+                await outbox(thread).send(f"⚠️ {user.mention} already has another game in progress.")
             return
 
         # Check if the game is full
         if len(game.players) >= 6:
-            await thread.send(f"⚠️ Game is full. Cannot add more players.")
+            await outbox(thread).send(f"⚠️ Game is full. Cannot add more players.")
             return
 
         # Add the player to the game
+        games.add_users(active_multiplayer_games.entry(game_id), [user.id])
         game.add_player(user.id, user.display_name)
-        await thread.send(f"✅ {user.mention} has joined the match! Total players: {len(game.players)} of 6")
+        await outbox(thread).send(f"✅ {user.mention} has joined the match! Total players: {len(game.players)} of 6")
 
         # Automatically add the player to the thread
         try:
@@ -138,7 +161,7 @@ class MultiplayerBot(commands.Cog):
             on_start_callback=lambda: self.start_multiplayer_game(game_id),
         )
         start_game_view.update_button_state(len(game.players))
-        await thread.send(view=start_game_view)
+        await outbox(thread).send(view=start_game_view)
 
         # Automatically start the game if 6 players have joined
         if len(game.players) == 6:
@@ -157,20 +180,48 @@ class MultiplayerBot(commands.Cog):
         thread: discord.Thread = data["thread"]
 
         if len(game.players) < 4:
-            await thread.send("❌ At least 4 players are required to start the match.")
+            await outbox(thread).send("❌ At least 4 players are required to start the match.")
             return
 
-        await thread.send(
+        await outbox(thread).send(
             f"🌐 **Multiplayer Match Begins!**\n"
             f"👥 Players: {', '.join(player.name for player in game.players)}\n"
             f"🎴 Draw cards, 🎲 roll dice, 📈 stack sats, and ⚠️ dodge penalties!\n"
             f"🏑 First to 150 sats or most points after 15 rounds wins!\n"
             f"Let’s begin…"
         )
+        data["board"] = self.new_board(game, thread)
 
         # Begin the first turn
         await self.begin_turn(game_id)
 
+    @staticmethod
+    def new_board(game: MultiplayerGame, thread: discord.Thread) -> GameBoard:
+        return GameBoard(thread, "🌐 Multiplayer Match", lambda: [
+            ("🔄 Round", f"{game.round_count}/{game.max_rounds}"),
+            ("🏅 Scores", "\n".join(
+                f"{'▶️' if player is game.current_player() else '🔹'} {player.name}: `{player.total_score} sats`"
+                + (f" (turn: {player.turn_score})" if player.turn_score else "")
+                for player in game.players
+            )),
+        ])
+
+    async def resume_game(self, thread: discord.Thread, user_ids: List[int], state: Dict):
+        """Rebuilds a checkpointed match after a restart and replays the current turn start."""
+        game_id = user_ids[0]
+        game = restore_game(MultiplayerGame, state["game"])
+        board = self.new_board(game, thread)
+        board.restore(state["board"])
+        board.log.append("♻️ Resumed after a restart")
+        active_multiplayer_games[game_id] = {
+            "game": game,
+            "thread": thread,
+            "initiator_id": state["data"].get("initiator_id", game_id),
+            "board": board,
+        }
+        games.add_users(active_multiplayer_games.entry(game_id), user_ids[1:])
+        await self.begin_turn(game_id)
+
     async def begin_turn(self, game_id: int):
         """Begins the turn for the current player."""
         print(f"🔍 Beginning turn for game ID: {game_id}")
@@ -179,20 +230,11 @@ class MultiplayerBot(commands.Cog):
             print(f"❌ No active game found for ID: {game_id}")
             return
 
+        checkpoints.save(active_multiplayer_games.entry(game_id))  # Turn boundary
         game: MultiplayerGame = data["game"]
         thread: discord.Thread = data["thread"]
         current_player = game.current_player()
 
-        # Announce the round if it's the first player's turn
-        if game.current_player_index == 0:
-            await thread.send(f"🔄 **Round {game.round_count}** begins!")
-
-        # Announce the current player's turn and their score
-        await thread.send(
-            f"🎮 It's now **{current_player.name}'s** turn! "
-            f"Current score: **{current_player.total_score}**"
-        )
-
         # Reset timeout handler for the previous player
         self.timeout_handler.remove_tracker(current_player.user_id)
 
@@ -205,13 +247,15 @@ class MultiplayerBot(commands.Cog):
             on_timeout_callback=lambda uid=current_player.user_id: self.handle_idle_forfeit(uid, game_id)
         )
 
-        # Add the MultiplayerDrawCardView to the thread
-        draw_card_view = MultiplayerDrawCardView(
-            player_id=current_player.user_id,
-            on_draw_callback=lambda uid, interaction: self.handle_draw_card(game_id, uid, interaction),
-            timeout=60,
+        # Wait for the current player to draw a card
+        draw_card_view = DrawCardButtons.prompt(data)
+        # The board shows the round and scores; the prompt names whose turn it is
+        await data["board"].update(
+            prompt=f"🎮 It's now **{current_player.name}'s** turn! 🃏 Click below to draw a card:",
+            view=draw_card_view,
+            card=None,
+            roll=None
         )
-        await thread.send("🃏 Click below to draw a card:", view=draw_card_view)
 
     async def handle_draw_card(self, game_id: int, player_id: int, interaction: discord.Interaction):
         """Handles the draw card action for the current player."""
@@ -231,26 +275,15 @@ class MultiplayerBot(commands.Cog):
 
         card = game.draw_card()
         if not card:
-            await thread.send("❌ You cannot draw a card right now.")
+            await outbox(thread).send("❌ You cannot draw a card right now.")
             return
 
-        # Send the card details and image
-        embed = discord.Embed(
-            title=f"{current_player.name} drew a card!",
-            color=discord.Color.blue(),
-        )
-        if card.filename:
-            embed.set_image(url=f"https://thecryptorabbithole.io/risk_reward/cards/{card.filename}")
-
-        await thread.send(embed=embed)
+        # Show the card on the board
+        await data["board"].update(card=card, log=f"🎴 {current_player.name} drew {card!r}")
 
-        # Add the DiceRollView to the thread
-        dice_roll_view = DiceRollView(
-            player_id=current_player.user_id,
-            on_roll_callback=lambda uid, interaction: self.handle_roll_dice(game_id, uid, interaction),
-            timeout=60,
-        )
-        await thread.send("🎲 Click below to roll the dice:", view=dice_roll_view)
+        # Wait for the current player to roll
+        dice_roll_view = DiceRollButtons.prompt(data)
+        await data["board"].update(prompt=f"🎲 **{current_player.name}**, click below to roll the dice:", view=dice_roll_view)
 
     async def handle_roll_dice(self, game_id: int, player_id: int, interaction: discord.Interaction):
         """Handles the dice roll action for the current player."""
@@ -261,7 +294,6 @@ class MultiplayerBot(commands.Cog):
             return
 
         game: MultiplayerGame = data["game"]
-        thread: discord.Thread = data["thread"]
         current_player = game.current_player()
 
         if current_player.user_id != player_id:
@@ -269,17 +301,18 @@ class MultiplayerBot(commands.Cog):
             return
 
         result, value = game.roll_dice()
+        board = data["board"]
         if result == "bust":
-            await thread.send(f"💥 {current_player.name} rolled a **{value}** and busted!")
+            await board.update(log=f"💥 {current_player.name} rolled a **{value}** and busted!", roll=value)
             await self.end_turn(game_id)
         elif result == "penalty":
-            await thread.send(f"⚠️ {current_player.name} rolled a **{value}** and received a penalty!")
+            await board.milestone(f"⚠️ {current_player.name} rolled a **{value}** and received a penalty!")
             await self.end_turn(game_id)
         elif result == "dodged":
-            await thread.send(f"🛡️ {current_player.name} dodged the penalty! Rolled a {value}.")
+            await board.update(log=f"🛡️ {current_player.name} dodged the penalty! Rolled a {value}.", roll=value)
             await self.offer_stack_decision(game_id)
         elif result == "success":
-            await thread.send(f"✅ {current_player.name} rolled a {value}! Turn sats: **{current_player.turn_score}**.")
+            await board.update(log=f"✅ {current_player.name} rolled a {value}! Turn sats: **{current_player.turn_score}**.", roll=value)
             await self.offer_stack_decision(game_id)
 
     async def offer_stack_decision(self, game_id: int):
@@ -289,17 +322,10 @@ class MultiplayerBot(commands.Cog):
             return
 
         game: MultiplayerGame = data["game"]
-        thread: discord.Thread = data["thread"]
         current_player = game.current_player()
 
-        stack_options_view = StackOptionsView(
-            player_id=current_player.user_id,
-            on_draw_callback=lambda uid, interaction: self.handle_draw_card(game_id, uid, interaction),  # Added
-            on_stack_callback=lambda uid, interaction: self.handle_stack_points(game_id, uid, interaction),
-            on_forfeit_callback=lambda: self.handle_forfeit_turn(game_id),
-            timeout=60,
-        )
-        await thread.send("📈 Choose your next move:", view=stack_options_view)
+        stack_options_view = StackOptionsButtons.prompt(data)
+        await data["board"].update(prompt=f"📈 **{current_player.name}**, choose your next move:", view=stack_options_view)
 
     async def handle_stack_points(self, game_id: int, user_id: int, interaction: discord.Interaction):
         """Handles stacking points for the current player."""
@@ -309,7 +335,6 @@ class MultiplayerBot(commands.Cog):
             return
 
         game: MultiplayerGame = data["game"]
-        thread: discord.Thread = data["thread"]
         current_player = game.current_player()
 
         if current_player.user_id != user_id:
@@ -317,13 +342,28 @@ class MultiplayerBot(commands.Cog):
             return
 
         game.stack_sats()
-        await thread.send(f"📥 {current_player.name} stacked their sats! Total sats: **{current_player.total_score}**")
+        await data["board"].update(log=f"📥 {current_player.name} stacked their sats! Total sats: **{current_player.total_score}**", view=None)
 
         if game.check_game_over():
             await self.finish_game(game_id)
         else:
             await self.end_turn(game_id)
 
+    async def handle_forfeit_turn(self, game_id: int, user_id: int):
+        """Handles the current player giving up their turn and its unstacked sats."""
+        data = active_multiplayer_games.get(game_id)
+        if not data:
+            return
+
+        game: MultiplayerGame = data["game"]
+        current_player = game.current_player()
+        if current_player.user_id != user_id:
+            return
+
+        current_player.reset_turn()  # end_turn advances to the next player
+        await data["board"].update(log=f"🚪 {current_player.name} forfeited their turn.", view=None)
+        await self.end_turn(game_id)
+
     async def end_turn(self, game_id: int):
         """Ends the current player's turn and advances to the next player."""
         print(f"🔍 Ending turn for game ID: {game_id}")
@@ -332,7 +372,6 @@ class MultiplayerBot(commands.Cog):
             return
 
         game: MultiplayerGame = data["game"]
-        thread: discord.Thread = data["thread"]
         current_player = game.current_player()
 
         # Reset timeout handler for the current player
@@ -342,11 +381,8 @@ class MultiplayerBot(commands.Cog):
 
         # Check if the round is complete
         if game.current_player_index == 0:
-            # Generate round summary
-            round_summary = "\n".join(
-                [f"🔹 {player.name}'s Total Score: **{player.total_score}**" for player in game.players]
-            )
-            await thread.send(f"🏁 **Round {game.round_count - 1} Summary**:\n{round_summary}")
+            # The board already shows every total; just note the round
+            data["board"].log.append(f"🏁 Round {game.round_count - 1} complete")
 
         await self.begin_turn(game_id)
 
@@ -362,10 +398,12 @@ class MultiplayerBot(commands.Cog):
 
         # Determine the winner
         winner = game.get_winner()
+        board = data["board"]
         if winner:
-            await thread.send(f"🏆 {winner.name} wins the game with {winner.total_score} points!")
+            await board.milestone(f"🏆 {winner.name} wins the game with {winner.total_score} points!")
         else:
-            await thread.send("🤝 The game ended in a tie!")
+            await board.milestone("🤝 The game ended in a tie!")
+        await board.finish(prompt=f"🏆 Winner: {winner.name if winner else 'Tie'}")
 
         # Calculate the highest score directly
         highest_score = max(player.total_score for player in game.players)
@@ -395,7 +433,7 @@ class MultiplayerBot(commands.Cog):
 
         # Send a summary of scores to the thread
         score_summary = "\n".join([f"🔹 {player.name}: {player.total_score}" for player in game.players])
-        await thread.send(f"📊 **Final Scores:**\n{score_summary}")
+        await outbox(thread).send(f"📊 **Final Scores:**\n{score_summary}")
 
         # Close the game thread
         await close_game_thread(thread)
@@ -409,7 +447,6 @@ class MultiplayerBot(commands.Cog):
             return
 
         game: MultiplayerGame = data["game"]
-        thread: discord.Thread = data["thread"]
         current_player = game.current_player()
 
         # Check if the current player matches the timed-out user
@@ -418,7 +455,8 @@ class MultiplayerBot(commands.Cog):
             return
 
         # Announce the timeout and forfeit the turn
-        await thread.send(f"⏳ {current_player.name} took too long and forfeited their turn!")
+        data["awaiting"] = ()  # The turn buttons no longer apply
+        await data["board"].update(log=f"⏳ {current_player.name} took too long and forfeited their turn!", view=None)
 
         # Check if the game is over
         if game.check_game_over():
@@ -7,17 +7,31 @@ from utils.thread_manager import close_game_thread
 from utils.post_results import post_results_to_channel
 from utils.score_utils import format_score_message
 from game_logic.pvp_game import PvpGame
-from views.pvp_draw_card_view import PvpDrawCardView
-from views.dice_roll_view import DiceRollView
-from views.stack_options_view import StackOptionsView
+from views.turn_actions import DrawCardButtons, DiceRollButtons, StackOptionsButtons, TurnHandler, register_turn_handler
 from utils.timeout_handler import TimeoutHandler
+from utils.outbound import outbox
+from utils.game_board import GameBoard
+from utils.game_registry import games
+from utils.checkpoints import checkpoints, restore_game
 from utils.leaderboard_store import record_game_result, save_db  # Leaderboard utilities
 
 class PvpBot(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.active_pvp_games = {}
         self.timeout_handler = TimeoutHandler()
+        register_turn_handler("pvp", TurnHandler(
+            current_player=lambda entry: entry.game.get_current_player().id,
+            on_draw=lambda entry, interaction: self.on_draw_card(interaction.user.id, interaction, entry.game),
+            on_roll=lambda entry, interaction: self.on_roll_dice(interaction.user.id, interaction, entry.game),
+            on_stack=lambda entry, interaction: self.on_stack_sats(interaction.user.id, interaction, entry.game),
+            on_forfeit=lambda entry, interaction: self.on_player_forfeit(interaction.user.id, interaction, entry.game),
+        ))
+        checkpoints.register_restorer("pvp", self.resume_game)
+
+    @staticmethod
+    def turn_data(game: PvpGame) -> dict:
+        """The registry data for a match, where the turn buttons track what they're waiting for."""
+        return games.for_thread(game.thread.id).data
 
     async def start_pvp_game(self, interaction: discord.Interaction, player_name: str = None):
         await interaction.response.send_message(
@@ -34,7 +48,7 @@ class PvpBot(commands.Cog):
             await interaction.followup.send("❌ One or both players could not be found.", ephemeral=True)
             return
 
-        if player1_id in self.active_pvp_games or player2_id in self.active_pvp_games:
+        if games.for_user(player1_id) or games.for_user(player2_id):  # One active game per user, across all modes
             await interaction.followup.send("⚠️ One of the players already has a game in progress.", ephemeral=True)
             return
 
@@ -50,30 +64,49 @@ class PvpBot(commands.Cog):
 
         game = PvpGame(player1, player2)
         game.thread = thread
-        self.active_pvp_games[player1_id] = game
-        self.active_pvp_games[player2_id] = game
+        game.board = self.new_board(game)
+        # Ending the game through the registry clears both players' turn timers
+        games.register("pvp", game, thread, [player1_id, player2_id], on_user_end=self.timeout_handler.remove_tracker)
 
-        await thread.send(f"⚔️ PvP Match Started: {player1.mention} vs {player2.mention}!")
-        await thread.send("🎴 Each turn: draw a card, roll dice, stack sats — or risk it all!")
+        await outbox(thread).send(f"⚔️ PvP Match Started: {player1.mention} vs {player2.mention}!")
+        await outbox(thread).send("🎴 Each turn: draw a card, roll dice, stack sats — or risk it all!")
+        await self.begin_turn(game)
+
+    @staticmethod
+    def new_board(game: PvpGame) -> GameBoard:
+        return GameBoard(game.thread, f"⚔️ {game.player1.display_name} vs {game.player2.display_name}", lambda: [
+            ("🔄 Round", str(game.round_count)),
+            *((f"👤 {p.display_name}", f"`{game.scores[p.id]} sats` (turn: {game.turn_scores[p.id]})") for p in (game.player1, game.player2)),
+        ])
+
+    async def resume_game(self, thread: discord.Thread, user_ids, state):
+        """Rebuilds a checkpointed match after a restart and replays the current turn start."""
+        player1, player2 = [thread.guild.get_member(uid) or await thread.guild.fetch_member(uid) for uid in user_ids]
+        game = restore_game(PvpGame, state["game"], player1=player1, player2=player2, thread=thread)
+        game.board = self.new_board(game)
+        game.board.restore(state["board"])
+        game.board.log.append("♻️ Resumed after a restart")
+        games.register("pvp", game, thread, user_ids, on_user_end=self.timeout_handler.remove_tracker)
         await self.begin_turn(game)
 
     async def begin_turn(self, game: PvpGame):
+        checkpoints.save(games.for_thread(game.thread.id))  # Turn boundary
         current_player = game.get_current_player()
         print(f"Starting turn for: {current_player.display_name}, Current Player Index: {game.current_player_index}")
         thread = game.thread
 
-        if game.current_player_index == 0:
-            await thread.send(f"🔄 **Round {game.round_count}** begins!")
+        # Wait for the current player to draw a card
+        draw_card_view = DrawCardButtons.prompt(self.turn_data(game))
 
-        # Create the view for the current player to draw a card
-        draw_card_view = PvpDrawCardView(
-            player_id=current_player.id,
-            on_draw_callback=lambda uid, interaction: self.on_draw_card(uid, interaction, game),
-            player_name=current_player.display_name
+        # Mention once per turn so the player gets a ping; the board carries the button
+        await outbox(thread).send(f"🎮 {current_player.mention}, it's your turn!")
+        await game.board.update(
+            prompt=f"🎮 **{current_player.display_name}**, click below to draw a card:",
+            view=draw_card_view,
+            card=None,
+            roll=None
         )
 
-        await thread.send(f"🎮 {current_player.mention}, it's your turn! Click below to draw a card:", view=draw_card_view)
-
         # Start the timeout handler for the current player's turn
         await self.timeout_handler.start_turn_timeout(
             current_player.id,
@@ -96,21 +129,12 @@ class PvpBot(commands.Cog):
 
         card = game.draw_card()
 
-        # Send the card image or fallback message
-        if card.filename:
-            await game.thread.send(
-                content=f"{interaction.user.mention}, you drew a card:",
-                embed=discord.Embed().set_image(url=f"https://thecryptorabbithole.io/risk_reward/cards/{card.filename}")
-            )
-        else:
-            await game.thread.send(f"{interaction.user.mention}, you drew a card with no image.")
+        # Show the card on the board
+        await game.board.update(card=card, log=f"🎴 {interaction.user.display_name} drew {card!r}")
 
-        # Display the DiceRollView for the current player
-        dice_roll_view = DiceRollView(
-            player_id=user_id,
-            on_roll_callback=lambda uid, interaction: self.on_roll_dice(uid, interaction, game)
-        )
-        await game.thread.send(f"🎲 {interaction.user.mention}, now roll the dice!", view=dice_roll_view)
+        # Wait for the current player to roll
+        dice_roll_view = DiceRollButtons.prompt(self.turn_data(game))
+        await game.board.update(prompt=f"🎲 **{interaction.user.display_name}**, now roll the dice!", view=dice_roll_view)
 
     async def on_roll_dice(self, user_id, interaction, game: PvpGame):
         print(f"Player {interaction.user.display_name} pressed the roll dice button.")
@@ -122,34 +146,28 @@ class PvpBot(commands.Cog):
 
         result = game.roll_dice()
         if result[0] == "bust":
-            await game.thread.send("💥 You rolled a 1 and busted! No sats this turn.")
+            await game.board.update(log=f"💥 {interaction.user.display_name} rolled a 1 and busted! No sats this turn.", roll=result[1])
             await self.end_turn(game)
         elif result[0] == "penalty":
-            await game.thread.send(f"⚠️ Bearish penalty triggered! You rolled a {result[1]} → Penalty applied.")
+            await game.board.milestone(f"⚠️ Bearish penalty triggered! {interaction.user.display_name} rolled a {result[1]} → Penalty applied.")
             await self.end_turn(game)
         elif result[0] == "dodged":
-            await game.thread.send(f"🛡️ You dodged the Bearish penalty! Rolled a {result[1]}.")
+            await game.board.update(log=f"🛡️ {interaction.user.display_name} dodged the Bearish penalty! Rolled a {result[1]}.", roll=result[1])
             await self.offer_stack_decision(game)
         elif result[0] == "success":
-            await game.thread.send(f"✅ You rolled a {result[1]}! Turn sats: **{game.turn_scores[game.current_player.id]}**.")
+            await game.board.update(log=f"✅ {interaction.user.display_name} rolled a {result[1]}! Turn sats: **{game.turn_scores[game.current_player.id]}**.", roll=result[1])
             await self.offer_stack_decision(game)
 
     async def offer_stack_decision(self, game: PvpGame):
-        player_id = game.get_current_player().id
-        view = StackOptionsView(
-            player_id=player_id,
-            on_draw_callback=lambda uid, interaction: self.on_draw_card(uid, interaction, game),
-            on_stack_callback=lambda uid, interaction: self.on_stack_sats(uid, interaction, game),
-            on_forfeit_callback=lambda uid, interaction: self.on_player_forfeit(uid, interaction, game)
-        )
-        await game.thread.send("➕ Choose your next move:", view=view)
+        view = StackOptionsButtons.prompt(self.turn_data(game))
+        await game.board.update(prompt=f"➕ **{game.get_current_player().display_name}**, choose your next move:", view=view)
 
     async def on_stack_sats(self, user_id, interaction, game: PvpGame):
         if user_id != game.get_current_player().id:
             await interaction.response.send_message("⛔ Not your turn.", ephemeral=True)
             return
         game.stack_sats()
-        await game.thread.send(f"📥 Sats stacked. Current total: **{game.get_current_score()}**")
+        await game.board.update(log=f"📥 {game.get_current_player().display_name} stacked sats. Current total: **{game.get_current_score()}**", view=None)
         if game.check_game_end():
             await self.finish_game(game)
         else:
@@ -167,13 +185,7 @@ class PvpBot(commands.Cog):
 
             # Check if the round has ended (both players have completed their turns)
             if game.current_player_index == 0:  # Player 1's turn starts a new round
-                player1_score = game.get_score(game.player1)
-                player2_score = game.get_score(game.player2)
-                await game.thread.send(
-                    f"🏁 **Round {game.round_count - 1} Summary**:\n"
-                    f"🔹 {game.player1.display_name}'s Total Score: **{player1_score}**\n"
-                    f"🔹 {game.player2.display_name}'s Total Score: **{player2_score}**"
-                )
+                game.board.log.append(f"🏁 Round {game.round_count - 1} complete")
 
             # Begin the next turn
             await self.begin_turn(game)
@@ -203,8 +215,9 @@ class PvpBot(commands.Cog):
         except Exception as e:
             print(f"❌ Error updating leaderboard: {e}")
 
-        # Post results to the general chat channel
-        await game.thread.send(summary)
+        # Post results to the thread, close the board, then post to the general chat channel
+        await game.board.milestone(summary)
+        await game.board.finish(prompt=f"🏆 Winner: {winner.display_name if winner else 'Tie'}")
         await post_results_to_channel(
             self.bot,
             winner_name=winner.display_name if winner else "Tie",
@@ -215,10 +228,7 @@ class PvpBot(commands.Cog):
 
         # Close the game thread and clean up
         await close_game_thread(game.thread)
-        self.timeout_handler.remove_tracker(p1.id)
-        self.timeout_handler.remove_tracker(p2.id)
-        self.active_pvp_games.pop(p1.id, None)
-        self.active_pvp_games.pop(p2.id, None)
+        games.end(games.for_thread(game.thread.id))
 
     async def on_player_forfeit(self, user_id, interaction, game: PvpGame):
         print(f"Player {interaction.user.display_name} has forfeited the game.")
@@ -230,16 +240,18 @@ class PvpBot(commands.Cog):
         forfeiter = game.get_player_by_id(user_id)
         opponent = game.get_opponent(forfeiter)
 
-        await game.thread.send(f"🚪 {forfeiter.display_name} has forfeited the game. {opponent.display_name} wins by default!")
+        await game.board.milestone(f"🚪 {forfeiter.display_name} has forfeited the game. {opponent.display_name} wins by default!")
         await self.finish_game(game)
 
     async def handle_idle_forfeit(self, user_id):
-        game = self.active_pvp_games.get(user_id)
-        if not game:
+        entry = games.for_user(user_id)
+        if not entry or entry.mode != "pvp":
             return
+        game = entry.game
         forfeiter = game.get_player_by_id(user_id)
         opponent = game.get_opponent(forfeiter)
-        await game.thread.send(f"🕒 {forfeiter.display_name} was idle too long. {opponent.display_name} wins by default.")
+        await game.board.milestone(f"🕒 {forfeiter.display_name} was idle too long. {opponent.display_name} wins by default.")
+        await game.board.finish()
         await post_results_to_channel(
             self.bot,
             winner_name=opponent.display_name,
@@ -249,10 +261,7 @@ class PvpBot(commands.Cog):
             player_name=forfeiter.display_name
         )
         await close_game_thread(game.thread)
-        self.timeout_handler.remove_tracker(forfeiter.id)
-        self.timeout_handler.remove_tracker(opponent.id)
-        self.active_pvp_games.pop(forfeiter.id, None)
-        self.active_pvp_games.pop(opponent.id, None)
+        games.end(entry)
 
 
 async def start_pvp_lobby(interaction: discord.Interaction, player1: Tuple[int, str], player2: Tuple[int, str]):
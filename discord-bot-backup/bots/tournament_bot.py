@@ -4,15 +4,15 @@ from typing import Tuple
 from utils.thread_manager import close_game_thread
 from utils.post_results import post_results_to_channel
 from utils.score_utils import format_score_message
-from game_logic.tournament_manager import TournamentManager
 from views.pvp_draw_card_view import PvpDrawCardView
 from views.dice_roll_view import DiceRollView
 from views.stack_options_view import StackOptionsView
 from utils.timeout_handler import TimeoutHandler
 from views.leaderboard_view import LeaderboardView
+from utils.shared_state import shared_tournament
 import asyncio
 
-tournament = TournamentManager()
+tournament = shared_tournament()  # Lives in the launcher when the bot runs as several processes
 
 class TournamentBot(commands.Cog):
     def __init__(self, bot):
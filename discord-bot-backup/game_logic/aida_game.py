@@ -4,23 +4,11 @@ import discord
 from utils.ape_in_effect import ApeInEffect  # Import the ApeInEffect utility
 from utils.post_results import post_results_to_channel
 from views import DeleteThreadView  # Import the DeleteThreadView for thread deletion
-
-class Card:
-    def __init__(self, name, card_type, point_value, filename=None, penalty_type=None):
-        self.name = name
-        self.type = card_type
-        self.value = point_value
-        self.penalty = penalty_type
-        self.filename = filename
-
-    def __repr__(self):
-        if self.type == "Bearish":
-            return f"{self.name} ({self.type}) - {self.penalty}"
-        else:
-            return f"{self.name} ({self.type}) - {self.value} sats"
-
+from game_logic.rules import RULES, is_bust, roll_bearish
 
 class AidaGame:
+    rules = RULES["aida"]
+
     def __init__(self, bot, interaction, thread, player_name, round_limit=20, winning_score=300):
         """
         Initializes the AidaGame instance.
@@ -71,111 +59,35 @@ class AidaGame:
         """
         Rolls a weighted die for the player.
         """
-        roll = random.choices([1, 2, 3, 4, 5, 6], weights=[10, 18, 18, 18, 18, 18])[0]
-        return roll
+        return self.rules.player_die.roll()
 
     def aida_roll_die(self):
         """
         Rolls a weighted die for aida.
         """
-        roll = random.choices([1, 2, 3, 4, 5, 6], weights=[16.67, 16.67, 16.67, 16.67, 16.67, 16.67])[0]
-        return roll
+        return self.rules.bot_die.roll()
 
     def draw_weighted_card(self):
         """
         Draws a weighted card from the deck.
         """
-        cipher_cards = [
-            Card("Abbie", "Cipher", 1, "Cipher_1pt_Abbie.jpg"),
-            Card("Alita", "Cipher", 1, "Cipher_1pt_Alita.jpg"),
-            Card("EnJ1n", "Cipher", 1, "Cipher_1pt_EnJ1n.jpg"),
-            Card("Jakey", "Cipher", 1, "Cipher_1pt_Jakey.jpg"),
-            Card("Ace", "Cipher", 2, "Cipher_2pt_Ace.jpg"),
-            Card("Beats", "Cipher", 2, "Cipher_2pt_Beats.jpg"),
-            Card("Dash", "Cipher", 2, "Cipher_2pt_Dash.jpg"),
-            Card("Ray", "Cipher", 2, "Cipher_2pt_Ray.jpg"),
-            Card("Jazzy", "Cipher", 3, "Cipher_3pt_Jazzy.jpg"),
-            Card("Meemo", "Cipher", 3, "Cipher_3pt_Meemo.jpg"),
-            Card("Sabrina", "Cipher", 3, "Cipher_3pt_Sabrina.jpg"),
-            Card("Thea", "Cipher", 3, "Cipher_3pt_Thea.jpg"),
-            Card("Nero", "Cipher", 5, "Cipher_5pt_Nero.jpg"),
-            Card("Saul", "Cipher", 5, "Cipher_5pt_Saul.jpg"),
-            Card("Somi", "Cipher", 5, "Cipher_5pt_Somi.jpg"),
-            Card("Wick", "Cipher", 5, "Cipher_5pt_Wick.jpg"),
-            Card("Sandy", "Cipher", 8, "Cipher_8pt_Sandy.jpg"),
-            Card("Tala", "Cipher", 8, "Cipher_8pt_Tala.jpg"),
-            Card("Tulip", "Cipher", 8, "Cipher_8pt_Tulip.jpg"),
-            Card("Zacky", "Cipher", 8, "Cipher_8pt_Zacky.jpg"),
-        ]
-
-        oracle_cards = [
-            Card(name, "Oracle", 13, f"Oracle_{name.replace(' ', '_')}.jpg")
-            for name in [
-                "Aida 1", "Aida 2", "Aida 3",
-                "Lana 1", "Lana 2", "Lana 3",
-                "Nifty 1", "Nifty 2", "Nifty 3",
-                "Sats 1", "Sats 2", "Sats 3"
-            ]
-        ]
-
-        historacle_cards = [
-            Card(name, "Historacle", 21, f"Historacle_{i+1}_{name}.jpg")
-            for i, name in enumerate(["Sats", "Fibonacci", "Gann", "Dow", "Elliott"])
-        ]
-
-        bearish_cards = []
-        # ❌ Aida does NOT get the Reset card
-        # Add 4 Bear -10 cards for Aida
-        if "Minus10" not in self.used_bearish_flags:
-            for _ in range(4):
-                bearish_cards.append(Card("Minus10", "Bearish", 0, "Bear_Minus_10.jpg", "Minus10"))
-        # Add 1 Bear Half card for Aida
-        if "Half" not in self.used_bearish_flags:
-            bearish_cards.append(Card("Half", "Bearish", 0, "Bear_Half.jpg", "Half"))
-
-        # Add the "Ape In!" cards (50/50 chance between Ape_In and Ape_In_MAYC)
-        special_cards = [
-            Card("Ape In!", "Special", 0, "Ape_In.jpg"),
-            Card("Ape In!", "Special", 0, "Ape_In_MAYC.jpg")
-        ]
-
-        # Exclude "Ape In!" if the last card was "Ape In!"
-        if self.last_card_was_ape_in:
-            special_cards = []  # Temporarily exclude "Ape In!" for the next draw
-
-        all_cards = cipher_cards + oracle_cards + historacle_cards + bearish_cards + special_cards
-        weights = (
-            [6]*4 + [8]*4 + [9]*4 + [15]*4 + [15]*4 +   # Cipher cards
-            [10]*len(oracle_cards) +                  # Oracle cards
-            [4]*len(historacle_cards) +               # Historacle cards
-            [4]*len(bearish_cards) +                  # Bearish cards (increased weight)
-            [15]*len(special_cards)                   # Special cards (e.g., "Ape In!")
-        )
-
-        return random.choices(all_cards, weights=weights, k=1)[0]
+        return self.rules.deck.draw(self.used_bearish_flags, exclude_ape_in=self.last_card_was_ape_in)
 
     def handle_bearish(self, card, is_player=True):
         """
         Handles the effects of a bearish card.
         """
-        roll = self.roll_die() if is_player else self.aida_roll_die()
-        dodged = roll % 2 == 0
+        die = self.rules.player_die if is_player else self.rules.bot_die
+        score = self.player_score if is_player else self.aida_score
+        dodged, roll, score = roll_bearish(card, die, self.used_bearish_flags, score)
 
         if dodged:
             return True, roll, "Dodged the bearish penalty!"
+        if is_player:
+            self.player_score = score
         else:
-            self.used_bearish_flags.add(card.penalty)
-            if card.penalty == "Half":
-                if is_player:
-                    self.player_score //= 2
-                else:
-                    self.aida_score //= 2
-            elif card.penalty == "Minus10":
-                if is_player:
-                    self.player_score = max(0, self.player_score - 10)
-                else:
-                    self.aida_score = max(0, self.aida_score - 10)
-            return False, roll, "Bearish penalty applied!"
+            self.aida_score = score
+        return False, roll, "Bearish penalty applied!"
 
     def player_draw(self):
         """
@@ -207,7 +119,7 @@ class AidaGame:
             return "dodged", roll, phrase
 
         roll = self.roll_die()
-        if roll == 1:
+        if is_bust(roll):
             self.player_turn_score = 0
             return "bust", roll
         else:
@@ -249,7 +161,7 @@ class AidaGame:
 
             roll = self.aida_roll_die()
 
-            if roll == 1:
+            if is_bust(roll):
                 actions.append(f"Aida drew a {card.name} ({card.value} pts) and rolled a 1 → Busted! Turn ends.")
                 self.aida_turn_score = 0
                 break
@@ -1,5 +1,4 @@
-import random
-from game_logic.sandy_game import Card
+from game_logic.rules import RULES, is_bust, roll_bearish
 
 
 class PlayerState:
@@ -19,6 +18,8 @@ class PlayerState:
 
 
 class MultiplayerGame:
+    rules = RULES["multiplayer"]
+
     def __init__(self, player_tuples, winning_score=150, max_rounds=15, max_players=6):
         """
         :param player_tuples: List of (user_id, name) tuples
@@ -84,7 +85,7 @@ class MultiplayerGame:
                 return "penalty", roll
             return "dodged", roll
 
-        if value == 1:
+        if is_bust(value):
             player.turn_score = 0
             player.busted = True
             return "bust", value
@@ -140,79 +141,14 @@ class MultiplayerGame:
 
     def draw_weighted_card(self):
         """Draws a card based on weighted probabilities."""
-        cipher_cards = [
-            Card("Abbie", "Cipher", 1, "Cipher_1pt_Abbie.jpg"),
-            Card("Alita", "Cipher", 1, "Cipher_1pt_Alita.jpg"),
-            Card("EnJ1n", "Cipher", 1, "Cipher_1pt_EnJ1n.jpg"),
-            Card("Jakey", "Cipher", 1, "Cipher_1pt_Jakey.jpg"),
-            Card("Ace", "Cipher", 2, "Cipher_2pt_Ace.jpg"),
-            Card("Beats", "Cipher", 2, "Cipher_2pt_Beats.jpg"),
-            Card("Dash", "Cipher", 2, "Cipher_2pt_Dash.jpg"),
-            Card("Ray", "Cipher", 2, "Cipher_2pt_Ray.jpg"),
-            Card("Jazzy", "Cipher", 3, "Cipher_3pt_Jazzy.jpg"),
-            Card("Meemo", "Cipher", 3, "Cipher_3pt_Meemo.jpg"),
-            Card("Sabrina", "Cipher", 3, "Cipher_3pt_Sabrina.jpg"),
-            Card("Thea", "Cipher", 3, "Cipher_3pt_Thea.jpg"),
-            Card("Nero", "Cipher", 5, "Cipher_5pt_Nero.jpg"),
-            Card("Saul", "Cipher", 5, "Cipher_5pt_Saul.jpg"),
-            Card("Somi", "Cipher", 5, "Cipher_5pt_Somi.jpg"),
-            Card("Wick", "Cipher", 5, "Cipher_5pt_Wick.jpg"),
-            Card("Sandy", "Cipher", 8, "Cipher_8pt_Sandy.jpg"),
-            Card("Tala", "Cipher", 8, "Cipher_8pt_Tala.jpg"),
-            Card("Tulip", "Cipher", 8, "Cipher_8pt_Tulip.jpg"),
-            Card("Zacky", "Cipher", 8, "Cipher_8pt_Zacky.jpg"),
-        ]
-
-        oracle_cards = [
-            Card(name, "Oracle", 13, f"Oracle_{name.replace(' ', '_')}.jpg")
-            for name in ["Aida 1", "Aida 2", "Aida 3", "Lana 1", "Lana 2", "Lana 3", "Nifty 1", "Nifty 2", "Nifty 3", "Sats 1", "Sats 2", "Sats 3"]
-        ]
-
-        historacle_cards = [
-            Card(name, "Historacle", 21, f"Historacle_{i+1}_{name}.jpg")
-            for i, name in enumerate(["Sats", "Fibonacci", "Gann", "Dow", "Elliott"])
-        ]
-
-        bearish_cards = []
-        if "Reset" not in self.used_bearish_flags:
-            bearish_cards.append(Card("Reset", "Bearish", 0, "Bear_Reset.jpg", "Reset"))
-        if "Half" not in self.used_bearish_flags:
-            bearish_cards.append(Card("Half", "Bearish", 0, "Bear_Half.jpg", "Half"))
-        if "Minus10" not in self.used_bearish_flags:
-            bearish_cards.append(Card("Minus10", "Bearish", 0, "Bear_Minus_10.jpg", "Minus10"))
-
-        # Combine all cards into a single list
-        all_cards = cipher_cards + oracle_cards + historacle_cards + bearish_cards
-
-        # Assign weights to each type of card
-        weights = (
-            [6] * len(cipher_cards) +
-            [3] * len(oracle_cards) +
-            [2] * len(historacle_cards) +
-            [4] * len(bearish_cards)
-        )
-
-        # Draw a card based on weighted probabilities
-        return random.choices(all_cards, weights=weights, k=1)[0]
+        return self.rules.deck.draw(self.used_bearish_flags)
 
     def handle_bearish(self, card):
         """Handles the effects of a Bearish card."""
-        roll = self.roll_die()
-        dodged = roll % 2 == 0
-
-        if dodged:
-            return True, roll
-        else:
-            self.used_bearish_flags.add(card.penalty)
-            player = self.current_player()
-            if card.penalty == "Reset":
-                player.total_score = 0
-            elif card.penalty == "Half":
-                player.total_score //= 2
-            elif card.penalty == "Minus10":
-                player.total_score = max(0, player.total_score - 10)
-            return False, roll
+        player = self.current_player()
+        dodged, roll, player.total_score = roll_bearish(card, self.rules.player_die, self.used_bearish_flags, player.total_score)
+        return dodged, roll
 
     def roll_die(self):
         """Simulates a dice roll with weighted probabilities."""
-        return random.choices([1, 2, 3, 4, 5, 6], weights=[14.5, 17.1, 17.1, 17.1, 17.1, 17.1])[0]
\ No newline at end of file
+        return self.rules.player_die.roll()
\ No newline at end of file
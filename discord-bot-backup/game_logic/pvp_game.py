@@ -1,11 +1,12 @@
-import random
 import time
-from game_logic.sandy_game import Card
+from game_logic.rules import Card, RULES, is_bust, roll_bearish
 
 
 class PvpGame:
     """Handles the logic for a PvP Risk-Reward game session."""
 
+    rules = RULES["pvp"]
+
     def __init__(self, player1, player2):
         self.player1 = player1  # discord.Member
         self.player2 = player2
@@ -65,7 +66,7 @@ class PvpGame:
             return "dodged", roll
 
         roll = self.roll_die()
-        if roll == 1:
+        if is_bust(roll):
             self.turn_scores[self.current_player.id] = 0
             return "bust", roll
         else:
@@ -117,73 +118,14 @@ class PvpGame:
 
     def roll_die(self) -> int:
         """Simulates a dice roll with weighted probabilities."""
-        return random.choices([1, 2, 3, 4, 5, 6], weights=[16, 16.8, 16.8, 16.8, 16.8, 16.8])[0]
+        return self.rules.player_die.roll()
 
     def draw_weighted_card(self) -> Card:
         """Draws a card based on weighted probabilities."""
-        cipher_cards = [
-            Card("Abbie", "Cipher", 1, "Cipher_1pt_Abbie.jpg"),
-            Card("Alita", "Cipher", 1, "Cipher_1pt_Alita.jpg"),
-            Card("EnJ1n", "Cipher", 1, "Cipher_1pt_EnJ1n.jpg"),
-            Card("Jakey", "Cipher", 1, "Cipher_1pt_Jakey.jpg"),
-            Card("Ace", "Cipher", 2, "Cipher_2pt_Ace.jpg"),
-            Card("Beats", "Cipher", 2, "Cipher_2pt_Beats.jpg"),
-            Card("Dash", "Cipher", 2, "Cipher_2pt_Dash.jpg"),
-            Card("Ray", "Cipher", 2, "Cipher_2pt_Ray.jpg"),
-            Card("Jazzy", "Cipher", 3, "Cipher_3pt_Jazzy.jpg"),
-            Card("Meemo", "Cipher", 3, "Cipher_3pt_Meemo.jpg"),
-            Card("Sabrina", "Cipher", 3, "Cipher_3pt_Sabrina.jpg"),
-            Card("Thea", "Cipher", 3, "Cipher_3pt_Thea.jpg"),
-            Card("Nero", "Cipher", 5, "Cipher_5pt_Nero.jpg"),
-            Card("Saul", "Cipher", 5, "Cipher_5pt_Saul.jpg"),
-            Card("Somi", "Cipher", 5, "Cipher_5pt_Somi.jpg"),
-            Card("Wick", "Cipher", 5, "Cipher_5pt_Wick.jpg"),
-            Card("Sandy", "Cipher", 8, "Cipher_8pt_Sandy.jpg"),
-            Card("Tala", "Cipher", 8, "Cipher_8pt_Tala.jpg"),
-            Card("Tulip", "Cipher", 8, "Cipher_8pt_Tulip.jpg"),
-            Card("Zacky", "Cipher", 8, "Cipher_8pt_Zacky.jpg"),
-        ]
-
-        oracle_cards = [
-            Card(name, "Oracle", 13, f"Oracle_{name.replace(' ', '_')}.jpg")
-            for name in ["Aida 1", "Aida 2", "Aida 3", "Lana 1", "Lana 2", "Lana 3", "Nifty 1", "Nifty 2", "Nifty 3", "Sats 1", "Sats 2", "Sats 3"]
-        ]
-
-        historacle_cards = [
-            Card(name, "Historacle", 21, f"Historacle_{i+1}_{name}.jpg")
-            for i, name in enumerate(["Sats", "Fibonacci", "Gann", "Dow", "Elliott"])
-        ]
-
-        bearish_cards = []
-        if "Reset" not in self.used_bearish_flags:
-            bearish_cards.append(Card("Reset", "Bearish", 0, "Bear_Reset.jpg", "Reset"))
-        if "Half" not in self.used_bearish_flags:
-            bearish_cards.append(Card("Half", "Bearish", 0, "Bear_Half.jpg", "Half"))
-        if "Minus10" not in self.used_bearish_flags:
-            bearish_cards.append(Card("Minus10", "Bearish", 0, "Bear_Minus_10.jpg", "Minus10"))
-
-        all_cards = cipher_cards + oracle_cards + historacle_cards + bearish_cards
-        weights = (
-            [6]*4 + [8]*4 + [9]*4 + [11]*4 + [12]*4 +
-            [11]*12 + [6]*5 + [4]*len(bearish_cards)
-        )
-
-        return random.choices(all_cards, weights=weights, k=1)[0]
+        return self.rules.deck.draw(self.used_bearish_flags)
 
     def handle_bearish(self, card):
         """Handles the effects of a Bearish card."""
-        roll = self.roll_die()
-        dodged = roll % 2 == 0
-
-        if dodged:
-            return True, roll
-        else:
-            self.used_bearish_flags.add(card.penalty)
-            uid = self.current_player.id
-            if card.penalty == "Reset":
-                self.scores[uid] = 0
-            elif card.penalty == "Half":
-                self.scores[uid] //= 2
-            elif card.penalty == "Minus10":
-                self.scores[uid] = max(0, self.scores[uid] - 10)
-            return False, roll
\ No newline at end of file
+        uid = self.current_player.id
+        dodged, roll, self.scores[uid] = roll_bearish(card, self.rules.player_die, self.used_bearish_flags, self.scores[uid])
+        return dodged, roll
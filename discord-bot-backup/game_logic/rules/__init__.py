@@ -0,0 +1,43 @@
+"""
+Rules engine shared by every Discord game class: immutable card tables,
+per-mode decks with precomputed weights, dice, and bearish/roll handling.
+"""
+
+from game_logic.rules.cards import (
+    Card,
+    Deck,
+    VALUE_TYPES,
+    CIPHER_CARDS,
+    ORACLE_CARDS,
+    HISTORACLE_CARDS,
+    BEARISH_CARDS,
+    APE_IN_CARDS,
+    BEARISH_BITS,
+    bearish_mask,
+    ape_in_doubled,
+)
+from game_logic.rules.dice import Die, FAIR_DIE, is_bust, dodges_bearish, apply_penalty, roll_bearish
+from game_logic.rules.modes import ModeRules, RULES, get_rules
+
+__all__ = [
+    "Card",
+    "Deck",
+    "VALUE_TYPES",
+    "CIPHER_CARDS",
+    "ORACLE_CARDS",
+    "HISTORACLE_CARDS",
+    "BEARISH_CARDS",
+    "APE_IN_CARDS",
+    "BEARISH_BITS",
+    "bearish_mask",
+    "ape_in_doubled",
+    "Die",
+    "FAIR_DIE",
+    "is_bust",
+    "dodges_bearish",
+    "apply_penalty",
+    "roll_bearish",
+    "ModeRules",
+    "RULES",
+    "get_rules",
+]
@@ -0,0 +1,140 @@
+from bisect import bisect
+from typing import Dict, Iterable, NamedTuple, Optional, Sequence, Tuple
+import random
+
+
+class Card(NamedTuple):
+    """
+    Immutable card; every draw returns one of the shared instances below.
+    Effects that change a card's value (Ape In!) return a copy instead.
+    """
+    name: str
+    type: str
+    value: int
+    filename: Optional[str] = None
+    penalty: Optional[str] = None
+
+    def __repr__(self):
+        if self.type == "Bearish":
+            return f"{self.name} ({self.type}) - {self.penalty}"
+        else:
+            return f"{self.name} ({self.type}) - {self.value} sats"
+
+
+VALUE_TYPES = ("Cipher", "Oracle", "Historacle")
+
+# === Shared card tables === #
+CIPHER_CARDS: Tuple[Card, ...] = (
+    Card("Abbie", "Cipher", 1, "Cipher_1pt_Abbie.jpg"),
+    Card("Alita", "Cipher", 1, "Cipher_1pt_Alita.jpg"),
+    Card("EnJ1n", "Cipher", 1, "Cipher_1pt_EnJ1n.jpg"),
+    Card("Jakey", "Cipher", 1, "Cipher_1pt_Jakey.jpg"),
+    Card("Ace", "Cipher", 2, "Cipher_2pt_Ace.jpg"),
+    Card("Beats", "Cipher", 2, "Cipher_2pt_Beats.jpg"),
+    Card("Dash", "Cipher", 2, "Cipher_2pt_Dash.jpg"),
+    Card("Ray", "Cipher", 2, "Cipher_2pt_Ray.jpg"),
+    Card("Jazzy", "Cipher", 3, "Cipher_3pt_Jazzy.jpg"),
+    Card("Meemo", "Cipher", 3, "Cipher_3pt_Meemo.jpg"),
+    Card("Sabrina", "Cipher", 3, "Cipher_3pt_Sabrina.jpg"),
+    Card("Thea", "Cipher", 3, "Cipher_3pt_Thea.jpg"),
+    Card("Nero", "Cipher", 5, "Cipher_5pt_Nero.jpg"),
+    Card("Saul", "Cipher", 5, "Cipher_5pt_Saul.jpg"),
+    Card("Somi", "Cipher", 5, "Cipher_5pt_Somi.jpg"),
+    Card("Wick", "Cipher", 5, "Cipher_5pt_Wick.jpg"),
+    Card("Sandy", "Cipher", 8, "Cipher_8pt_Sandy.jpg"),
+    Card("Tala", "Cipher", 8, "Cipher_8pt_Tala.jpg"),
+    Card("Tulip", "Cipher", 8, "Cipher_8pt_Tulip.jpg"),
+    Card("Zacky", "Cipher", 8, "Cipher_8pt_Zacky.jpg"),
+)
+
+ORACLE_CARDS: Tuple[Card, ...] = tuple(
+    Card(name, "Oracle", 13, f"Oracle_{name.replace(' ', '_')}.jpg")
+    for name in [
+        "Aida 1", "Aida 2", "Aida 3",
+        "Lana 1", "Lana 2", "Lana 3",
+        "Nifty 1", "Nifty 2", "Nifty 3",
+        "Sats 1", "Sats 2", "Sats 3"
+    ]
+)
+
+HISTORACLE_CARDS: Tuple[Card, ...] = tuple(
+    Card(name, "Historacle", 21, f"Historacle_{i+1}_{name}.jpg")
+    for i, name in enumerate(["Sats", "Fibonacci", "Gann", "Dow", "Elliott"])
+)
+
+BEARISH_CARDS: Dict[str, Card] = {
+    "Reset": Card("Reset", "Bearish", 0, "Bear_Reset.jpg", "Reset"),
+    "Half": Card("Half", "Bearish", 0, "Bear_Half.jpg", "Half"),
+    "Minus10": Card("Minus10", "Bearish", 0, "Bear_Minus_10.jpg", "Minus10"),
+}
+
+# Two art variants of the same card (50/50 between Ape_In and Ape_In_MAYC)
+APE_IN_CARDS: Tuple[Card, ...] = (
+    Card("Ape In!", "Special", 0, "Ape_In.jpg"),
+    Card("Ape In!", "Special", 0, "Ape_In_MAYC.jpg"),
+)
+
+# One bit per bearish penalty; a game's used flags index its precomputed deck
+BEARISH_BITS: Dict[str, int] = {"Reset": 1, "Half": 2, "Minus10": 4}
+
+
+def bearish_mask(used_flags: Iterable[str]) -> int:
+    mask = 0
+    for flag in used_flags:
+        mask |= BEARISH_BITS.get(flag, 0)
+    return mask
+
+
+def ape_in_doubled(card: Card) -> Card:
+    """Copy of a value card worth double; other cards are returned as they are."""
+    if card.type in VALUE_TYPES:
+        return card._replace(value=card.value * 2)
+    return card
+
+
+class Deck:
+    """
+    A mode's draw table, built once at import: for every combination of used
+    bearish flags (and with/without Ape In!) the card tuple and its cumulative
+    weights are precomputed, so a draw is one random() and one bisect.
+    """
+
+    def __init__(
+        self,
+        cipher_weights: Sequence[int],
+        oracle_weight: int,
+        historacle_weight: int,
+        bearish_copies: Sequence[Tuple[str, int]],
+        bearish_weight: int,
+        ape_in_weight: int = 0,
+    ):
+        weighted = (
+            [(card, weight) for card, weight in zip(CIPHER_CARDS, cipher_weights)] +
+            [(card, oracle_weight) for card in ORACLE_CARDS] +
+            [(card, historacle_weight) for card in HISTORACLE_CARDS]
+        )
+        self.has_ape_in = ape_in_weight > 0
+        self._tables: Dict[Tuple[int, bool], Tuple[Tuple[Card, ...], Tuple[float, ...]]] = {}
+        for mask in range(1 << len(BEARISH_BITS)):
+            bearish = [
+                (BEARISH_CARDS[penalty], bearish_weight)
+                for penalty, copies in bearish_copies
+                if not mask & BEARISH_BITS[penalty]
+                for _ in range(copies)
+            ]
+            for with_ape_in in (False, True):
+                special = [(card, ape_in_weight) for card in APE_IN_CARDS] if with_ape_in and self.has_ape_in else []
+                entries = weighted + bearish + special
+                cum_weights, total = [], 0
+                for _, weight in entries:
+                    total += weight
+                    cum_weights.append(total)
+                self._tables[(mask, with_ape_in)] = (tuple(card for card, _ in entries), tuple(cum_weights))
+
+    def cards(self, used_flags: Iterable[str] = (), exclude_ape_in: bool = False) -> Tuple[Card, ...]:
+        return self._tables[(bearish_mask(used_flags), not exclude_ape_in)][0]
+
+    def draw(self, used_flags: Iterable[str] = (), exclude_ape_in: bool = False, rng: random.Random = random) -> Card:
+        """Weighted draw, skipping bearish cards whose penalty is already used (and Ape In! right after one)."""
+        cards, cum_weights = self._tables[(bearish_mask(used_flags), not exclude_ape_in)]
+        return cards[bisect(cum_weights, rng.random() * cum_weights[-1])]
@@ -0,0 +1,56 @@
+from bisect import bisect
+from typing import Sequence, Set, Tuple
+import random
+
+FACES = (1, 2, 3, 4, 5, 6)
+
+
+class Die:
+    """Weighted six-sided die with cumulative weights computed once."""
+
+    def __init__(self, weights: Sequence[float]):
+        cum_weights, total = [], 0.0
+        for weight in weights:
+            total += weight
+            cum_weights.append(total)
+        self.weights = tuple(weights)
+        self._cum_weights = tuple(cum_weights)
+
+    def roll(self, rng: random.Random = random) -> int:
+        return FACES[bisect(self._cum_weights, rng.random() * self._cum_weights[-1])]
+
+
+FAIR_DIE = Die([16.67] * 6)
+
+
+def is_bust(roll: int) -> bool:
+    """Rolling a 1 on a value card loses the turn score."""
+    return roll == 1
+
+
+def dodges_bearish(roll: int) -> bool:
+    """Even rolls dodge a bearish penalty."""
+    return roll % 2 == 0
+
+
+def apply_penalty(penalty: str, score: int) -> int:
+    """Total score after a bearish penalty lands."""
+    if penalty == "Reset":
+        return 0
+    elif penalty == "Half":
+        return score // 2
+    elif penalty == "Minus10":
+        return max(0, score - 10)
+    return score
+
+
+def roll_bearish(card, die: Die, used_flags: Set[str], score: int, rng: random.Random = random) -> Tuple[bool, int, int]:
+    """
+    Roll against a bearish card. Returns (dodged, roll, new score); a penalty
+    that lands is marked used so the deck stops dealing it.
+    """
+    roll = die.roll(rng)
+    if dodges_bearish(roll):
+        return True, roll, score
+    used_flags.add(card.penalty)
+    return False, roll, apply_penalty(card.penalty, score)
@@ -0,0 +1,59 @@
+from typing import Dict, NamedTuple
+
+from game_logic.rules.cards import Deck
+from game_logic.rules.dice import Die, FAIR_DIE
+
+# Cipher weights by value tier (1, 2, 3, 5, 8 sats), four cards per tier
+BOT_CIPHER_WEIGHTS = [6]*4 + [8]*4 + [9]*4 + [15]*4 + [15]*4
+PVP_CIPHER_WEIGHTS = [6]*4 + [8]*4 + [9]*4 + [11]*4 + [12]*4
+MULTIPLAYER_CIPHER_WEIGHTS = [6]*20
+
+BOT_PLAYER_DIE = Die([12.5, 17.5, 17.5, 17.5, 17.5, 17.5])
+
+
+class ModeRules(NamedTuple):
+    deck: Deck
+    player_die: Die
+    bot_die: Die = FAIR_DIE
+
+
+def _bot_deck(bearish_copies, bearish_weight=4) -> Deck:
+    return Deck(BOT_CIPHER_WEIGHTS, 10, 4, bearish_copies, bearish_weight, ape_in_weight=15)
+
+
+RULES: Dict[str, ModeRules] = {
+    # Aida never deals the Reset card
+    "aida": ModeRules(
+        _bot_deck([("Minus10", 4), ("Half", 1)]),
+        Die([10, 18, 18, 18, 18, 18]),
+    ),
+    "sandy": ModeRules(
+        _bot_deck([("Reset", 1), ("Half", 1), ("Minus10", 1)], bearish_weight=2),
+        BOT_PLAYER_DIE,
+        Die([14, 17.2, 17.2, 17.2, 17.2, 17.2]),
+    ),
+    "lana": ModeRules(
+        _bot_deck([("Reset", 1), ("Half", 1), ("Minus10", 4)]),
+        BOT_PLAYER_DIE,
+    ),
+    "enj1n": ModeRules(
+        _bot_deck([("Reset", 1), ("Half", 3), ("Minus10", 4)]),
+        BOT_PLAYER_DIE,
+    ),
+    "nifty": ModeRules(
+        _bot_deck([("Reset", 1), ("Half", 3), ("Minus10", 4)]),
+        BOT_PLAYER_DIE,
+    ),
+    "pvp": ModeRules(
+        Deck(PVP_CIPHER_WEIGHTS, 11, 6, [("Reset", 1), ("Half", 1), ("Minus10", 1)], 4),
+        Die([16, 16.8, 16.8, 16.8, 16.8, 16.8]),
+    ),
+    "multiplayer": ModeRules(
+        Deck(MULTIPLAYER_CIPHER_WEIGHTS, 3, 2, [("Reset", 1), ("Half", 1), ("Minus10", 1)], 4),
+        Die([14.5, 17.1, 17.1, 17.1, 17.1, 17.1]),
+    ),
+}
+
+
+def get_rules(mode: str) -> ModeRules:
+    return RULES[mode]
@@ -0,0 +1,93 @@
+"""
+Runs the bot as several processes, each owning a slice of the shards.
+
+    python launcher.py --processes 2 --shards 4
+
+The launcher hosts the shared state (leaderboard store, tournament manager;
+see utils/shared_state.py) and starts one `main.py` per process with its
+SHARD_IDS. A process that exits is restarted on its own; the other shards
+and the shared state keep running. For a single process just run main.py.
+"""
+
+import argparse
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+
+from dotenv import load_dotenv
+
+from utils.shared_state import serve
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("launcher")
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESTART_DELAY = 5     # Seconds before restarting a shard process that exited
+POLL_INTERVAL = 1
+
+
+def shard_slices(shard_count: int, processes: int):
+    """Shard ids for each process, spread round-robin."""
+    return [list(range(i, shard_count, processes)) for i in range(processes)]
+
+
+def start_process(index: int, shard_ids, env) -> subprocess.Popen:
+    env = {**env, "SHARD_IDS": ",".join(map(str, shard_ids))}
+    process = subprocess.Popen([sys.executable, os.path.join(BASE_DIR, "main.py")], cwd=BASE_DIR, env=env)
+    logger.info(f"🚀 Process {index} (pid {process.pid}) running shards {shard_ids}")
+    return process
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Run the Discord bot as several shard processes.")
+    parser.add_argument("--processes", type=int, default=int(os.getenv("SHARD_PROCESSES", "2")))
+    parser.add_argument("--shards", type=int, default=int(os.getenv("SHARD_COUNT", "0")),
+                        help="Total shard count (default: one per process)")
+    args = parser.parse_args()
+
+    shard_count = args.shards or args.processes
+    processes = min(args.processes, shard_count)
+    slices = shard_slices(shard_count, processes)
+
+    env = {
+        **os.environ,
+        **serve(),
+        "SHARD_COUNT": str(shard_count),
+        "SHARD_PROCESSES": str(processes),
+    }
+    running = {i: start_process(i, shard_ids, env) for i, shard_ids in enumerate(slices)}
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    while not stopping:
+        time.sleep(POLL_INTERVAL)
+        for i, process in running.items():
+            code = process.poll()
+            if code is not None and not stopping:
+                logger.warning(f"⚠️ Process {i} exited with {code}; restarting in {RESTART_DELAY}s")
+                time.sleep(RESTART_DELAY)
+                running[i] = start_process(i, slices[i], env)
+
+    logger.info("👋 Stopping shard processes...")
+    for process in running.values():
+        process.terminate()
+    for process in running.values():
+        process.wait()
+
+    # Commit anything the shards queued before the state host goes away
+    from utils.leaderboard_store import close
+    close()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,13 @@ import os
 
 # Load .env and bot token/intents
 load_dotenv()
-from bot_config import TOKEN, INTENTS
+from bot_config import TOKEN, INTENTS, CARD_ASSETS_CHANNEL_ID, SHARD_OPTIONS
+from utils.card_assets import sync_card_assets
+from utils.channel_registry import channels
+from utils.game_registry import games
+from utils.checkpoints import checkpoints
+from utils.shared_state import connect as connect_shared_state
+from views.turn_actions import register_turn_views
 
 # Import the Main Menu View
 from views.main_menu_view import MainMenuView
@@ -21,7 +27,12 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # === Bot setup ===
-bot = commands.Bot(command_prefix="!", intents=INTENTS)
+# AutoShardedBot runs every shard on one connection pool; launcher.py splits shards across processes
+bot = commands.AutoShardedBot(command_prefix="!", intents=INTENTS, **SHARD_OPTIONS)
+connect_shared_state()  # No-op unless started by launcher.py
+channels.install(bot)  # Resolves configured channels on ready and tracks channel events
+games.install(bot)     # Ends games whose thread is deleted
+checkpoints.install(bot)  # Resumes checkpointed games on ready; drops checkpoints of ended games
 
 # === Game Channels ===
 MAIN_MENU_CHANNEL_NAME = "🎮play-ape-in"
@@ -65,6 +76,8 @@ async def handle_game_mode(interaction: discord.Interaction, mode: str):
 @bot.event
 async def on_ready():
     logger.info(f"✅ Logged in as {bot.user.name}")
+    # Only the process running shard 0 uploads card images; the others follow its manifest
+    await sync_card_assets(bot, CARD_ASSETS_CHANNEL_ID, publish=0 in (bot.shard_ids or [0]))
     for guild in bot.guilds:
         for channel in guild.text_channels:
             if channel.name == MAIN_MENU_CHANNEL_NAME:
@@ -111,6 +124,7 @@ if __name__ == "__main__":
         try:
             async with bot:
                 await load_extensions()
+                register_turn_views(bot)  # One persistent registration for every game's turn buttons
                 await bot.start(TOKEN)
         except KeyboardInterrupt:
             logger.info("👋 Bot shutdown by user.")
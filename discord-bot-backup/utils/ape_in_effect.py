@@ -1,3 +1,6 @@
+from game_logic.rules import VALUE_TYPES, ape_in_doubled
+
+
 class ApeInEffect:
     def __init__(self):
         self.active = False  # Tracks if "Ape In!" is active
@@ -13,8 +16,8 @@ class ApeInEffect:
         self.active = False
 
     def apply_effect(self, card):
-        """Apply the 'Ape In!' effect to a card."""
-        if self.active and card.type in ["Cipher", "Oracle", "Historacle"]:
-            card.value *= 2  # Double the value of the card
+        """Apply the 'Ape In!' effect to a card; returns a doubled copy (deck cards are shared)."""
+        if self.active and card.type in VALUE_TYPES:
+            card = ape_in_doubled(card)  # Double the value of the card
             self.reset()  # Reset the effect after applying it
         return card
\ No newline at end of file
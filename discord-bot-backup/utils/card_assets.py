@@ -0,0 +1,269 @@
+"""
+Card image cache backed by Discord attachments.
+
+publish_card_assets() uploads every image in assets/cards (plus a downscaled
+thumbnail) once to a storage channel and records the attachment URLs in
+data/card_assets.json. Embeds then point at those URLs, so sends neither
+re-upload nor depend on the hosted site. Discord signs attachment URLs with
+an expiry, so the manifest also keeps the message ids and refresh_card_urls()
+re-reads those messages (one fetch per five cards) before the links lapse;
+images whose storage message was deleted are uploaded again on the same pass.
+
+Run `python -m utils.card_assets` to publish without starting the game bot.
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import discord
+
+from utils.constants import CARD_IMAGE_BASE_URL
+
+try:
+    from PIL import Image
+except ImportError:  # Thumbnails are optional; embeds fall back to the full image
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_DIR = os.getenv("CARD_ASSETS_DIR", os.path.join(os.path.dirname(BASE_DIR), "assets", "cards"))
+MANIFEST_PATH = os.path.join(BASE_DIR, "data", "card_assets.json")
+
+THUMBNAIL_SIZE = (256, 256)      # Bounding box; aspect ratio is kept
+THUMBNAIL_SUFFIX = "_thumb.jpg"
+CARDS_PER_MESSAGE = 5            # Two attachments per card, Discord allows ten per message
+REFRESH_MARGIN = 24 * 3600       # Re-sign URLs that expire within a day
+REFRESH_INTERVAL = 6 * 3600
+
+# filename -> {"sha1", "url", "thumb_url", "channel_id", "message_id"}
+_manifest: Dict[str, dict] = {}
+_refresh_task: Optional[asyncio.Task] = None
+
+
+def _load_manifest():
+    global _manifest
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            _manifest = json.load(f).get("cards", {})
+    except FileNotFoundError:
+        _manifest = {}
+    except (OSError, ValueError) as e:
+        logger.error(f"❌ Could not read {MANIFEST_PATH}: {e}")
+        _manifest = {}
+
+
+def _save_manifest():
+    os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+    tmp_path = f"{MANIFEST_PATH}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"cards": _manifest}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+_load_manifest()
+
+
+def card_image_url(card, thumbnail: bool = False) -> Optional[str]:
+    """Cached attachment URL for the card's image, else the hosted copy."""
+    filename = getattr(card, "filename", None)
+    if not filename:
+        return None
+    entry = _manifest.get(filename)
+    if entry:
+        url = entry.get("thumb_url") if thumbnail else None
+        return url or entry["url"]
+    return f"{CARD_IMAGE_BASE_URL}{filename}"
+
+
+def _url_expiry(url: str) -> Optional[int]:
+    """Unix time a signed CDN URL stops working (the hex ex= parameter), if any."""
+    values = parse_qs(urlparse(url).query).get("ex")
+    try:
+        return int(values[0], 16) if values else None
+    except ValueError:
+        return None
+
+
+def _sha1(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _thumbnail(path: str) -> Optional[bytes]:
+    if Image is None:
+        return None
+    with Image.open(path) as image:
+        image = image.convert("RGB")
+        image.thumbnail(THUMBNAIL_SIZE)
+        buffer = io.BytesIO()
+        image.save(buffer, "JPEG", quality=85, optimize=True)
+        return buffer.getvalue()
+
+
+def _pending_uploads(force: bool) -> List[Tuple[str, str, str]]:
+    """(filename, path, sha1) for images that are new or changed since the last publish."""
+    if not os.path.isdir(ASSETS_DIR):
+        # Deployed without the card images: keep the published URLs, the rest use hosted copies
+        logger.warning(f"⚠️ Card images not found at {ASSETS_DIR}; nothing to publish.")
+        return []
+    pending = []
+    for filename in sorted(os.listdir(ASSETS_DIR)):
+        path = os.path.join(ASSETS_DIR, filename)
+        if not os.path.isfile(path) or filename.startswith("."):
+            continue
+        digest = _sha1(path)
+        entry = _manifest.get(filename)
+        if force or not entry or entry.get("sha1") != digest:
+            pending.append((filename, path, digest))
+    return pending
+
+
+def _record(message: discord.Message, batch: List[Tuple[str, str, str]]):
+    attachments = {attachment.filename: attachment.url for attachment in message.attachments}
+    for filename, _, digest in batch:
+        stem = os.path.splitext(filename)[0]
+        _manifest[filename] = {
+            "sha1": digest,
+            "url": attachments[filename],
+            "thumb_url": attachments.get(f"{stem}{THUMBNAIL_SUFFIX}"),
+            "channel_id": message.channel.id,
+            "message_id": message.id,
+        }
+
+
+async def publish_card_assets(channel: discord.abc.Messageable, force: bool = False) -> int:
+    """Upload new or changed card images to channel; returns how many were uploaded."""
+    pending = await asyncio.to_thread(_pending_uploads, force)
+    if not pending:
+        return 0
+    if Image is None:
+        logger.warning("⚠️ Pillow is not installed; publishing card images without thumbnails.")
+
+    for i in range(0, len(pending), CARDS_PER_MESSAGE):
+        batch = pending[i:i + CARDS_PER_MESSAGE]
+        files = []
+        for filename, path, _ in batch:
+            files.append(discord.File(path, filename=filename))
+            thumb = await asyncio.to_thread(_thumbnail, path)
+            if thumb:
+                stem = os.path.splitext(filename)[0]
+                files.append(discord.File(io.BytesIO(thumb), filename=f"{stem}{THUMBNAIL_SUFFIX}"))
+        message = await channel.send(content="🗂️ Card assets: " + ", ".join(name for name, _, _ in batch), files=files)
+        _record(message, batch)
+        _save_manifest()  # Per message, so an interrupted publish keeps what it uploaded
+
+    logger.info(f"📤 Published {len(pending)} card images to #{getattr(channel, 'name', channel)}")
+    return len(pending)
+
+
+async def refresh_card_urls(client: discord.Client, force: bool = False) -> int:
+    """Re-read storage messages whose attachment URLs are about to expire; returns how many were handled."""
+    deadline = time.time() + REFRESH_MARGIN
+    stale: Dict[Tuple[int, int], List[str]] = {}
+    for filename, entry in _manifest.items():
+        expiry = _url_expiry(entry["url"])
+        if force or (expiry is not None and expiry < deadline):
+            stale.setdefault((entry["channel_id"], entry["message_id"]), []).append(filename)
+
+    refreshed = 0
+    for (channel_id, message_id), filenames in stale.items():
+        try:
+            channel = client.get_channel(channel_id) or await client.fetch_channel(channel_id)
+            message = await channel.fetch_message(message_id)
+        except discord.NotFound:
+            # Storage message is gone: forget it so the next publish uploads these again
+            logger.warning(f"⚠️ Card asset message {message_id} was deleted; {len(filenames)} images need republishing.")
+            for name in filenames:
+                _manifest.pop(name, None)
+            refreshed += 1
+            continue
+        except discord.HTTPException as e:
+            logger.error(f"❌ Could not refresh card assets from message {message_id}: {e}")
+            continue
+        _record(message, [(name, None, _manifest[name]["sha1"]) for name in filenames])
+        refreshed += 1
+    if refreshed:
+        _save_manifest()
+    return refreshed
+
+
+async def sync_card_assets(client: discord.Client, channel_id: Optional[int], publish: bool = True):
+    """
+    Publish what's missing, refresh expiring URLs, and keep refreshing in the
+    background. With publish=False (other shard processes) only re-read the
+    manifest the publishing process maintains.
+    """
+    global _refresh_task
+    if not channel_id:
+        logger.info("ℹ️ No card asset channel configured; using hosted card images.")
+        return
+    if not publish:
+        if _refresh_task is None or _refresh_task.done():
+            _refresh_task = asyncio.create_task(_reload_loop())
+        return
+    await _sync(client, channel_id)
+
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.create_task(_refresh_loop(client, channel_id))
+
+
+async def _sync(client: discord.Client, channel_id: int):
+    """Refresh expiring URLs, then upload anything missing (including images whose message was deleted)."""
+    try:
+        channel = client.get_channel(channel_id) or await client.fetch_channel(channel_id)
+        await refresh_card_urls(client)
+        await publish_card_assets(channel)
+    except (discord.HTTPException, OSError) as e:
+        logger.error(f"❌ Card asset sync failed: {e}")
+
+
+async def _refresh_loop(client: discord.Client, channel_id: int):
+    while True:
+        await asyncio.sleep(REFRESH_INTERVAL)
+        try:
+            await _sync(client, channel_id)
+        except Exception as e:
+            logger.error(f"❌ Card URL refresh failed: {e}")
+
+
+async def _reload_loop():
+    while True:
+        await asyncio.sleep(REFRESH_INTERVAL)
+        await asyncio.to_thread(_load_manifest)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from bot_config import TOKEN, INTENTS, CARD_ASSETS_CHANNEL_ID
+
+    parser = argparse.ArgumentParser(description="Upload card images to the asset storage channel.")
+    parser.add_argument("--channel", type=int, default=CARD_ASSETS_CHANNEL_ID,
+                        help="Storage channel id (default: CARD_ASSETS_CHANNEL_ID)")
+    parser.add_argument("--force", action="store_true", help="Re-upload every image")
+    args = parser.parse_args()
+    if not args.channel:
+        parser.error("no storage channel: pass --channel or set CARD_ASSETS_CHANNEL_ID")
+
+    logging.basicConfig(level=logging.INFO)
+    client = discord.Client(intents=INTENTS)
+
+    @client.event
+    async def on_ready():
+        try:
+            channel = client.get_channel(args.channel) or await client.fetch_channel(args.channel)
+            uploaded = await publish_card_assets(channel, force=args.force)
+            refreshed = await refresh_card_urls(client)
+            print(f"✅ Uploaded {uploaded} images, refreshed {refreshed} messages -> {MANIFEST_PATH}")
+        finally:
+            await client.close()
+
+    client.run(TOKEN)
@@ -0,0 +1,87 @@
+import logging
+from typing import Dict, Optional
+
+import discord
+from discord.ext import commands
+
+from utils.constants import (
+    CHANNEL_GENERAL_CHAT_ID,
+    CHANNEL_MULTIPLAYER_REQUESTS_ID,
+    CHANNEL_PLAY_MINIGAMES_ID,
+    CHANNEL_PVP_REQUESTS_ID,
+)
+
+logger = logging.getLogger(__name__)
+
+# Registry key -> configured channel id
+CONFIGURED_CHANNELS = {
+    "general_chat": CHANNEL_GENERAL_CHAT_ID,
+    "play_minigames": CHANNEL_PLAY_MINIGAMES_ID,
+    "pvp_requests": CHANNEL_PVP_REQUESTS_ID,
+    "multiplayer_requests": CHANNEL_MULTIPLAYER_REQUESTS_ID,
+}
+
+
+class ChannelRegistry:
+    """
+    Cached handles for the channels the bots post to.
+
+    Channels are resolved once when the bot is ready (falling back to one REST
+    fetch for anything not in the gateway cache) and kept current from channel
+    update/delete events, so game code never does a lookup round trip.
+    """
+
+    def __init__(self, configured: Dict[str, int]):
+        self.configured = dict(configured)
+        self._keys_by_id = {channel_id: key for key, channel_id in self.configured.items()}
+        self._channels: Dict[str, discord.abc.GuildChannel] = {}
+        self.bot: Optional[commands.Bot] = None
+
+    def install(self, bot: commands.Bot):
+        """Hook the registry into the bot's gateway events."""
+        self.bot = bot
+        bot.add_listener(self.resolve, "on_ready")
+        bot.add_listener(self.resolve, "on_resumed")
+        bot.add_listener(self._on_channel_update, "on_guild_channel_update")
+        bot.add_listener(self._on_channel_delete, "on_guild_channel_delete")
+        bot.add_listener(self._on_channel_create, "on_guild_channel_create")
+
+    async def resolve(self):
+        for key, channel_id in self.configured.items():
+            channel = self.bot.get_channel(channel_id)
+            if channel is None and key not in self._channels:
+                try:
+                    channel = await self.bot.fetch_channel(channel_id)
+                except discord.HTTPException as e:
+                    logger.error(f"❌ Could not resolve #{key} ({channel_id}): {e}")
+                    continue
+            if channel is not None:
+                self._channels[key] = channel
+        logger.info(f"📌 Channel registry: {len(self._channels)}/{len(self.configured)} channels resolved")
+
+    def get(self, key: str) -> Optional[discord.abc.GuildChannel]:
+        """Cached channel for key; before on_ready, whatever the gateway cache has."""
+        channel = self._channels.get(key)
+        if channel is None and self.bot is not None:
+            channel = self.bot.get_channel(self.configured[key])
+            if channel is not None:
+                self._channels[key] = channel
+        return channel
+
+    async def _on_channel_update(self, before, after):
+        key = self._keys_by_id.get(after.id)
+        if key:
+            self._channels[key] = after
+
+    async def _on_channel_create(self, channel):
+        key = self._keys_by_id.get(channel.id)
+        if key:
+            self._channels[key] = channel
+
+    async def _on_channel_delete(self, channel):
+        key = self._keys_by_id.get(channel.id)
+        if key and self._channels.pop(key, None) is not None:
+            logger.warning(f"⚠️ Configured channel #{key} ({channel.id}) was deleted.")
+
+
+channels = ChannelRegistry(CONFIGURED_CHANNELS)
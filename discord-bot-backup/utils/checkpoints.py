@@ -0,0 +1,305 @@
+"""
+Crash-safe checkpoints of running games.
+
+Cogs call save() at the start of every turn. The game's plain state (scores,
+used bearish flags, multiplayer player states, the board's message id and
+log) is packed right away, and a writer thread commits whatever is pending
+about once a second, keeping only the newest snapshot per game, so a turn
+costs one small row write. Games leave the store when the registry ends them.
+
+On startup install() restores every checkpoint whose guild this process
+serves: the mode's restorer rebuilds the game and board and hands the turn
+back to whoever was up. The persistent turn buttons (views/turn_actions.py)
+then find the game again by its thread.
+"""
+
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import discord
+
+from game_logic.multiplayer_game import PlayerState
+from game_logic.rules import Card
+from utils.ape_in_effect import ApeInEffect
+from utils.game_registry import ActiveGame, games
+
+try:
+    import msgpack
+except ImportError:  # Falls back to JSON blobs; rows record which codec wrote them
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CHECKPOINT_DB_PATH = os.getenv("CHECKPOINT_DB_PATH", os.path.join(BASE_DIR, "data", "checkpoints.db"))
+COALESCE_SECONDS = 1.0   # Pending snapshots are committed together after this long
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    game_id    TEXT PRIMARY KEY,
+    mode       TEXT NOT NULL,
+    guild_id   INTEGER,
+    thread_id  INTEGER NOT NULL,
+    user_ids   TEXT NOT NULL,  -- JSON list, first entry owns the game
+    codec      TEXT NOT NULL,  -- "msgpack" or "json"
+    state      BLOB NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+UPSERT_SQL = """
+INSERT INTO checkpoints (game_id, mode, guild_id, thread_id, user_ids, codec, state, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(game_id) DO UPDATE SET
+    mode = excluded.mode, guild_id = excluded.guild_id, thread_id = excluded.thread_id,
+    user_ids = excluded.user_ids, codec = excluded.codec, state = excluded.state, updated_at = excluded.updated_at
+"""
+
+# Objects inside game state that are checkpointed by their attributes
+STATE_TYPES = {cls.__name__: cls for cls in (PlayerState, ApeInEffect)}
+
+# Per-turn data keys that a restored turn sets up again
+TRANSIENT_KEYS = {"awaiting", "pending_card"}
+
+_SKIP = object()
+
+Restorer = Callable[[discord.Thread, List[int], Dict[str, Any]], Awaitable[None]]
+
+
+# -------------- State encoding --------------
+
+def _encode(value: Any) -> Any:
+    """Plain, codec-safe form of value, or _SKIP for handles (threads, members, boards...)."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Card):
+        return {"__card__": list(value)}
+    if isinstance(value, (set, frozenset)):
+        return {"__set__": [_encode(item) for item in value]}
+    if isinstance(value, (list, tuple)):
+        items = [_encode(item) for item in value]
+        return _SKIP if _SKIP in items else items
+    if isinstance(value, dict):
+        items = [[_encode(k), _encode(v)] for k, v in value.items()]
+        return _SKIP if any(_SKIP in pair for pair in items) else {"__items__": items}
+    if type(value) in STATE_TYPES.values():
+        return {"__obj__": type(value).__name__, "vars": encode_vars(vars(value))}
+    return _SKIP
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "__card__" in value:
+        return Card(*value["__card__"])
+    if "__set__" in value:
+        return {_decode(item) for item in value["__set__"]}
+    if "__items__" in value:
+        return {_decode(k): _decode(v) for k, v in value["__items__"]}
+    if "__obj__" in value:
+        obj = STATE_TYPES[value["__obj__"]].__new__(STATE_TYPES[value["__obj__"]])
+        obj.__dict__.update(decode_vars(value["vars"]))
+        return obj
+    return value
+
+
+def encode_vars(attrs: Dict[str, Any], skip=()) -> Dict[str, Any]:
+    """Encodable attributes of attrs; anything that is a live handle is left out."""
+    encoded = {}
+    for name, value in attrs.items():
+        if name in skip:
+            continue
+        value = _encode(value)
+        if value is not _SKIP:
+            encoded[name] = value
+    return encoded
+
+
+def decode_vars(attrs: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: _decode(value) for name, value in attrs.items()}
+
+
+def restore_game(cls, state: Dict[str, Any], **handles):
+    """Rebuild a game object from its checkpointed attributes plus the live handles (bot, thread...)."""
+    game = cls.__new__(cls)
+    game.__dict__.update(decode_vars(state))
+    game.__dict__.update(handles)
+    return game
+
+
+def _pack(state: Dict[str, Any]):
+    if msgpack is not None:
+        return "msgpack", msgpack.packb(state, use_bin_type=True)
+    return "json", json.dumps(state, separators=(",", ":")).encode("utf-8")
+
+
+def _unpack(codec: str, blob: bytes) -> Dict[str, Any]:
+    if codec == "msgpack":
+        if msgpack is None:
+            raise RuntimeError("checkpoint was written with msgpack, which is not installed")
+        return msgpack.unpackb(blob, raw=False, strict_map_key=False)
+    return json.loads(blob)
+
+
+# -------------- Store --------------
+
+class CheckpointStore:
+    """
+    SQLite (WAL) table of game snapshots with a coalescing writer thread.
+
+    save() and discard() only replace the game's pending entry; the writer
+    commits all pending entries in one transaction per wake-up, so several
+    saves of one game between commits cost a single row write.
+    """
+
+    def __init__(self, path: str = CHECKPOINT_DB_PATH):
+        self.path = path
+        self._pending: Dict[str, Optional[tuple]] = {}  # game_id -> row, or None to delete
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+        self._restorers: Dict[str, Restorer] = {}
+        self._restored = False
+        self.bot = None
+
+    def _open(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")  # Shard processes share the file
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _ensure_writer(self):
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+            self._writer.start()
+
+    # Snapshots
+
+    def save(self, entry: Optional[ActiveGame]):
+        """Checkpoint a game as it stands now (call at a turn boundary)."""
+        if entry is None or entry.thread is None or self._closed:
+            return
+        board = entry.data.get("board") or getattr(entry.game, "board", None)
+        state = {
+            "game": encode_vars(vars(entry.game)),
+            "data": encode_vars(entry.data, skip=TRANSIENT_KEYS),
+            "board": board.snapshot() if board is not None else None,
+        }
+        codec, blob = _pack(state)
+        guild = getattr(entry.thread, "guild", None)
+        row = (entry.game_id, entry.mode, guild.id if guild else None, entry.thread.id,
+               json.dumps(entry.user_ids), codec, blob, time.time())
+        self._queue(entry.game_id, row)
+
+    def discard(self, entry: ActiveGame):
+        """Drop a finished game's checkpoint."""
+        self._queue(entry.game_id, None)
+
+    def _queue(self, game_id: str, row: Optional[tuple]):
+        with self._lock:
+            self._pending[game_id] = row
+        self._ensure_writer()
+        self._wake.set()
+
+    def _run(self):
+        conn = self._open()
+        while True:
+            self._wake.wait()
+            if not self._closed:
+                time.sleep(COALESCE_SECONDS)  # Let the rest of this burst land in the same commit
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._wake.clear()
+            if pending:
+                try:
+                    with conn:
+                        conn.execute("BEGIN IMMEDIATE")
+                        conn.executemany(UPSERT_SQL, [row for row in pending.values() if row is not None])
+                        conn.executemany("DELETE FROM checkpoints WHERE game_id = ?",
+                                         [(game_id,) for game_id, row in pending.items() if row is None])
+                except sqlite3.Error as e:
+                    logger.error(f"❌ Checkpoint write failed ({len(pending)} games): {e}")
+            if self._closed:
+                conn.close()
+                return
+
+    def close(self):
+        """Commit anything pending and stop the writer."""
+        self._closed = True
+        if self._writer is not None:
+            self._wake.set()
+            self._writer.join()
+
+    # Restore
+
+    def register_restorer(self, mode: str, restorer: Restorer):
+        """restorer(thread, user_ids, state) rebuilds one game of this mode and resumes its turn."""
+        self._restorers[mode] = restorer
+
+    def install(self, bot):
+        self.bot = bot
+        games.end_hooks.append(self.discard)
+        bot.add_listener(self.restore, "on_ready")
+
+    def _load(self) -> List[sqlite3.Row]:
+        conn = self._open()
+        conn.row_factory = sqlite3.Row
+        try:
+            return conn.execute("SELECT * FROM checkpoints ORDER BY updated_at").fetchall()
+        finally:
+            conn.close()
+
+    async def restore(self):
+        """Resume this process's checkpointed games; runs once, on the first ready."""
+        bot = self.bot
+        if self._restored:
+            return
+        self._restored = True
+
+        restored = 0
+        for row in self._load():
+            guild = bot.get_guild(row["guild_id"]) if row["guild_id"] else None
+            if row["guild_id"] and guild is None:
+                continue  # Another shard process serves this guild
+            if games.get(row["game_id"]) is not None:
+                continue
+            restorer = self._restorers.get(row["mode"])
+            if restorer is None:
+                logger.warning(f"⚠️ No restorer for {row['mode']}; keeping checkpoint {row['game_id']}")
+                continue
+
+            thread = bot.get_channel(row["thread_id"])
+            if thread is None:
+                try:
+                    thread = await bot.fetch_channel(row["thread_id"])
+                except discord.NotFound:
+                    self._queue(row["game_id"], None)  # Thread is gone, and the game with it
+                    continue
+                except discord.HTTPException as e:
+                    logger.error(f"❌ Could not fetch thread for {row['game_id']}: {e}")
+                    continue
+
+            try:
+                state = _unpack(row["codec"], row["state"])
+                await restorer(thread, json.loads(row["user_ids"]), state)
+                restored += 1
+            except Exception:
+                logger.exception(f"❌ Failed to restore {row['game_id']}")
+        if restored:
+            logger.info(f"♻️ Restored {restored} game(s) from checkpoints")
+
+
+checkpoints = CheckpointStore()
+atexit.register(checkpoints.close)
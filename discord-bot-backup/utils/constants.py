@@ -9,6 +9,7 @@ CHANNEL_MAIN_MENU = "risk-reward-hub"  # Optional: channel for main menu interfa
 CHANNEL_PLAY_MINIGAMES_ID = 1393415841525137428  # ✅ play-risk-reward
 CHANNEL_GENERAL_CHAT_ID = 1172097033012777001
 CHANNEL_PVP_REQUESTS_ID = 1393416695753740289  # ✅ pvp-requests (used for join announcements)
+CHANNEL_MULTIPLAYER_REQUESTS_ID = 1397794189680574474  # ✅ multiplayer-requests (lobby threads and join buttons)
 
 # Compatibility alias for legacy imports
 GENERAL_CHAT_CHANNEL_ID = CHANNEL_GENERAL_CHAT_ID
@@ -39,4 +40,5 @@ POINT_VALUES = [1, 2, 3, 5, 8, 13, 21]
 
 # === FILE PATHS ===
 CARD_IMAGE_FOLDER = "/cards/"              # Relative path or hosted URL base
+CARD_IMAGE_BASE_URL = "https://thecryptorabbithole.io/risk_reward/cards/"  # Card embeds
 LEADERBOARD_FILE = "leaderboard.json"      # Local leaderboard storage
@@ -0,0 +1,103 @@
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
+
+import discord
+
+from utils.card_assets import card_image_url
+from utils.outbound import outbox
+
+BOARD_LOG_LINES = 6        # Recent events kept on the board
+FIELD_LIMIT = 1024         # Discord embed field value limit
+
+_KEEP = object()
+
+BoardFields = Callable[[], List[Tuple[str, str]]]
+
+
+class GameBoard:
+    """
+    One pinned embed per game, edited in place as the game moves on.
+
+    The board shows the round and scores (from fields(), read at every
+    update), the current card and roll, the prompt for whoever acts next with
+    its buttons, and the last few events. Edits go through the thread's outbox,
+    so several updates between two deliveries become one edit. Only milestones
+    (penalties, game over) are posted as their own messages.
+    """
+
+    def __init__(self, thread: discord.abc.Messageable, title: str, fields: BoardFields):
+        self.thread = thread
+        self.title = title
+        self.fields = fields
+        self.message: Optional[discord.Message] = None
+        self.card = None
+        self.roll: Optional[int] = None
+        self.prompt: Optional[str] = None
+        self.view: Optional[discord.ui.View] = None
+        self.log: Deque[str] = deque(maxlen=BOARD_LOG_LINES)
+        self.finished = False
+
+    def render(self) -> discord.Embed:
+        embed = discord.Embed(
+            title=self.title,
+            description=self.prompt,
+            color=discord.Color.dark_grey() if self.finished else discord.Color.gold(),
+        )
+        for name, value in self.fields():
+            embed.add_field(name=name, value=value, inline=True)
+        if self.card is not None:
+            embed.add_field(name="🎴 Card", value=repr(self.card), inline=True)
+            url = card_image_url(self.card, thumbnail=True)
+            if url:
+                embed.set_thumbnail(url=url)  # Small enough that the prompt and buttons stay in view
+        if self.roll is not None:
+            embed.add_field(name="🎲 Last roll", value=str(self.roll), inline=True)
+        if self.log:
+            embed.add_field(name="📜 Latest", value="\n".join(self.log)[-FIELD_LIMIT:], inline=False)
+        return embed
+
+    async def update(self, *, log: Optional[str] = None, prompt=_KEEP, view=_KEEP, card=_KEEP, roll=_KEEP):
+        """Apply changes and queue one edit; view=None removes the buttons."""
+        if log:
+            self.log.append(log)
+        if prompt is not _KEEP:
+            self.prompt = prompt
+        if view is not _KEEP:
+            self.view = view
+        if card is not _KEEP:
+            self.card = card
+        if roll is not _KEEP:
+            self.roll = roll
+
+        if self.message is None:
+            self.message = await outbox(self.thread).send(embed=self.render(), view=self.view, wait=True)
+            try:
+                await self.message.pin(reason="Game board")
+            except discord.HTTPException:
+                pass  # Pinning needs Manage Messages; the board works without it
+        else:
+            outbox(self.thread).edit(self.message, embed=self.render(), view=self.view)
+
+    async def milestone(self, text: str, **kwargs):
+        """Post text as its own message (and note it on the board)."""
+        self.log.append(text.splitlines()[0])
+        await outbox(self.thread).send(text, **kwargs)
+        if self.message is not None:
+            outbox(self.thread).edit(self.message, embed=self.render(), view=self.view)
+
+    def snapshot(self) -> dict:
+        """What a checkpoint needs to pick this board up again after a restart."""
+        return {"message_id": self.message.id if self.message is not None else None, "log": list(self.log)}
+
+    def restore(self, state: Optional[dict]):
+        """Reattach to a checkpointed board message instead of posting a new one."""
+        if not state:
+            return
+        self.log.extend(state.get("log", ()))
+        if state.get("message_id"):
+            self.message = self.thread.get_partial_message(state["message_id"])
+
+    async def finish(self, prompt: Optional[str] = None):
+        """Final state: drop the buttons and grey the board out."""
+        self.finished = True
+        await self.update(prompt=prompt, view=None)
@@ -0,0 +1,172 @@
+import itertools
+import logging
+import time
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+UserCleanup = Callable[[int], None]
+
+
+class GameConflict(Exception):
+    """A user already has an active game (in any mode)."""
+
+    def __init__(self, user_id: int, existing: "ActiveGame"):
+        super().__init__(f"User {user_id} already has an active {existing.mode} game ({existing.game_id})")
+        self.user_id = user_id
+        self.existing = existing
+
+
+class ActiveGame:
+    """One running game: its players, thread, and whatever the owning cog keeps in data."""
+    __slots__ = ("game_id", "mode", "game", "thread", "user_ids", "data", "on_user_end", "started_at")
+
+    def __init__(self, game_id: str, mode: str, game: Any, thread, user_ids, data, on_user_end):
+        self.game_id = game_id
+        self.mode = mode
+        self.game = game
+        self.thread = thread
+        self.user_ids = list(user_ids)
+        self.data = data
+        self.on_user_end = on_user_end
+        self.started_at = time.monotonic()
+
+    def __repr__(self):
+        return f"<ActiveGame {self.game_id} users={self.user_ids}>"
+
+
+class GameRegistry:
+    """
+    Every active game across all modes, indexed by game id, user id and thread id.
+
+    A user can be in one game at a time; register() and add_users() refuse a
+    second. end() is the single cleanup path: it drops all three indexes and
+    runs the mode's per-user cleanup (turn timers, idle counters). Games whose
+    thread is deleted are ended from the gateway event, so nothing outlives its
+    thread.
+    """
+
+    def __init__(self):
+        self._by_id: Dict[str, ActiveGame] = {}
+        self._by_user: Dict[int, ActiveGame] = {}
+        self._by_thread: Dict[int, ActiveGame] = {}
+        self._ids = itertools.count(1)
+        self.end_hooks: List[Callable[[ActiveGame], None]] = []  # Run for every ended game (checkpoint cleanup)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def install(self, bot):
+        bot.add_listener(self._on_thread_delete, "on_thread_delete")
+
+    def register(self, mode: str, game: Any, thread=None, user_ids: Iterable[int] = (), data=None,
+                 on_user_end: Optional[UserCleanup] = None) -> ActiveGame:
+        user_ids = list(user_ids)
+        for user_id in user_ids:
+            self._check_free(user_id)
+        game_id = f"{mode}-{thread.id}" if thread is not None else f"{mode}-{next(self._ids)}"
+        entry = ActiveGame(game_id, mode, game, thread, user_ids, data if data is not None else {}, on_user_end)
+        self._by_id[game_id] = entry
+        for user_id in user_ids:
+            self._by_user[user_id] = entry
+        if thread is not None:
+            self._by_thread[thread.id] = entry
+        return entry
+
+    def add_users(self, entry: ActiveGame, user_ids: Iterable[int]):
+        """Add players to a game (lobby joins); raises GameConflict for anyone already playing."""
+        user_ids = [user_id for user_id in user_ids if self._by_user.get(user_id) is not entry]
+        for user_id in user_ids:
+            self._check_free(user_id)
+        for user_id in user_ids:
+            entry.user_ids.append(user_id)
+            self._by_user[user_id] = entry
+
+    def get(self, game_id: str) -> Optional[ActiveGame]:
+        return self._by_id.get(game_id)
+
+    def for_user(self, user_id: int) -> Optional[ActiveGame]:
+        return self._by_user.get(user_id)
+
+    def for_thread(self, thread_id: int) -> Optional[ActiveGame]:
+        return self._by_thread.get(thread_id)
+
+    def end(self, entry: Optional[ActiveGame]) -> Optional[ActiveGame]:
+        """Remove a game from every index and run its per-user cleanup; safe to call twice."""
+        if entry is None or self._by_id.pop(entry.game_id, None) is None:
+            return None
+        for user_id in entry.user_ids:
+            if self._by_user.get(user_id) is entry:
+                del self._by_user[user_id]
+            if entry.on_user_end is not None:
+                try:
+                    entry.on_user_end(user_id)
+                except Exception as e:
+                    logger.error(f"❌ Cleanup for user {user_id} in {entry.game_id} failed: {e}")
+        if entry.thread is not None and self._by_thread.get(entry.thread.id) is entry:
+            del self._by_thread[entry.thread.id]
+        for hook in self.end_hooks:
+            hook(entry)
+        return entry
+
+    def mode(self, mode: str, on_user_end: Optional[UserCleanup] = None) -> "ModeGames":
+        return ModeGames(self, mode, on_user_end)
+
+    def _check_free(self, user_id: int):
+        existing = self._by_user.get(user_id)
+        if existing is not None:
+            raise GameConflict(user_id, existing)
+
+    async def _on_thread_delete(self, thread: discord.Thread):
+        entry = self.end(self._by_thread.get(thread.id))
+        if entry is not None:
+            logger.info(f"🧹 Ended {entry.game_id}: its thread was deleted")
+
+
+class ModeGames(MutableMapping):
+    """
+    One mode's games as a user id -> data dict mapping, backed by the registry.
+
+    Drop-in for the per-cog active_games dicts: assigning registers the game
+    (thread taken from data["thread"]), pop/del ends it, and lookups by any of
+    the game's players are O(1).
+    """
+
+    def __init__(self, registry: GameRegistry, mode: str, on_user_end: Optional[UserCleanup] = None):
+        self.registry = registry
+        self.mode_name = mode
+        self.on_user_end = on_user_end
+
+    def entry(self, user_id: int) -> Optional[ActiveGame]:
+        entry = self.registry.for_user(user_id)
+        return entry if entry is not None and entry.mode == self.mode_name else None
+
+    def __getitem__(self, user_id: int) -> Dict[str, Any]:
+        entry = self.entry(user_id)
+        if entry is None:
+            raise KeyError(user_id)
+        return entry.data
+
+    def __setitem__(self, user_id: int, data: Dict[str, Any]):
+        self.registry.register(self.mode_name, data.get("game"), data.get("thread"), [user_id], data, self.on_user_end)
+
+    def __delitem__(self, user_id: int):
+        entry = self.entry(user_id)
+        if entry is None:
+            raise KeyError(user_id)
+        self.registry.end(entry)
+
+    def __iter__(self) -> Iterator[int]:
+        return (user_id for user_id, entry in list(self.registry._by_user.items()) if entry.mode == self.mode_name)
+
+    def __len__(self) -> int:
+        return sum(1 for entry in self.registry._by_id.values() if entry.mode == self.mode_name)
+
+    def __repr__(self):
+        return f"<ModeGames {self.mode_name}: {len(self)} active>"
+
+
+games = GameRegistry()
@@ -1,17 +1,85 @@
+import atexit
+import bisect
+import functools
 import json
 import os
+import queue
+import sqlite3
 import tempfile
+import threading
 import time
+from concurrent.futures import Future
 from datetime import datetime, timezone
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
-DB_PATH = os.path.join(DATA_DIR, "leaderboard.json")
+DB_PATH = os.path.join(DATA_DIR, "leaderboard.db")
+# Legacy store; now an import/export format (imported once into an empty database)
+JSON_PATH = os.path.join(DATA_DIR, "leaderboard.json")
 
-# One global async lock to serialize writes
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    user_id      TEXT PRIMARY KEY,
+    name         TEXT NOT NULL,
+    score        INTEGER NOT NULL DEFAULT 0,
+    games_played INTEGER NOT NULL DEFAULT 0,
+    wins         INTEGER NOT NULL DEFAULT 0,
+    losses       INTEGER NOT NULL DEFAULT 0,
+    last_seen    TEXT
+);
+-- Leaderboard order is kept in memory (_ranking); the old rank index was never read
+DROP INDEX IF EXISTS idx_players_rank;
+CREATE INDEX IF NOT EXISTS idx_players_wins ON players (wins DESC);
+
+-- Append-only match log
+CREATE TABLE IF NOT EXISTS games (
+    seq          INTEGER PRIMARY KEY AUTOINCREMENT,
+    id           TEXT NOT NULL,
+    winner_id    TEXT,
+    winner_name  TEXT,
+    score        INTEGER,
+    mode         TEXT,
+    players      TEXT NOT NULL,  -- JSON list of participant ids
+    timestamp    TEXT NOT NULL,
+    duration_sec INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_games_timestamp ON games (timestamp);
+"""
+
+PLAYER_COLUMNS = ("name", "score", "games_played", "wins", "losses", "last_seen")
+
+UPSERT_PLAYER_SQL = """
+INSERT INTO players (user_id, name, score, games_played, wins, losses, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(user_id) DO UPDATE SET
+    name = excluded.name, score = excluded.score, games_played = excluded.games_played,
+    wins = excluded.wins, losses = excluded.losses, last_seen = excluded.last_seen
+"""
+
+INSERT_GAME_SQL = """
+INSERT INTO games (id, winner_id, winner_name, score, mode, players, timestamp, duration_sec)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# A failed commit is retried with backoff (sqlite busy/locked, disk errors)
+RETRY_MIN_SECONDS = 1.0
+RETRY_MAX_SECONDS = 60.0
+CLOSE_RETRIES = 3  # Attempts left for queued changes once the writer is closing
+
+# Serializes startup and mutations of the in-memory copy on the event loop
 _write_lock = asyncio.Lock()
 
+# Read copy of the players table, kept current on the event loop; the writer
+# thread persists the same changes behind it
+_players: Dict[str, Dict[str, Any]] = {}
+# (rank key, user id) for every player, in leaderboard order
+_ranking: List[Tuple[Tuple[int, int, int], str]] = []
+_writer: Optional["_LeaderboardWriter"] = None
+
+# Set in shard processes: the public API then runs in the state host (utils/shared_state.py)
+_remote = None
+
 # -------------- Low-level helpers --------------
 
 def _now_iso() -> str:
@@ -23,7 +91,7 @@ def _ensure_data_dir():
     os.makedirs(DATA_DIR, exist_ok=True)
 
 def _default_db() -> Dict[str, Any]:
-    """Returns the default structure for the leaderboard database."""
+    """Returns the default structure of the JSON import/export format."""
     return {"version": 1, "players": {}, "games": []}
 
 def _atomic_write(path: str, data_str: str) -> None:
@@ -43,54 +111,285 @@ def _atomic_write(path: str, data_str: str) -> None:
         except Exception:
             pass
 
-def _load_db_sync() -> Dict[str, Any]:
-    """Loads the leaderboard database synchronously."""
-    _ensure_data_dir()
-    if not os.path.exists(DB_PATH):
-        return _default_db()
-    with open(DB_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+def _open(readonly: bool = False) -> sqlite3.Connection:
+    """Opens a connection to the SQLite store (WAL lets readers run beside the writer)."""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    if not readonly:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")  # WAL keeps commits durable across app crashes
+        conn.executescript(SCHEMA)
+    return conn
+
+def _player_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {"user_id": row["user_id"], **{col: row[col] for col in PLAYER_COLUMNS}}
+
+def _normalize_players(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Players of a JSON-format dump, keyed by string id with every column present."""
+    players = {}
+    for uid, p in (data.get("players") or {}).items():
+        players[str(uid)] = {
+            "name": p.get("name", str(uid)),
+            "score": int(p.get("score", 0)),
+            "games_played": int(p.get("games_played", 0)),
+            "wins": int(p.get("wins", 0)),
+            "losses": int(p.get("losses", 0)),
+            "last_seen": p.get("last_seen"),
+        }
+    return players
+
+def _game_params(g: Dict[str, Any]) -> Tuple:
+    return (
+        str(g.get("id") or g.get("timestamp")),
+        None if g.get("winner_id") is None else str(g["winner_id"]),
+        g.get("winner_name"), g.get("score"), g.get("mode"),
+        json.dumps([str(uid) for uid in g.get("players", [])]),
+        g.get("timestamp") or _now_iso(), g.get("duration_sec"),
+    )
 
-def _save_db_sync(db: Dict[str, Any]) -> None:
-    """Saves the leaderboard database synchronously."""
+def _rank_key(p: Dict[str, Any]) -> Tuple[int, int, int]:
+    """Leaderboard order: score desc, wins desc, games_played asc."""
+    return (-p["score"], -p["wins"], p["games_played"])
+
+def _rebuild_ranking() -> None:
+    _ranking[:] = sorted((_rank_key(p), uid) for uid, p in _players.items())
+
+def _upsert_params(uid: str, p: Dict[str, Any]) -> Tuple:
+    return (uid, *(p[col] for col in PLAYER_COLUMNS))
+
+def _import_sync(conn: sqlite3.Connection, data: Dict[str, Any], replace: bool = False) -> None:
+    """Loads a JSON-format dump. Players are merged by id (or replace everything when replace=True)."""
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        if replace:
+            conn.execute("DELETE FROM players")
+            conn.execute("DELETE FROM games")
+        conn.executemany(UPSERT_PLAYER_SQL, [_upsert_params(uid, p) for uid, p in _normalize_players(data).items()])
+        conn.executemany(INSERT_GAME_SQL, [_game_params(g) for g in (data.get("games") or [])])
+
+def _export_sync() -> Dict[str, Any]:
+    """Dumps the whole store in the legacy JSON format (from committed data)."""
+    conn = _open(readonly=True)
+    try:
+        db = _default_db()
+        for row in conn.execute("SELECT * FROM players ORDER BY user_id"):
+            player = _player_row(row)
+            db["players"][player.pop("user_id")] = player
+        for row in conn.execute("SELECT * FROM games ORDER BY seq"):
+            db["games"].append({
+                "id": row["id"],
+                "winner_id": row["winner_id"],
+                "winner_name": row["winner_name"],
+                "score": row["score"],
+                "mode": row["mode"],
+                "players": json.loads(row["players"]),
+                "timestamp": row["timestamp"],
+                "duration_sec": row["duration_sec"],
+            })
+        return db
+    finally:
+        conn.close()
+
+def _start_sync() -> Tuple[Dict[str, Dict[str, Any]], "_LeaderboardWriter"]:
+    """Opens the store (importing the legacy JSON file if it is new), loads the read copy, starts the writer."""
     _ensure_data_dir()
-    # Tiny backup rotation (keep 1 copy)
-    if os.path.exists(DB_PATH):
-        try:
-            os.replace(DB_PATH, DB_PATH + ".bak")
-        except Exception:
-            pass
-    data_str = json.dumps(db, ensure_ascii=False, indent=2)
-    _atomic_write(DB_PATH, data_str)
+    conn = _open()
+    empty = conn.execute("SELECT NOT EXISTS (SELECT 1 FROM players) AND NOT EXISTS (SELECT 1 FROM games)").fetchone()[0]
+    if empty and os.path.exists(JSON_PATH):
+        with open(JSON_PATH, "r", encoding="utf-8") as f:
+            _import_sync(conn, json.load(f))
+        print(f"[leaderboard] Imported {JSON_PATH} into {DB_PATH}")
+    players = {}
+    for row in conn.execute("SELECT * FROM players"):
+        player = _player_row(row)
+        players[player.pop("user_id")] = player
+    writer = _LeaderboardWriter(conn)
+    writer.start()
+    return players, writer
+
+# -------------- Writer thread --------------
+
+class _LeaderboardWriter(threading.Thread):
+    """
+    Owns the write connection. Each wake-up drains everything queued since the
+    last one and commits it as a single transaction, so a burst of results costs
+    one commit. Player rows are written as absolute values from the read copy,
+    so repeated updates to the same player in a batch collapse to one upsert.
+    A batch that fails to commit stays queued and is retried with backoff, so
+    the disk catches up with the read copy instead of losing the results.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        super().__init__(name="leaderboard-writer", daemon=True)
+        self.conn = conn
+        self.queue: "queue.Queue[Optional[Tuple[str, Any, Optional[Future]]]]" = queue.Queue()
+
+    def submit(self, kind: str, payload: Any = None) -> Future:
+        done: Future = Future()
+        self.queue.put((kind, payload, done))
+        return done
+
+    def close(self):
+        self.queue.put(None)
+        self.join()
+
+    def run(self):
+        pending: List[Tuple[str, Any, Future]] = []  # Queued changes not yet on disk, in order
+        delay = RETRY_MIN_SECONDS
+        stop = False
+        attempts_left = CLOSE_RETRIES
+        while True:
+            if not stop:
+                batch = []
+                try:
+                    # While a failed batch waits, new changes still join it; otherwise retry after the delay
+                    batch.append(self.queue.get(timeout=delay if pending else None))
+                    while True:
+                        batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    pass
+                stop = None in batch
+                pending.extend(op for op in batch if op is not None)
+            try:
+                self._write(pending)
+                delay = RETRY_MIN_SECONDS
+            except sqlite3.Error as e:
+                print(f"❌ Leaderboard write failed ({len(pending)} queued changes), retrying in {delay:g}s: {e}")
+                if stop:
+                    attempts_left -= 1
+                    if attempts_left > 0:
+                        time.sleep(delay)
+                    else:
+                        print(f"❌ Leaderboard closing with {len(pending)} unsaved changes; they are lost")
+                        for _, _, done in pending:
+                            done.set_exception(e)
+                        pending.clear()
+                delay = min(delay * 2, RETRY_MAX_SECONDS)
+            if stop and not pending:
+                self.conn.close()
+                return
+
+    def _write(self, ops: List[Tuple[str, Any, Future]]):
+        """
+        Commits ops in queue order, removing each run of them from ops once it is
+        on disk. A sqlite error leaves the rest in ops for the next attempt; an
+        import that is itself invalid fails on its own and is dropped.
+        """
+        while ops:
+            if ops[0][0] == "import":
+                segment = ops[:1]
+                data, replace = segment[0][1]
+                try:
+                    _import_sync(self.conn, data, replace=replace)
+                except (ValueError, TypeError, KeyError, AttributeError) as e:
+                    print(f"❌ Leaderboard import rejected: {e}")
+                    del ops[:1]
+                    segment[0][2].set_exception(e)
+                    continue
+            else:
+                # Everything up to the next import goes in one transaction
+                end = next((i for i, op in enumerate(ops) if op[0] == "import"), len(ops))
+                segment = ops[:end]
+                games: List[Tuple] = []
+                players: Dict[str, Dict[str, Any]] = {}
+                for kind, payload, _ in segment:
+                    if kind == "game":
+                        game, snapshot = payload
+                        games.append(_game_params(game))
+                        players.update(snapshot)
+                if games or players:
+                    with self.conn:
+                        self.conn.execute("BEGIN IMMEDIATE")
+                        self.conn.executemany(UPSERT_PLAYER_SQL, [_upsert_params(uid, p) for uid, p in players.items()])
+                        self.conn.executemany(INSERT_GAME_SQL, games)
+            del ops[:len(segment)]
+            for _, _, done in segment:
+                done.set_result(None)
 
 # -------------- Public async API --------------
 
+def use_remote(service) -> None:
+    """Forwards the public API to the state host's leaderboard service instead of a local store."""
+    global _remote
+    _remote = service
+
+def _shared(fn):
+    """Runs fn in the state host when this process is one shard of several."""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        if _remote is not None:
+            return await asyncio.to_thread(_remote.call, fn.__name__, args, kwargs)
+        return await fn(*args, **kwargs)
+    return wrapper
+
+async def _ensure_started() -> "_LeaderboardWriter":
+    global _players, _writer
+    if _writer is None:
+        async with _write_lock:
+            if _writer is None:
+                _players, _writer = await asyncio.to_thread(_start_sync)
+                _rebuild_ranking()
+    return _writer
+
+@_shared
+async def flush() -> None:
+    """Waits until every change queued so far is committed."""
+    writer = await _ensure_started()
+    await asyncio.wrap_future(writer.submit("flush"))
+
+def close() -> None:
+    """Commits queued changes and stops the writer thread (also runs at interpreter exit)."""
+    global _writer
+    if _writer is not None:
+        _writer.close()
+        _writer = None
+
+atexit.register(close)
+
+def _apply_import(data: Dict[str, Any], replace: bool) -> None:
+    """Applies a JSON-format dump to the read copy and queues it for the writer."""
+    players = _normalize_players(data)
+    if replace:
+        _players.clear()
+    _players.update(players)
+    _rebuild_ranking()
+    _writer.submit("import", (data, replace))
+
+@_shared
 async def load_db() -> Dict[str, Any]:
-    """Loads the leaderboard database asynchronously."""
-    return _load_db_sync()
+    """Exports the whole leaderboard in the JSON format ({"version", "players", "games"})."""
+    await flush()
+    return await asyncio.to_thread(_export_sync)
 
+@_shared
 async def save_db(db: Dict[str, Any]) -> None:
-    """Saves the leaderboard database asynchronously."""
-    async with _write_lock:
-        _save_db_sync(db)
-
-async def upsert_player(db: Dict[str, Any], user_id: str, name: str) -> None:
-    """Adds or updates a player's information in the database."""
-    p = db["players"].get(user_id)
-    if p is None:
-        db["players"][user_id] = {
-            "name": name,
-            "score": 0,
-            "games_played": 0,
-            "wins": 0,
-            "losses": 0,
-            "last_seen": _now_iso(),
-        }
-    else:
-        # Keep the latest display name & timestamp
-        p["name"] = name
-        p["last_seen"] = _now_iso()
+    """Replaces the leaderboard with a JSON-format dump (written in the background)."""
+    await _ensure_started()
+    _apply_import(db, replace=True)
 
+@_shared
+async def import_json(path: str = JSON_PATH, replace: bool = False) -> None:
+    """Imports a JSON leaderboard file (merging players by id unless replace=True)."""
+    await _ensure_started()
+
+    def read():
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    _apply_import(await asyncio.to_thread(read), replace)
+
+@_shared
+async def export_json(path: str = JSON_PATH) -> None:
+    """Writes the leaderboard to a JSON file (atomically)."""
+    await flush()
+
+    def write():
+        _ensure_data_dir()
+        _atomic_write(path, json.dumps(_export_sync(), ensure_ascii=False, indent=2))
+
+    await asyncio.to_thread(write)
+
+@_shared
 async def record_game_result(
     *,
     winner_id: Optional[str],
@@ -102,46 +401,15 @@ async def record_game_result(
     duration_sec: Optional[int] = None,
     game_id: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Records the result of a game in the leaderboard database."""
+    """Records the result of a game; returns the game record. Reads see it at once, the disk write is queued."""
     try:
-        print("DEBUG: record_game_result called with the following parameters:")
-        print(f"  Winner ID: {winner_id}")
-        print(f"  Winner Name: {winner_name}")
-        print(f"  Score: {score}")
-        print(f"  Mode: {mode}")
-        print(f"  Participant IDs: {participant_ids}")
-        print(f"  Participant Names: {participant_names}")
-        print(f"  Duration (sec): {duration_sec}")
-        print(f"  Game ID: {game_id}")
-
-        db = await load_db()
-
-        # Ensure all participants exist in players map
-        for uid, name in zip(participant_ids, participant_names):
-            await upsert_player(db, uid, name)
-
-        # Update winner stats
-        if winner_id:
-            wp = db["players"][winner_id]
-            wp["score"] = int(wp.get("score", 0)) + int(score)
-            wp["wins"] = int(wp.get("wins", 0)) + 1
-            wp["games_played"] = int(wp.get("games_played", 0)) + 1
-
-        # Update other participants as losses
-        for uid in participant_ids:
-            if uid == winner_id:
-                continue
-            pp = db["players"][uid]
-            pp["losses"] = int(pp.get("losses", 0)) + 1
-            pp["games_played"] = int(pp.get("games_played", 0)) + 1
-
-        # Append game record
+        writer = await _ensure_started()
+        # Discord ids arrive as ints or strings; store them as strings so players don't split
+        participant_ids = [str(uid) for uid in participant_ids]
+        winner_id = None if winner_id is None else str(winner_id)
         ts = _now_iso()
-        if not game_id:
-            game_id = f"{ts}"  # Include timestamp to make it unique
-
-        db["games"].append({
-            "id": game_id,
+        game = {
+            "id": game_id or ts,  # Timestamp keeps generated ids unique
             "winner_id": winner_id,
             "winner_name": winner_name,
             "score": score,
@@ -149,34 +417,38 @@ async def record_game_result(
             "players": participant_ids,
             "timestamp": ts,
             "duration_sec": duration_sec,
-        })
-
-        await save_db(db)
-        return db
-
+        }
+        snapshot = {}
+        for uid, name in zip(participant_ids, participant_names):
+            p = _players.get(uid)
+            if p is None:
+                p = _players[uid] = {"name": name, "score": 0, "games_played": 0, "wins": 0, "losses": 0, "last_seen": ts}
+            else:
+                del _ranking[bisect.bisect_left(_ranking, (_rank_key(p), uid))]
+            won = uid == winner_id
+            p["name"] = name
+            p["score"] += int(score) if won else 0
+            p["games_played"] += 1
+            p["wins"] += int(won)
+            p["losses"] += int(not won)
+            p["last_seen"] = ts
+            bisect.insort(_ranking, (_rank_key(p), uid))
+            snapshot[uid] = dict(p)
+        writer.submit("game", (game, snapshot))
+        return game
     except Exception as e:
         print(f"❌ Error in record_game_result: {e}")
         raise
 
+@_shared
 async def get_top_players(limit: int = 20) -> List[Dict[str, Any]]:
     """Returns the top players sorted by score, wins, and games played."""
-    db = await load_db()
-    # Sort by score desc, then wins desc, then games_played asc
-    players = list(db["players"].items())
-    players.sort(key=lambda kv: (-kv[1].get("score", 0), -kv[1].get("wins", 0), kv[1].get("games_played", 0)))
-    top = []
-    for uid, pdata in players[:limit]:
-        row = {"user_id": uid}
-        row.update(pdata)
-        top.append(row)
-    return top
+    await _ensure_started()
+    return [{"user_id": uid, **_players[uid]} for _, uid in _ranking[:limit]]
 
+@_shared
 async def get_player_stats(user_id: str) -> Optional[Dict[str, Any]]:
     """Returns the stats for a specific player."""
-    db = await load_db()
-    p = db["players"].get(user_id)
-    if not p:
-        return None
-    out = {"user_id": user_id}
-    out.update(p)
-    return out
\ No newline at end of file
+    await _ensure_started()
+    pdata = _players.get(str(user_id))
+    return {"user_id": str(user_id), **pdata} if pdata else None
@@ -0,0 +1,265 @@
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+MAX_MESSAGE_LENGTH = 2000
+MERGEABLE_KWARGS = {"content", "embed", "view", "file", "files"}
+
+# Discord allows about 5 messages per 5 seconds in a channel and 50 requests a second per bot
+CHANNEL_BUCKET = (5, 5.0)
+GLOBAL_BUCKET = (50, 1.0)
+
+EDIT_WINDOW_SECONDS = 3.0  # Text this soon after our last text message is appended to it
+IDLE_SECONDS = 60.0        # An idle outbox drops its worker task and leaves the registry
+
+
+class RateBucket:
+    """Token bucket mirroring a Discord rate limit; wait() blocks until a request may go out."""
+
+    def __init__(self, capacity: int, per: float):
+        self.capacity = capacity
+        self.rate = capacity / per
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self) -> float:
+        now = time.monotonic()
+        self._refill(now)
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    async def wait(self):
+        while (delay := self.delay()) > 0:
+            await asyncio.sleep(delay)
+        self.tokens -= 1
+
+    def block(self, seconds: float):
+        """Server said 429: hold everything in this bucket for retry_after."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0
+
+
+# The global limit is per bot token, so processes started by launcher.py split it
+_global_bucket = RateBucket(max(1, GLOBAL_BUCKET[0] // int(os.getenv("SHARD_PROCESSES", "1"))), GLOBAL_BUCKET[1])
+
+
+class _Outgoing:
+    """A queued message, an edit of target, or (kwargs None) a pause/drain marker for the worker."""
+    __slots__ = ("kwargs", "future", "pause", "target")
+
+    def __init__(self, kwargs: Optional[Dict[str, Any]] = None, pause: float = 0.0, target: Optional[discord.Message] = None):
+        self.kwargs = kwargs
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.pause = pause
+        self.target = target
+
+    @property
+    def text_only(self) -> bool:
+        return self.target is None and self.kwargs is not None and set(self.kwargs) == {"content"}
+
+    @property
+    def mergeable(self) -> bool:
+        return self.target is None and self.kwargs is not None and set(self.kwargs) <= MERGEABLE_KWARGS
+
+
+class ThreadOutbox:
+    """
+    Ordered outbound queue for one channel or thread.
+
+    send() only queues; one worker delivers in order, pacing against the
+    channel and global buckets. Runs of plain text, and text followed by a
+    single embed/view message, are merged into one message (or appended to our
+    previous text message with an edit), so a move that used to cost five sends
+    usually costs one. pause() spaces out bot-turn animation without blocking
+    the game logic that queued it.
+    """
+
+    def __init__(self, channel: discord.abc.Messageable):
+        self.channel = channel
+        self.bucket = RateBucket(*CHANNEL_BUCKET)
+        self._queue: Deque[_Outgoing] = deque()
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        self._last_text: Optional[discord.Message] = None
+        self._last_text_at = 0.0
+        self.stats = {"queued": 0, "sent": 0, "edited": 0, "rate_limited": 0}
+
+    async def send(self, content: Optional[str] = None, *, wait: bool = False, **kwargs) -> asyncio.Future:
+        """Queue a message (same arguments as channel.send); with wait=True returns the delivered message."""
+        if content is not None:
+            kwargs["content"] = str(content)
+        item = _Outgoing(kwargs)
+        self._queue.append(item)
+        self.stats["queued"] += 1
+        self._kick()
+        return await item.future if wait else item.future
+
+    def edit(self, message: discord.Message, **kwargs) -> asyncio.Future:
+        """Queue an edit of message; a still-queued edit of the same message (after the last pause) is updated in place instead."""
+        for item in reversed(self._queue):
+            if item.kwargs is None and item.pause:
+                break  # Keep paced states apart
+            if item.target is not None and item.target.id == message.id:
+                item.kwargs.update(kwargs)
+                return item.future
+        item = _Outgoing(kwargs, target=message)
+        self._queue.append(item)
+        self._kick()
+        return item.future
+
+    def pause(self, seconds: float):
+        """Hold later messages for seconds after everything queued so far is out."""
+        self._queue.append(_Outgoing(pause=seconds))
+        self._kick()
+
+    async def drain(self):
+        """Wait until everything queued so far is delivered."""
+        if not self._queue and (self._worker is None or self._worker.done()):
+            return
+        marker = _Outgoing()
+        self._queue.append(marker)
+        self._kick()
+        await marker.future
+
+    def _kick(self):
+        self._wakeup.set()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            if not self._queue:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), IDLE_SECONDS)
+                except asyncio.TimeoutError:
+                    if not self._queue:
+                        _outboxes.pop(getattr(self.channel, "id", id(self.channel)), None)
+                        return
+                continue
+            await asyncio.sleep(0)  # Let the caller finish queueing its burst
+            head = self._queue[0]
+            if head.kwargs is None:
+                self._queue.popleft()
+                if head.pause:
+                    await asyncio.sleep(head.pause)
+                head.future.set_result(None)
+                continue
+            if head.target is not None:
+                self._queue.popleft()
+                await self._deliver_edit(head)
+                continue
+            batch = self._take_batch()
+            await self._deliver(batch)
+
+    def _take_batch(self) -> List[_Outgoing]:
+        """Longest prefix of the queue that fits in one message."""
+        batch = [self._queue.popleft()]
+        if not batch[0].text_only:
+            return batch
+        length = len(batch[0].kwargs["content"])
+        while self._queue:
+            item = self._queue[0]
+            if not item.mergeable:
+                break
+            extra = len(item.kwargs.get("content") or "") + 1
+            if length + extra > MAX_MESSAGE_LENGTH:
+                break
+            batch.append(self._queue.popleft())
+            length += extra
+            if not item.text_only:
+                break  # At most one embed/view per message
+        return batch
+
+    async def _deliver(self, batch: List[_Outgoing]):
+        kwargs = dict(batch[-1].kwargs)
+        content = "\n".join(item.kwargs["content"] for item in batch if item.kwargs.get("content"))
+        if content:
+            kwargs["content"] = content
+        try:
+            message = await self._send_or_append(kwargs)
+        except Exception as e:
+            logger.error(f"❌ Outbound send failed in {getattr(self.channel, 'id', '?')}: {e}")
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(e)
+                    item.future.exception()  # Callers that don't await it shouldn't log "never retrieved"
+            return
+        for item in batch:
+            if not item.future.done():
+                item.future.set_result(message)
+
+    async def _deliver_edit(self, item: _Outgoing):
+        try:
+            message = await self._request(item.target.edit, **item.kwargs)
+            self.stats["edited"] += 1
+            item.future.set_result(message)
+        except Exception as e:
+            logger.error(f"❌ Outbound edit failed in {getattr(self.channel, 'id', '?')}: {e}")
+            item.future.set_exception(e)
+            item.future.exception()
+
+    async def _send_or_append(self, kwargs: Dict[str, Any]) -> discord.Message:
+        last = self._last_text
+        if (
+            set(kwargs) == {"content"}
+            and last is not None
+            and time.monotonic() - self._last_text_at < EDIT_WINDOW_SECONDS
+            and getattr(self.channel, "last_message_id", None) == last.id
+            and len(last.content) + 1 + len(kwargs["content"]) <= MAX_MESSAGE_LENGTH
+        ):
+            message = await self._request(last.edit, content=f"{last.content}\n{kwargs['content']}")
+            self.stats["edited"] += 1
+        else:
+            message = await self._request(self.channel.send, **kwargs)
+            self.stats["sent"] += 1
+        if set(kwargs) == {"content"}:
+            self._last_text, self._last_text_at = message, time.monotonic()
+        else:
+            self._last_text = None
+        return message
+
+    async def _request(self, call, **kwargs):
+        for attempt in range(3):
+            await self.bucket.wait()
+            await _global_bucket.wait()
+            try:
+                return await call(**kwargs)
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt == 2:
+                    raise
+                retry_after = float(getattr(e, "retry_after", None) or e.response.headers.get("Retry-After", 1))
+                self.stats["rate_limited"] += 1
+                self.bucket.block(retry_after)
+                logger.warning(f"⏳ Rate limited in {getattr(self.channel, 'id', '?')}, retrying in {retry_after:.1f}s")
+
+
+_outboxes: Dict[int, ThreadOutbox] = {}
+
+
+def outbox(channel: discord.abc.Messageable) -> ThreadOutbox:
+    """The channel's outbox, created on first use."""
+    key = getattr(channel, "id", id(channel))
+    box = _outboxes.get(key)
+    if box is None:
+        box = _outboxes[key] = ThreadOutbox(channel)
+    return box
+
+
+async def drain_outbox(channel: discord.abc.Messageable):
+    box = _outboxes.get(getattr(channel, "id", id(channel)))
+    if box is not None:
+        await box.drain()
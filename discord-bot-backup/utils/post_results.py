@@ -1,8 +1,16 @@
-from utils.constants import GENERAL_CHAT_CHANNEL_ID
+from utils.channel_registry import channels
+from utils.outbound import outbox
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+DIGEST_WINDOW_SECONDS = 5.0  # Results finishing within this window go out as one digest
+
+_pending_results: list[str] = []
+_digest_task: asyncio.Task = None
+
+
 async def post_results_to_channel(
     bot,
     winner_name: str,
@@ -12,64 +20,97 @@ async def post_results_to_channel(
     player_name=None
 ):
     """
-    Posts the final game result message in the general-chat channel.
+    Queues the final game result for the general-chat channel.
+
+    Results are collected for DIGEST_WINDOW_SECONDS and posted together, so a
+    burst of finished games becomes one digest instead of one message each.
     """
+    global _digest_task
     try:
-        channel = await bot.fetch_channel(GENERAL_CHAT_CHANNEL_ID)
+        message = format_result_message(winner_name, total_score, game_mode, player_names, player_name)
+        if not message:
+            return
+        _pending_results.append(message)
+        if _digest_task is None or _digest_task.done():
+            _digest_task = asyncio.create_task(_post_digest())
+    except Exception as e:
+        logger.exception(f"❌ Error posting final results")
+
+
+async def _post_digest():
+    while _pending_results:
+        await asyncio.sleep(DIGEST_WINDOW_SECONDS)
+        results = _pending_results[:]
+        _pending_results.clear()
+
+        channel = channels.get("general_chat")
         if not channel:
-            logger.error("❌ Could not find general chat channel. Check channel ID.")
+            logger.error(f"❌ Could not find general chat channel; dropped {len(results)} results. Check channel ID.")
+            continue
+
+        # The outbox packs these into as few messages as the length limit allows
+        box = outbox(channel)
+        if len(results) > 1:
+            await box.send(f"📰 **Results digest** — {len(results)} games just finished:")
+        for message in results:
+            await box.send(message)
+
+
+def format_result_message(
+    winner_name: str,
+    total_score: int,
+    game_mode: str,
+    player_names: list[str] = None,
+    player_name=None
+):
+    """The general-chat line for one finished game, or None if it can't be formatted."""
+    if game_mode == "pvp":
+        # PvP game logic
+        if not player_names or len(player_names) < 2:
+            logger.error("❌ PvP game requires two player names.")
             return
 
-        if game_mode == "pvp":
-            # PvP game logic
-            if not player_names or len(player_names) < 2:
-                logger.error("❌ PvP game requires two player names.")
-                return
+        player1_name, player2_name = player_names
+        message = (
+            f"⚔️ **PvP Battle Result** ⚔️\n"
+            f"🔹 **Players**: {player1_name} vs {player2_name}\n"
+            f"🏆 **Winner:** {winner_name} with **{total_score} sats**!"
+        )
+
+    elif game_mode.startswith("multiplayer"):
+        # Multiplayer game logic
+        players = ", ".join(player_names or [])
+        message = (
+            f"👥 **Multiplayer Match Result** ({game_mode})\n"
+            f"Players: {players}\n"
+            f"🏆 **Winner:** {winner_name} with **{total_score} sats**!"
+        )
 
-            player1_name, player2_name = player_names
+    else:
+        # Single-player bot match logic (e.g., Sandy, Aida, Lana, En-J1n)
+        bot_name = game_mode.title()
+        player_display = (
+            getattr(player_name, "display_name", None)
+            or getattr(player_name, "name", None)
+            or str(player_name)
+            or "Unknown Player"
+        )
+
+        # Ensure winner_name is a string for comparison
+        if winner_name == player_display:
             message = (
-                f"⚔️ **PvP Battle Result** ⚔️\n"
-                f"🔹 **Players**: {player1_name} vs {player2_name}\n"
-                f"🏆 **Winner:** {winner_name} with **{total_score} sats**!"
+                f"🏆 **{player_display}** won a match against **{bot_name}** "
+                f"and stacked **{total_score} sats**! 💥"
             )
-
-        elif game_mode.startswith("multiplayer"):
-            # Multiplayer game logic
-            players = ", ".join(player_names or [])
+        elif winner_name.lower() == bot_name.lower():
             message = (
-                f"👥 **Multiplayer Match Result** ({game_mode})\n"
-                f"Players: {players}\n"
-                f"🏆 **Winner:** {winner_name} with **{total_score} sats**!"
+                f"🎲 **{player_display}** played a match against {bot_name} but lost. "
+                f"🏆 {bot_name} stacked **{total_score} sats**. 🤖"
             )
-
         else:
-            # Single-player bot match logic (e.g., Sandy, Aida, Lana, En-J1n)
-            bot_name = game_mode.title()
-            player_display = (
-                getattr(player_name, "display_name", None)
-                or getattr(player_name, "name", None)
-                or str(player_name)
-                or "Unknown Player"
+            message = (
+                f"🎲 **{player_display}** completed a match against {bot_name}.\n"
+                f"🏁 Winner: **{winner_name}** with **{total_score} sats**."
             )
 
-            # Ensure winner_name is a string for comparison
-            if winner_name == player_display:
-                message = (
-                    f"🏆 **{player_display}** won a match against **{bot_name}** "
-                    f"and stacked **{total_score} sats**! 💥"
-                )
-            elif winner_name.lower() == bot_name.lower():
-                message = (
-                    f"🎲 **{player_display}** played a match against {bot_name} but lost. "
-                    f"🏆 {bot_name} stacked **{total_score} sats**. 🤖"
-                )
-            else:
-                message = (
-                    f"🎲 **{player_display}** completed a match against {bot_name}.\n"
-                    f"🏁 Winner: **{winner_name}** with **{total_score} sats**."
-                )
-
-        await channel.send(message)
-
-    except Exception as e:
-        logger.exception(f"❌ Error posting final results")
\ No newline at end of file
+    return message
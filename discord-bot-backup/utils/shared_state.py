@@ -0,0 +1,128 @@
+"""
+State shared by every shard process, served from the launcher over IPC.
+
+When the bot runs as several processes (see launcher.py), the leaderboard
+store and the tournament manager live only in the launcher, the "state
+host". Shards reach them through a multiprocessing manager on localhost, so
+there is one SQLite writer and one read copy, and restarting a shard loses
+nothing but that shard's own games. A single `python main.py` never connects
+and keeps everything in-process, as before.
+"""
+
+import asyncio
+import logging
+import os
+import secrets
+import threading
+from multiprocessing.managers import BaseManager, BaseProxy
+from typing import Any, Dict, Optional, Tuple
+
+from game_logic.tournament_manager import TournamentManager
+
+logger = logging.getLogger(__name__)
+
+STATE_ADDRESS_ENV = "RR_STATE_ADDRESS"   # host:port of the state host, set by the launcher
+STATE_AUTHKEY_ENV = "RR_STATE_AUTHKEY"   # hex authkey, set by the launcher
+
+# Leaderboard calls a shard may forward to the state host
+LEADERBOARD_CALLS = {
+    "load_db", "save_db", "import_json", "export_json", "flush",
+    "record_game_result", "get_top_players", "get_player_stats",
+}
+
+TOURNAMENT_METHODS = (
+    "add_player", "is_ready", "start_tournament", "get_next_match",
+    "report_match_winner", "get_bracket_summary", "reset_tournament",
+)
+
+
+class LeaderboardService:
+    """Runs leaderboard_store coroutines on a private event loop in the state host."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, name="leaderboard-loop", daemon=True).start()
+
+    def call(self, name: str, args: Tuple, kwargs: Dict[str, Any]) -> Any:
+        if name not in LEADERBOARD_CALLS:
+            raise ValueError(f"Unknown leaderboard call: {name}")
+        from utils import leaderboard_store
+        coro = getattr(leaderboard_store, name)(*args, **kwargs)
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+class TournamentProxy(BaseProxy):
+    """TournamentManager as seen from a shard: its methods plus the players and tournament_active fields."""
+    _exposed_ = TOURNAMENT_METHODS + ("__getattribute__",)
+
+    @property
+    def tournament_active(self) -> bool:
+        return self._callmethod("__getattribute__", ("tournament_active",))
+
+    @property
+    def players(self):
+        return self._callmethod("__getattribute__", ("players",))
+
+
+for _name in TOURNAMENT_METHODS:
+    setattr(TournamentProxy, _name, lambda self, *args, _name=_name: self._callmethod(_name, args))
+
+
+_leaderboard: Optional[LeaderboardService] = None
+_tournament: Optional[TournamentManager] = None
+
+
+def _get_leaderboard() -> LeaderboardService:
+    global _leaderboard
+    if _leaderboard is None:
+        _leaderboard = LeaderboardService()
+    return _leaderboard
+
+
+def _get_tournament() -> TournamentManager:
+    global _tournament
+    if _tournament is None:
+        _tournament = TournamentManager()
+    return _tournament
+
+
+class StateManager(BaseManager):
+    pass
+
+
+StateManager.register("leaderboard", callable=_get_leaderboard, exposed=("call",))
+StateManager.register("tournament", callable=_get_tournament, proxytype=TournamentProxy)
+
+
+def serve(host: str = "127.0.0.1", port: int = 0) -> Dict[str, str]:
+    """Start the state host in this process; returns the env vars shards need to connect."""
+    authkey = secrets.token_bytes(32)
+    server = StateManager(address=(host, port), authkey=authkey).get_server()
+    threading.Thread(target=server.serve_forever, name="state-host", daemon=True).start()
+    address = "%s:%d" % server.address
+    logger.info(f"🗄️ State host listening on {address}")
+    return {STATE_ADDRESS_ENV: address, STATE_AUTHKEY_ENV: authkey.hex()}
+
+
+_manager: Optional[StateManager] = None
+
+
+def connect() -> Optional[StateManager]:
+    """Connect to the launcher's state host, if this process is a shard; None when running alone."""
+    global _manager
+    if _manager is None and os.getenv(STATE_ADDRESS_ENV):
+        host, port = os.environ[STATE_ADDRESS_ENV].rsplit(":", 1)
+        manager = StateManager(address=(host, int(port)), authkey=bytes.fromhex(os.environ[STATE_AUTHKEY_ENV]))
+        manager.connect()
+
+        from utils import leaderboard_store
+        leaderboard_store.use_remote(manager.leaderboard())
+        _manager = manager
+        logger.info(f"🔗 Connected to state host at {host}:{port}")
+    return _manager
+
+
+def shared_tournament():
+    """The tournament manager every shard sees (a local one when running alone)."""
+    manager = connect()
+    return manager.tournament() if manager is not None else _get_tournament()
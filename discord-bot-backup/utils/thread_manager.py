@@ -1,5 +1,6 @@
 import discord
 from datetime import datetime
+from utils.outbound import outbox, drain_outbox
 
 async def create_game_thread(ctx, thread_title: str = None, game_mode: str = "game") -> discord.Thread | None:
     """
@@ -57,7 +58,8 @@ async def close_game_thread(thread: discord.Thread, message: str = None, reason:
     """
     try:
         if message:
-            await thread.send(message)
+            await outbox(thread).send(message)
+        await drain_outbox(thread)  # Queued game messages go out before the thread is archived
         await thread.edit(archived=True, reason=reason)
     except discord.HTTPException as e:
         print(f"⚠️ Error closing thread: {e}")
@@ -1,18 +1,26 @@
-import asyncio
 import discord
 from typing import Callable, Dict, Awaitable, Optional
 
+from utils.constants import TURN_TIMEOUT_SECONDS, MAX_IDLE_TURNS
+from utils.turn_timers import turn_timers
+from utils.outbound import outbox
+
 
 class TimeoutHandler:
-    def __init__(self, idle_turn_threshold: int = 5):
+    IDLE_TIMEOUT = TURN_TIMEOUT_SECONDS
+
+    def __init__(self, idle_turn_threshold: int = MAX_IDLE_TURNS):
         """
         Initializes the TimeoutHandler.
         :param idle_turn_threshold: Number of idle turns before a player forfeits.
         """
         self.idle_trackers: Dict[int, int] = {}           # Tracks idle turn counts: {user_id: idle_turns}
-        self.timeout_tasks: Dict[int, asyncio.Task] = {}  # Tracks running timeout tasks per user
         self.idle_turn_threshold = idle_turn_threshold    # Configurable idle turn threshold
 
+    def _key(self, user_id: int):
+        # Timers are shared across handlers; scope keys to this one
+        return (id(self), user_id)
+
     async def start_turn_timeout(
         self,
         user_id: int,
@@ -23,40 +31,27 @@ class TimeoutHandler:
     ):
         """
         Starts a timer for a player's turn. If the player doesn't respond in time,
-        the provided async callback is triggered.
+        the provided async callback is triggered. Restarting replaces the running timer.
         """
-        # Cancel existing timeout if already running
-        if user_id in self.timeout_tasks:
-            self.cancel_timeout(user_id)
-
-        async def timeout_coroutine():
-            try:
-                await asyncio.sleep(timeout_seconds)
-                if thread:
-                    await thread.send(f"⏰ {user_mention} took too long. Their turn is over.")
-                # Increment idle counter and check if the player should forfeit
-                if self.increment_idle_counter(user_id):
-                    await self.forfeit_player_due_to_idling(
-                        thread=thread,
-                        user_mention=user_mention,
-                        on_forfeit_callback=lambda: on_timeout_callback(user_id)
-                    )
-                else:
-                    await on_timeout_callback(user_id)
-            except asyncio.CancelledError:
-                pass  # Expected if user interacts in time
-            except Exception as e:
-                print(f"[TimeoutHandler] Error in timeout coroutine for user {user_id}: {e}")
+        async def on_timeout():
+            if thread:
+                await outbox(thread).send(f"⏰ {user_mention} took too long. Their turn is over.")
+            # Increment idle counter and check if the player should forfeit
+            if self.increment_idle_counter(user_id):
+                await self.forfeit_player_due_to_idling(
+                    thread=thread,
+                    user_mention=user_mention,
+                    on_forfeit_callback=lambda: on_timeout_callback(user_id)
+                )
+            else:
+                await on_timeout_callback(user_id)
 
-        task = asyncio.create_task(timeout_coroutine())
-        self.timeout_tasks[user_id] = task
+        turn_timers.schedule(self._key(user_id), timeout_seconds, on_timeout)
         print(f"[TimeoutHandler] Started timeout for user {user_id} ({timeout_seconds}s).")
 
     def cancel_timeout(self, user_id: int):
         """Cancels an active timeout if the player takes an action in time."""
-        if user_id in self.timeout_tasks:
-            self.timeout_tasks[user_id].cancel()
-            del self.timeout_tasks[user_id]
+        if turn_timers.cancel(self._key(user_id)):
             print(f"[TimeoutHandler] Canceled timeout for user {user_id}.")
 
     def reset_idle_counter(self, user_id: int):
@@ -90,7 +85,7 @@ class TimeoutHandler:
         """
         try:
             if thread:
-                await thread.send(f"🕒 {user_mention} has been idle for too many turns and forfeited the game.")
+                await outbox(thread).send(f"🕒 {user_mention} has been idle for too many turns and forfeited the game.")
             await on_forfeit_callback()
             print(f"[TimeoutHandler] User {user_mention} forfeited due to idling.")
         except Exception as e:
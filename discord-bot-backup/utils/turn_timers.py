@@ -0,0 +1,89 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+TimerCallback = Callable[[], Awaitable[None]]
+
+COMPACT_MIN = 1024  # Don't bother rebuilding small heaps
+
+
+class TurnTimers:
+    """
+    One deadline heap and one background task for every turn timer in the bot.
+
+    schedule() is O(log n). cancel() and re-arming only drop the key from the live
+    index; the stale heap entry is skipped when it surfaces, and the heap is rebuilt
+    once stale entries outnumber live ones. Callbacks run as their own tasks so a
+    slow Discord call never delays the next deadline.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._live: Dict[Hashable, Tuple[float, int, TimerCallback]] = {}  # key -> (deadline, seq, callback)
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._fired: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def schedule(self, key: Hashable, delay: float, callback: TimerCallback):
+        """Run callback after delay seconds, replacing any timer already set for key."""
+        self._ensure_running()
+        deadline = time.monotonic() + delay
+        sequence = next(self._sequence)
+        self._live[key] = (deadline, sequence, callback)
+        earliest = self._heap[0][0] if self._heap else None
+        heapq.heappush(self._heap, (deadline, sequence, key))
+        if earliest is None or deadline < earliest:
+            self._wakeup.set()
+        if len(self._heap) > COMPACT_MIN and len(self._heap) > 2 * len(self._live):
+            self._heap = [(d, s, k) for k, (d, s, _) in self._live.items()]
+            heapq.heapify(self._heap)
+
+    def cancel(self, key: Hashable) -> bool:
+        return self._live.pop(key, None) is not None
+
+    def is_scheduled(self, key: Hashable) -> bool:
+        return key in self._live
+
+    def _ensure_running(self):
+        # Started lazily from the first schedule() so it lands on discord.py's event loop
+        if self._runner is None or self._runner.done():
+            self._wakeup = asyncio.Event()
+            self._runner = asyncio.create_task(self._run_loop())
+
+    def _fire_due(self):
+        now = time.monotonic()
+        while self._heap and self._heap[0][0] <= now:
+            _, sequence, key = heapq.heappop(self._heap)
+            entry = self._live.get(key)
+            if entry is None or entry[1] != sequence:
+                continue  # Cancelled or re-armed since
+            del self._live[key]
+            task = asyncio.create_task(self._run(key, entry[2]))
+            self._fired.add(task)
+            task.add_done_callback(self._fired.discard)
+
+    async def _run(self, key: Hashable, callback: TimerCallback):
+        try:
+            await callback()
+        except Exception as e:
+            print(f"[TurnTimers] Error in timeout callback for {key}: {e}")
+
+    async def _run_loop(self):
+        while True:
+            self._fire_due()
+            self._wakeup.clear()
+            timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+
+# Shared by every TimeoutHandler
+turn_timers = TurnTimers()
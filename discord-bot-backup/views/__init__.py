@@ -2,5 +2,7 @@ from .draw_card_view import DrawCardView
 from .dice_roll_view import DiceRollView
 from .stack_options_view import StackOptionsView
 from .delete_thread_view import DeleteThreadView
+from .turn_actions import DrawCardButtons, DiceRollButtons, StackOptionsButtons
 
-__all__ = ["DrawCardView", "DiceRollView", "StackOptionsView", "DeleteThreadView"]
+__all__ = ["DrawCardView", "DiceRollView", "StackOptionsView", "DeleteThreadView",
+           "DrawCardButtons", "DiceRollButtons", "StackOptionsButtons"]
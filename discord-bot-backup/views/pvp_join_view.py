@@ -3,7 +3,8 @@ from discord import ButtonStyle, Interaction
 from discord.ext.commands import Bot
 from typing import List, Tuple
 
-PVP_REQUESTS_CHANNEL_ID = 1393416695753740289  # Auto-post location
+from utils.channel_registry import channels
+from utils.constants import CHANNEL_PVP_REQUESTS_ID as PVP_REQUESTS_CHANNEL_ID  # Auto-post location
 PVP_JOIN_TIMEOUT = 180  # seconds before timeout
 
 # Import your PvP game start logic
@@ -65,7 +66,7 @@ class PvpJoinView(discord.ui.View):
 
     async def send_initial_message(self):
         """Posts the initial PvP announcement to #pvp-requests."""
-        channel = self.bot.get_channel(PVP_REQUESTS_CHANNEL_ID)
+        channel = channels.get("pvp_requests")
         if not channel:
             print(f"❌ Could not find #pvp-requests channel with ID {PVP_REQUESTS_CHANNEL_ID}")
             return
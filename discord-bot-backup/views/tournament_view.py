@@ -1,7 +1,7 @@
 import discord
-from game_logic.tournament_manager import TournamentManager
+from utils.shared_state import shared_tournament
 
-tournament = TournamentManager()  # Shared instance
+tournament = shared_tournament()  # Shared instance
 
 class TournamentView(discord.ui.View):
     """
@@ -0,0 +1,166 @@
+"""
+Persistent turn buttons shared by every game mode.
+
+The Draw / Roll / Stack / Forfeit buttons carry fixed custom_ids and are
+registered with the bot once at startup (register_turn_views), so no View is
+built per turn and buttons keep working after a restart. A click is resolved
+to its game through the registry's thread index, checked against whose turn
+it is and which actions the game is waiting for, then handed to the mode's
+TurnHandler.
+"""
+
+import logging
+from typing import Awaitable, Callable, Dict, NamedTuple, Tuple
+
+import discord
+from discord.ui import View, Button
+
+from game_logic.rules import FAIR_DIE, is_bust
+from utils.checkpoints import encode_vars
+from utils.game_registry import ActiveGame, games
+
+logger = logging.getLogger(__name__)
+
+DRAW = "draw"
+ROLL = "roll"
+STACK = "stack"
+FORFEIT = "forfeit"
+
+TurnCallback = Callable[[ActiveGame, discord.Interaction], Awaitable[None]]
+
+
+class TurnHandler(NamedTuple):
+    """How one mode answers the turn buttons."""
+    current_player: Callable[[ActiveGame], int]  # User id whose turn it is
+    on_draw: TurnCallback
+    on_roll: TurnCallback
+    on_stack: TurnCallback
+    on_forfeit: TurnCallback
+
+
+_handlers: Dict[str, TurnHandler] = {}
+
+
+def register_turn_handler(mode: str, handler: TurnHandler):
+    _handlers[mode] = handler
+
+
+def solo_turn_handler(cog) -> TurnHandler:
+    """Handler for the single-player cogs, which share one set of turn methods keyed by user id."""
+    return TurnHandler(
+        current_player=lambda entry: entry.user_ids[0],
+        on_draw=lambda entry, interaction: cog.on_player_draw(entry.user_ids[0], interaction),
+        on_roll=lambda entry, interaction: cog.on_roll_dice(entry.user_ids[0], entry.data["pending_card"], roll_dice()),
+        on_stack=lambda entry, interaction: cog.on_player_stack(entry.user_ids[0], interaction),
+        on_forfeit=lambda entry, interaction: cog.on_player_forfeit(entry.user_ids[0], interaction),
+    )
+
+
+def roll_dice() -> Tuple[str, int]:
+    """A plain d6 roll as ("success" | "bust", roll)."""
+    roll = FAIR_DIE.roll()
+    return ("bust" if is_bust(roll) else "success"), roll
+
+
+def _turn_state(entry: ActiveGame):
+    """Plain snapshot of the game and its turn data, to tell whether a failed handler changed anything."""
+    game_state = encode_vars(vars(entry.game)) if entry.game is not None else {}
+    return game_state, encode_vars(entry.data, skip={"awaiting"})
+
+
+async def dispatch(interaction: discord.Interaction, action: str):
+    entry = games.for_thread(interaction.channel_id)
+    handler = _handlers.get(entry.mode) if entry is not None else None
+    if handler is None:
+        await interaction.response.send_message("⚠️ This game is no longer active.", ephemeral=True)
+        return
+
+    if interaction.user.id != handler.current_player(entry):
+        await interaction.response.send_message("❌ It's not your turn!", ephemeral=True)
+        return
+
+    if action not in entry.data.get("awaiting", ()):
+        await interaction.response.send_message("⚠️ You've already made your choice.", ephemeral=True)
+        return
+
+    awaiting = entry.data["awaiting"]
+    before = _turn_state(entry)
+    entry.data["awaiting"] = ()  # Claim the turn step before any await, so double clicks bounce
+    await interaction.response.defer()
+    try:
+        await getattr(handler, f"on_{action}")(entry, interaction)
+    except Exception:
+        logger.exception(f"❌ {action} failed in {entry.game_id}")
+        # Only a step that changed nothing can be retried; otherwise the idle timeout moves the turn on
+        retry = not entry.data.get("awaiting") and _turn_state(entry) == before
+        if retry:
+            entry.data["awaiting"] = awaiting
+        message = "please try again." if retry else "your turn will move on shortly."
+        try:
+            await interaction.followup.send(f"🚨 Something went wrong - {message}", ephemeral=True)
+        except discord.HTTPException:
+            pass
+
+
+class TurnView(View):
+    """Base for the persistent turn views; `actions` are the steps its buttons answer."""
+    actions: Tuple[str, ...] = ()
+    _template = None
+
+    def __init__(self):
+        super().__init__(timeout=None)
+
+    @classmethod
+    def prompt(cls, data: dict) -> "TurnView":
+        """
+        Mark the game as waiting for this view's actions and return the view to show.
+
+        The returned instance is shared and already stopped, so sending it never
+        registers a per-message view; clicks go to the persistent registration.
+        """
+        if cls._template is None:
+            cls._template = cls()
+            cls._template.stop()
+        data["awaiting"] = cls.actions
+        return cls._template
+
+
+class DrawCardButtons(TurnView):
+    actions = (DRAW,)
+
+    @discord.ui.button(label="🃏 Draw Card", style=discord.ButtonStyle.primary, custom_id="rr:turn:draw")
+    async def draw_card(self, interaction: discord.Interaction, button: Button):
+        await dispatch(interaction, DRAW)
+
+
+class DiceRollButtons(TurnView):
+    actions = (ROLL,)
+
+    @discord.ui.button(label="🎲 Roll Dice", style=discord.ButtonStyle.primary, custom_id="rr:turn:roll")
+    async def roll_dice(self, interaction: discord.Interaction, button: Button):
+        await dispatch(interaction, ROLL)
+
+
+class StackOptionsButtons(TurnView):
+    actions = (DRAW, STACK, FORFEIT)
+
+    @discord.ui.button(label="🃏 Draw Again", style=discord.ButtonStyle.primary, custom_id="rr:turn:draw_again")
+    async def draw_card(self, interaction: discord.Interaction, button: Button):
+        await dispatch(interaction, DRAW)
+
+    @discord.ui.button(label="💰 Stack Sats", style=discord.ButtonStyle.success, custom_id="rr:turn:stack")
+    async def stack_sats(self, interaction: discord.Interaction, button: Button):
+        await dispatch(interaction, STACK)
+
+    @discord.ui.button(label="🚪 Forfeit", style=discord.ButtonStyle.danger, custom_id="rr:turn:forfeit")
+    async def forfeit_game(self, interaction: discord.Interaction, button: Button):
+        await dispatch(interaction, FORFEIT)
+
+
+TURN_VIEWS = (DrawCardButtons, DiceRollButtons, StackOptionsButtons)
+
+
+def register_turn_views(bot):
+    """Register the turn buttons once; call from setup_hook, before connecting."""
+    for view_class in TURN_VIEWS:
+        bot.add_view(view_class())